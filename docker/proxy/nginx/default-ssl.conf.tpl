@@ -28,6 +28,16 @@ server {
         alias /vol/static;
     }
 
+    # Original post attachments are only served through the app's visibility check.
+    location ~ ^/static/media/social/posts/[^/]+$ {
+        return 404;
+    }
+
+    location /protected/media/ {
+        internal;
+        alias /vol/static/media/;
+    }
+
     location / {
         include              gunicorn_headers;
         proxy_redirect       off;
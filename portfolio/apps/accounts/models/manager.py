@@ -1,5 +1,7 @@
 from django.contrib.auth.models import BaseUserManager
 
+from accounts.utils import allocate_unique_value, save_with_unique_value
+
 
 class MyAccountManager(BaseUserManager):
 
@@ -15,17 +17,20 @@ class MyAccountManager(BaseUserManager):
         if not username:
             raise ValueError('User must have an username')
 
-        username = self.generate_unique_username(username)
-
         user = self.model(
             email=self.normalize_email(email),
-            username=username,
             first_name=first_name,
             last_name=last_name,
         )
 
         user.set_password(password)
-        user.save(using=self._db)
+        save_with_unique_value(
+            user,
+            'username',
+            username.lower(),
+            '_',
+            save=lambda: user.save(using=self._db),
+        )
         return user
 
     def create_superuser(self, first_name, last_name, email, username,
@@ -45,10 +50,9 @@ class MyAccountManager(BaseUserManager):
         return user
 
     def generate_unique_username(self, base_username):
-        base_username = base_username.lower()
-        username = base_username
-        counter = 1
-        while self.model.objects.filter(username=username).exists():
-            username = f"{base_username}_{counter}"
-            counter += 1
-        return username
+        return allocate_unique_value(
+            self.model.objects.all(),
+            'username',
+            base_username.lower(),
+            '_',
+        )
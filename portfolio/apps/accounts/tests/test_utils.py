@@ -1,7 +1,8 @@
+from django.db import IntegrityError
 from django.test import TestCase, RequestFactory
 from unittest.mock import patch, MagicMock
 from accounts.models import Account
-from accounts.utils import send_activation_email
+from accounts.utils import allocate_unique_value, send_activation_email
 
 
 class SendActivationEmailWithRequestTest(TestCase):
@@ -35,3 +36,64 @@ class SendActivationEmailWithRequestTest(TestCase):
         self.assertEqual(to, [self.user.email])
 
         mock_email.send.assert_called_once()
+
+
+class UniqueUsernameAllocationTest(TestCase):
+
+    def _create(self, username, email):
+        return Account.objects.create_user(
+            email=email,
+            username=username,
+            password="Pass123",
+            first_name="John",
+            last_name="Smith"
+        )
+
+    def test_picks_smallest_free_suffix_in_one_query(self):
+        for index, username in enumerate(("john", "john_1", "john_3", "johnny", "john_x")):
+            self._create(username, f"john{index}@example.com")
+
+        with self.assertNumQueries(1):
+            username = allocate_unique_value(Account.objects.all(), "username", "john", "_")
+
+        self.assertEqual(username, "john_2")
+
+    def test_long_base_is_cut_to_fit_the_column(self):
+        long_name = "j" * 60
+        first = self._create(long_name, "first@example.com")
+        second = self._create(long_name, "second@example.com")
+
+        self.assertEqual(first.username, "j" * 50)
+        self.assertEqual(second.username, "j" * 48 + "_1")
+
+    def test_empty_base_is_rejected(self):
+        with self.assertRaises(ValueError):
+            allocate_unique_value(Account.objects.all(), "username", "", "_")
+
+    def test_free_base_is_kept(self):
+        self._create("johnny", "johnny@example.com")
+
+        self.assertEqual(Account.objects.generate_unique_username("John"), "john")
+
+    def test_retries_when_a_concurrent_signup_takes_the_value(self):
+        self._create("john", "first@example.com")
+
+        with patch(
+            "accounts.utils.unique.allocate_unique_value",
+            side_effect=["john", "john_1"],
+        ) as allocate:
+            user = self._create("john", "second@example.com")
+
+        self.assertEqual(user.username, "john_1")
+        self.assertEqual(allocate.call_count, 2)
+
+    def test_other_unique_conflicts_are_not_retried(self):
+        self._create("john", "same@example.com")
+
+        with patch(
+            "accounts.utils.unique.allocate_unique_value",
+            wraps=allocate_unique_value,
+        ) as allocate, self.assertRaises(IntegrityError):
+            self._create("jane", "same@example.com")
+
+        self.assertEqual(allocate.call_count, 1)
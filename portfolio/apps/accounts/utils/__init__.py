@@ -1,3 +1,8 @@
 from accounts.utils.emails import send_activation_email
+from accounts.utils.unique import allocate_unique_value, save_with_unique_value
 
-__all__ = ['send_activation_email']
+__all__ = [
+    'allocate_unique_value',
+    'save_with_unique_value',
+    'send_activation_email',
+]
@@ -0,0 +1,63 @@
+from django.db import IntegrityError, transaction
+
+# Room kept for separator + suffix when base fills the column: up to 99999.
+SUFFIX_ROOM = 6
+
+
+def allocate_unique_value(queryset, field, base, separator):
+    """Return base, or base + separator + N with the smallest free N.
+
+    base is cut so every candidate fits the column's max_length. All taken
+    candidates are read with one startswith query and the free value is
+    picked in memory.
+    """
+    if not base:
+        raise ValueError(f'Cannot allocate a unique {field} from an empty base')
+
+    max_length = queryset.model._meta.get_field(field).max_length
+    if max_length is not None:
+        base = base[:max_length]
+        stem = base[:max_length - SUFFIX_ROOM]
+    else:
+        stem = base
+
+    taken = set(
+        queryset.filter(**{f'{field}__startswith': stem}).values_list(field, flat=True),
+    )
+    if base not in taken:
+        return base
+
+    def candidate(suffix):
+        tail = f'{separator}{suffix}'
+        head = base if max_length is None else base[:max_length - len(tail)]
+        return f'{head}{tail}'
+
+    suffix = 1
+    while candidate(suffix) in taken:
+        suffix += 1
+    return candidate(suffix)
+
+
+def save_with_unique_value(instance, field, base, separator, save, attempts=3):
+    """Assign a free value to field and call save(), retrying on unique conflicts.
+
+    A concurrent insert of the same value surfaces as an IntegrityError; the
+    value is then allocated again instead of being pre-checked in a loop.
+    """
+    manager = type(instance)._default_manager
+    for attempt in range(attempts):
+        value = allocate_unique_value(
+            manager.exclude(pk=instance.pk),
+            field,
+            base,
+            separator,
+        )
+        setattr(instance, field, value)
+        try:
+            with transaction.atomic():
+                save()
+            return value
+        except IntegrityError:
+            conflict = manager.exclude(pk=instance.pk).filter(**{field: value}).exists()
+            if attempt + 1 == attempts or not conflict:
+                raise
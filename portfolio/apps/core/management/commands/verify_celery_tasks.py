@@ -11,6 +11,12 @@ TASK_IMPORTS = {
     'social_posts.tasks.create_social_posts_trends': (
         'social_posts.tasks', 'create_social_posts_trends',
     ),
+    'social_posts.tasks.flush_post_counters': (
+        'social_posts.tasks', 'flush_post_counters',
+    ),
+    'social_posts.tasks.purge_deleted_posts': (
+        'social_posts.tasks', 'purge_deleted_posts',
+    ),
     'social_profiles.tasks.create_social_friend_suggestions': (
         'social_profiles.tasks', 'create_social_friend_suggestions',
     ),
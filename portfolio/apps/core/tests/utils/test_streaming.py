@@ -0,0 +1,71 @@
+import json
+import warnings
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+from core.utils import StreamedArray, StreamingJSONResponse
+
+
+class StreamingJSONResponseTest(SimpleTestCase):
+
+    def _decode(self, response):
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_streams_arrays_chunk_by_chunk(self):
+        chunks = iter([[1, 2], [], [3]])
+        response = StreamingJSONResponse({
+            "count": 3,
+            "items": StreamedArray(chunks),
+        })
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(self._decode(response), {"count": 3, "items": [1, 2, 3]})
+
+    def test_empty_stream_is_an_empty_array(self):
+        response = StreamingJSONResponse({"items": StreamedArray([])})
+
+        self.assertEqual(self._decode(response), {"items": []})
+
+    def test_chunks_are_consumed_lazily(self):
+        consumed = []
+
+        def chunks():
+            for chunk in ([1], [2]):
+                consumed.append(chunk)
+                yield chunk
+
+        response = StreamingJSONResponse({"items": StreamedArray(chunks())})
+
+        self.assertEqual(consumed, [])
+        self._decode(response)
+        self.assertEqual(consumed, [[1], [2]])
+
+    def test_async_iteration_pulls_one_chunk_at_a_time(self):
+        consumed = []
+
+        def chunks():
+            for chunk in ([1], [2], [3]):
+                consumed.append(chunk)
+                yield chunk
+
+        response = StreamingJSONResponse({"items": StreamedArray(chunks())})
+
+        async def collect():
+            seen = []
+            async for part in response:
+                seen.append((part, len(consumed)))
+            return seen
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            seen = async_to_sync(collect)()
+
+        self.assertEqual(
+            json.loads(b"".join(part for part, _ in seen)),
+            {"items": [1, 2, 3]},
+        )
+        consumed_at = {part: count for part, count in seen}
+        self.assertEqual(consumed_at[b"1"], 1)
+        self.assertEqual(consumed_at[b",2"], 2)
+        self.assertEqual(consumed_at[b",3"], 3)
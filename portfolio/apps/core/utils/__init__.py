@@ -1,9 +1,22 @@
+from core.utils.conditional import conditional_view, make_etag
 from core.utils.debug import object_to_dict, print_object
+from core.utils.pagination import KeysetPagination
+from core.utils.streaming import (
+    StreamedArray,
+    StreamingJSONResponse,
+    iter_serialized,
+)
 from core.utils.test_helpers import create_active_user, create_test_image
 
 __all__ = [
+    'KeysetPagination',
+    'StreamedArray',
+    'StreamingJSONResponse',
+    'conditional_view',
     'create_active_user',
     'create_test_image',
+    'iter_serialized',
+    'make_etag',
     'object_to_dict',
     'print_object',
 ]
@@ -0,0 +1,50 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Hash the given validator parts into a compact ETag value."""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def conditional_view(validators):
+    """Answer GET/HEAD with 304 Not Modified when the client's validators still match.
+
+    validators(request, *args, **kwargs) returns (etag, last_modified) and is
+    called before the view, so unchanged resources are never serialized.
+    Returning (None, None) opts the request out. Apply below @api_view so the
+    request is already authenticated.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            etag, last_modified = validators(request, *args, **kwargs)
+            if etag is None and last_modified is None:
+                return view(request, *args, **kwargs)
+
+            etag = quote_etag(etag) if etag is not None else None
+            timestamp = last_modified.timestamp() if last_modified is not None else None
+
+            response = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=timestamp,
+            )
+            if response is None:
+                response = view(request, *args, **kwargs)
+
+            if etag is not None and not response.has_header('ETag'):
+                response['ETag'] = etag
+            if timestamp is not None and not response.has_header('Last-Modified'):
+                response['Last-Modified'] = http_date(timestamp)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,111 @@
+import json
+from datetime import datetime
+from uuid import UUID
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor pagination keyed on the full ordering tuple, e.g. (created_at, id).
+
+    Pages are fetched with a row-value comparison instead of OFFSET and
+    no COUNT(*) is issued, so deep pages cost the same as the first one.
+    All ordering fields must sort in the same direction and the last one
+    must be unique.
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self._flip(field) for field in ordering)
+        queryset = queryset.order_by(*ordering)
+
+        if self.cursor is not None:
+            try:
+                queryset = queryset.filter(
+                    self._keyset_filter(ordering, self.cursor.position),
+                )
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(Cursor(
+            offset=0,
+            reverse=False,
+            position=self._get_position_from_instance(self.page[-1], self.ordering),
+        ))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(Cursor(
+            offset=0,
+            reverse=True,
+            position=self._get_position_from_instance(self.page[0], self.ordering),
+        ))
+
+    def _get_position_from_instance(self, instance, ordering):
+        return json.dumps([
+            self._serialize(getattr(instance, field.lstrip('-')))
+            for field in ordering
+        ])
+
+    def _keyset_filter(self, ordering, position):
+        values = json.loads(position)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise ValueError('Cursor does not match the ordering')
+
+        fields = [field.lstrip('-') for field in ordering]
+        lookup = 'lt' if ordering[0].startswith('-') else 'gt'
+        condition = Q()
+        for index, field in enumerate(fields):
+            condition |= Q(
+                **dict(zip(fields[:index], values[:index])),
+                **{f'{field}__{lookup}': values[index]},
+            )
+        return condition
+
+    @staticmethod
+    def _serialize(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
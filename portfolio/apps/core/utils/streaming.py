@@ -0,0 +1,69 @@
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+
+class StreamedArray:
+    """A StreamingJSONResponse value written as one JSON array, chunk by chunk.
+
+    chunks is an iterable of lists; only one list is held in memory at a time.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+
+def iter_serialized(queryset, serializer_class, chunk_size, get_context=None):
+    """Serialize queryset in chunks read through .iterator(chunk_size=...).
+
+    get_context(chunk) builds the serializer context of each chunk, so
+    per-page lookups such as liked post ids stay bounded too.
+    """
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        context = get_context(chunk) if get_context is not None else {}
+        yield serializer_class(chunk, many=True, context=context).data
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """Encode a dict incrementally; StreamedArray values never exist as a whole list.
+
+    Under ASGI every part is pulled through sync_to_async one at a time, so
+    the body is not collected into a list before it is sent.
+    """
+
+    def __init__(self, data, encoder=DjangoJSONEncoder, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(self._render(data, encoder), **kwargs)
+
+    async def __aiter__(self):
+        parts = iter(self.streaming_content)
+        done = object()
+        next_part = sync_to_async(next)
+        while (part := await next_part(parts, done)) is not done:
+            yield part
+
+    @staticmethod
+    def _render(data, encoder):
+        yield '{'
+        for index, (key, value) in enumerate(data.items()):
+            separator = ',' if index else ''
+            yield f'{separator}{json.dumps(key)}:'
+
+            if not isinstance(value, StreamedArray):
+                yield json.dumps(value, cls=encoder)
+                continue
+
+            yield '['
+            written = False
+            for chunk in value.chunks:
+                if not chunk:
+                    continue
+                items = ','.join(json.dumps(item, cls=encoder) for item in chunk)
+                yield f',{items}' if written else items
+                written = True
+            yield ']'
+        yield '}'
@@ -59,6 +59,21 @@ class NotificationsViewTest(TestCase):
         self.assertIn(str(self.unread2.id), returned_ids)
         self.assertNotIn(str(self.read.id), returned_ids)
 
+    def test_unchanged_notifications_are_not_modified(self):
+        self.client.login(username="notify@example.com", password="pass123")
+        url = reverse("social_notification:notifications")
+
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.unread1.is_read = True
+        self.unread1.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
 
 class ReadNotificationTest(TestCase):
     def setUp(self):
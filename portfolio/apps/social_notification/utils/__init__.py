@@ -1,4 +1,9 @@
+from social_notification.utils.etags import notifications_validators
 from social_notification.utils.factory import create_notification
 from social_notification.utils.websocket import send_notification
 
-__all__ = ['create_notification', 'send_notification']
+__all__ = [
+    'create_notification',
+    'notifications_validators',
+    'send_notification',
+]
@@ -0,0 +1,13 @@
+from django.db.models import Count, Max
+
+from core.utils import make_etag
+from social_notification.models import Notification
+
+
+def notifications_validators(request):
+    """ETag for the unread list: reading a notification or receiving one changes it."""
+    unread = Notification.objects.filter(
+        created_for__user=request.user,
+        is_read=False,
+    ).aggregate(latest=Max('created_at'), total=Count('id'))
+    return make_etag(request.user.pk, unread['latest'], unread['total']), None
@@ -2,11 +2,14 @@ from django.http import JsonResponse
 
 from rest_framework.decorators import api_view
 
+from core.utils import conditional_view
 from social_notification.serializers import NotificationSerializer
+from social_notification.utils import notifications_validators
 from social_profiles.models import Profile
 
 
 @api_view(['GET'])
+@conditional_view(notifications_validators)
 def notifications(request):
     request_user = Profile.objects.get(user=request.user)
 
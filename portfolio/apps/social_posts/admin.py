@@ -2,6 +2,52 @@ from django.contrib import admin
 
 from .models import Post, PostAttachment, Trend
 
-admin.site.register(Post)
+
+class ReportedListFilter(admin.SimpleListFilter):
+    """Show reported posts unless the moderator asks for every post."""
+    title = 'reports'
+    parameter_name = 'reported'
+
+    def lookups(self, request, model_admin):
+        return (('all', 'All posts'),)
+
+    def choices(self, changelist):
+        yield {
+            'selected': self.value() is None,
+            'query_string': changelist.get_query_string(
+                remove=[self.parameter_name],
+            ),
+            'display': 'Reported',
+        }
+        for lookup, title in self.lookup_choices:
+            yield {
+                'selected': self.value() == lookup,
+                'query_string': changelist.get_query_string(
+                    {self.parameter_name: lookup},
+                ),
+                'display': title,
+            }
+
+    def queryset(self, request, queryset):
+        if self.value() == 'all':
+            return queryset
+        # Keeps the default ordering on the post_reports_count_idx partial
+        # index instead of sorting the whole table by reports_count.
+        return queryset.filter(reports_count__gt=0)
+
+
+class PostAdminModel(admin.ModelAdmin):
+    list_display = ('id', 'created_by', 'reports_count', 'created_at')
+    list_filter = (ReportedListFilter,)
+    list_select_related = ('created_by',)
+    show_full_result_count = False
+
+    def get_ordering(self, request):
+        if request.GET.get(ReportedListFilter.parameter_name) == 'all':
+            return ('-created_at', '-id')
+        return ('-reports_count', '-created_at', '-id')
+
+
+admin.site.register(Post, PostAdminModel)
 admin.site.register(PostAttachment)
 admin.site.register(Trend)
@@ -5,3 +5,6 @@ class SocialPostsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'social_posts'
     verbose_name = '03.Social Network: Posts'
+
+    def ready(self):
+        from social_posts.signals import push_post_to_timelines  # noqa: F401
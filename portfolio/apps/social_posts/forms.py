@@ -2,6 +2,7 @@ from django.forms import ModelForm
 from django import forms
 
 from .models import Post, PostAttachment
+from .utils import strip_image_metadata
 
 
 class PostForm(ModelForm):
@@ -21,3 +22,9 @@ class AttachmentForm(ModelForm):
     class Meta:
         model = PostAttachment
         fields = ('image',)
+
+    def clean_image(self):
+        image = self.cleaned_data.get('image')
+        if image:
+            image = strip_image_metadata(image)
+        return image
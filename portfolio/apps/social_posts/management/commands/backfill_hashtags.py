@@ -0,0 +1,47 @@
+"""
+Django command to build the hashtag index for existing posts.
+"""
+from django.core.management.base import BaseCommand
+
+from social_posts.models import Post
+from social_posts.utils import index_hashtags, rebuild_hashtag_counts
+
+
+class Command(BaseCommand):
+    """Extract hashtags from post bodies in chunks and index them.
+
+    The hourly trend counters of the current window are rebuilt afterwards.
+    """
+
+    help = 'Backfill the Hashtag/PostHashtag index from existing posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of posts indexed per batch.',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        posts = Post.objects.only('id', 'body', 'created_at').order_by('created_at')
+        chunk = []
+        processed = 0
+
+        for post in posts.iterator(chunk_size=chunk_size):
+            chunk.append(post)
+            if len(chunk) >= chunk_size:
+                index_hashtags(chunk)
+                processed += len(chunk)
+                chunk = []
+
+        if chunk:
+            index_hashtags(chunk)
+            processed += len(chunk)
+
+        rebuild_hashtag_counts()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Hashtags indexed for {processed} post(s)'
+        ))
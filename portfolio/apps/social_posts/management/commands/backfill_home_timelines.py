@@ -0,0 +1,33 @@
+"""
+Django command to materialize home timelines for existing profiles.
+"""
+from django.core.management.base import BaseCommand
+
+from social_posts.utils import rebuild_home_timeline
+from social_profiles.models import Profile
+
+
+class Command(BaseCommand):
+    """Fill the timeline table from the posts of each profile and its friends."""
+
+    help = 'Backfill materialized home timelines for all social profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of profiles loaded per batch.',
+        )
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.only('id').order_by('id')
+        processed = 0
+
+        for profile in profiles.iterator(chunk_size=options['chunk_size']):
+            rebuild_home_timeline(profile)
+            processed += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Home timelines backfilled for {processed} profile(s)'
+        ))
@@ -0,0 +1,116 @@
+"""
+Django command to compare post visibility strategies at several friend counts.
+"""
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import Account
+from social_posts.models import Post
+from social_posts.utils import get_visible_posts
+from social_profiles.models import Profile
+
+PAGE_SIZE = 10
+
+
+class Command(BaseCommand):
+    """Time the first visible page with an IN list of friend ids and with EXISTS.
+
+    Fixtures are created inside a transaction that is rolled back at the end,
+    so the command leaves the database untouched.
+    """
+
+    help = 'Benchmark post visibility filtering (IN list vs EXISTS) by number of friends'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--friends',
+            type=int,
+            nargs='+',
+            default=[10, 1000, 10000],
+            help='Friend counts to measure.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Timed runs per strategy and friend count.',
+        )
+
+    def handle(self, *args, **options):
+        friend_counts = sorted(options['friends'])
+
+        with transaction.atomic():
+            viewer, friends = self._create_fixtures(friend_counts[-1])
+
+            self.stdout.write(f'{"friends":>8}  {"IN list ms":>11}  {"EXISTS ms":>10}')
+            for count in friend_counts:
+                self._befriend(viewer, friends[:count])
+                legacy = self._measure(lambda: self._legacy_page(viewer), options['repeat'])
+                exists = self._measure(lambda: self._exists_page(viewer), options['repeat'])
+                self.stdout.write(f'{count:>8}  {legacy:>11.2f}  {exists:>10.2f}')
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark finished, fixtures rolled back'))
+
+    def _create_fixtures(self, count):
+        tag = uuid.uuid4().hex[:8]
+        accounts = Account.objects.bulk_create([
+            Account(
+                email=f'bench-{tag}-{index}@example.com',
+                username=f'bench-{tag}-{index}',
+                first_name='Bench',
+                last_name=str(index),
+            )
+            for index in range(count + 1)
+        ])
+        profiles = Profile.objects.bulk_create([
+            Profile(
+                user=account,
+                username=account.username,
+                slug=account.username,
+            )
+            for account in accounts
+        ])
+        Post.objects.bulk_create([
+            Post(body=f'Bench post {index}', created_by=profile, is_private=True)
+            for index, profile in enumerate(profiles)
+        ])
+        return profiles[0], profiles[1:]
+
+    def _befriend(self, viewer, friends):
+        through = Profile.friends.through
+        through.objects.filter(
+            Q(from_profile=viewer) | Q(to_profile=viewer),
+        ).delete()
+        through.objects.bulk_create(
+            [through(from_profile=viewer, to_profile=friend) for friend in friends]
+            + [through(from_profile=friend, to_profile=viewer) for friend in friends],
+        )
+
+    def _legacy_page(self, viewer):
+        user_ids = [viewer.id]
+        for friend in viewer.friends.all():
+            user_ids.append(friend.id)
+        posts = Post.objects.filter(
+            Q(is_private=False) | Q(created_by_id__in=user_ids),
+        )
+        return list(posts.order_by('-created_at', '-id')[:PAGE_SIZE])
+
+    def _exists_page(self, viewer):
+        posts = get_visible_posts(viewer.user)
+        return list(posts.order_by('-created_at', '-id')[:PAGE_SIZE])
+
+    def _measure(self, run, repeat):
+        run()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
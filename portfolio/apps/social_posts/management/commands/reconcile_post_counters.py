@@ -0,0 +1,58 @@
+"""
+Django command to recompute post like/comment/report counters from their M2M tables.
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from social_posts.models import Post
+from social_posts.utils import flush_counter_buffer
+
+
+def count_through_rows(through):
+    rows = through.objects.filter(
+        post_id=OuterRef('pk'),
+    ).values('post_id').annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(rows, output_field=IntegerField()), 0)
+
+
+class Command(BaseCommand):
+    """Reset likes_count/comments_count/reports_count to the number of related rows."""
+
+    help = 'Reconcile denormalized post counters with the likes/comments/reports tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of posts updated per statement.',
+        )
+
+    def handle(self, *args, **options):
+        flush_counter_buffer()
+
+        chunk_size = options['chunk_size']
+        post_ids = Post.objects.order_by('pk').values_list('pk', flat=True)
+        chunk = []
+        updated = 0
+
+        for post_id in post_ids.iterator(chunk_size=chunk_size):
+            chunk.append(post_id)
+            if len(chunk) >= chunk_size:
+                updated += self._reconcile(chunk)
+                chunk = []
+
+        if chunk:
+            updated += self._reconcile(chunk)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Counters reconciled for {updated} post(s)'
+        ))
+
+    def _reconcile(self, post_ids):
+        return Post.objects.filter(pk__in=post_ids).update(
+            likes_count=count_through_rows(Post.likes.through),
+            comments_count=count_through_rows(Post.comments.through),
+            reports_count=count_through_rows(Post.reported_by_users.through),
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-17 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_posts', '0002_timelineentry'),
+        ('social_profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['created_by', 'created_at', 'id'], name='post_author_created_idx'),
+        ),
+    ]
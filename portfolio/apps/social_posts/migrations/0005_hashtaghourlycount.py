@@ -0,0 +1,27 @@
+# Generated by Django 6.0.6 on 2026-10-17 00:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_posts', '0004_hashtag'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HashtagHourlyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('count', models.IntegerField(default=0)),
+                ('hashtag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_counts', to='social_posts.hashtag')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['hour'], name='hashtag_count_hour_idx')],
+                'constraints': [models.UniqueConstraint(fields=('hashtag', 'hour'), name='unique_hashtag_hour')],
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+"""Full-text search index for posts.
+
+PostgreSQL gets a generated `search_vector` column with a GIN index; SQLite
+gets an FTS5 table that the SQLite search backend keeps in sync. The profile
+index lives in social_profiles.0003_search_index.
+"""
+
+from django.db import migrations
+
+POSTGRES_FORWARD = (
+    """
+    ALTER TABLE social_posts_post ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(body, ''))) STORED
+    """,
+    """
+    CREATE INDEX social_posts_post_search_idx
+    ON social_posts_post USING GIN (search_vector)
+    """,
+)
+
+POSTGRES_BACKWARD = (
+    'ALTER TABLE social_posts_post DROP COLUMN IF EXISTS search_vector',
+)
+
+SQLITE_FORWARD = (
+    'CREATE VIRTUAL TABLE social_posts_post_fts USING fts5(post_id UNINDEXED, document)',
+    """
+    INSERT INTO social_posts_post_fts (post_id, document)
+    SELECT id, coalesce(body, '') FROM social_posts_post
+    """,
+)
+
+SQLITE_BACKWARD = (
+    'DROP TABLE IF EXISTS social_posts_post_fts',
+)
+
+
+def _run(schema_editor, statements):
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_posts', '0005_hashtaghourlycount'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-17 00:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_posts', '0006_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postattachment',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.6 on 2026-10-17 00:29
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_reports_count(apps, schema_editor):
+    Post = apps.get_model('social_posts', 'Post')
+    reports = Post.reported_by_users.through.objects.filter(
+        post_id=OuterRef('pk'),
+    ).values('post_id').annotate(total=Count('pk')).values('total')
+    Post.objects.update(reports_count=Coalesce(
+        Subquery(reports, output_field=IntegerField()), 0,
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_posts', '0008_post_deleted_at'),
+        ('social_profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='reports_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('reports_count__gt', 0)), fields=['reports_count', 'created_at', 'id'], name='post_reports_count_idx'),
+        ),
+        migrations.RunPython(backfill_reports_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.6 on 2026-10-17 01:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_unfanned_posts(apps, schema_editor):
+    # Until now fan-out was skipped for authors over the limit and their
+    # posts were merged on read; keep merging exactly those posts.
+    Post = apps.get_model('social_posts', 'Post')
+    Post.objects.filter(
+        created_by__friends_count__gte=settings.SOCIAL_FEED_FANOUT_LIMIT,
+    ).update(fanned_out=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_posts', '0009_post_reports_count'),
+        ('social_profiles', '0002_friend_suggestion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='fanned_out',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('fanned_out', False)), fields=['created_by', 'created_at', 'id'], name='post_unfanned_author_idx'),
+        ),
+        migrations.RunPython(mark_unfanned_posts, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,19 @@
+from social_posts.models.counter import CounterFlush
 from social_posts.models.engagement import Comment, Like
+from social_posts.models.hashtag import Hashtag, PostHashtag
 from social_posts.models.post import Post, PostAttachment
-from social_posts.models.trend import Trend
+from social_posts.models.timeline import TimelineEntry
+from social_posts.models.trend import HashtagHourlyCount, Trend
 
 __all__ = [
     'Like',
     'Comment',
+    'CounterFlush',
+    'Hashtag',
+    'HashtagHourlyCount',
     'PostAttachment',
     'Post',
+    'PostHashtag',
+    'TimelineEntry',
     'Trend',
 ]
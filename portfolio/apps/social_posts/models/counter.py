@@ -0,0 +1,12 @@
+from django.db import models
+
+
+class CounterFlush(models.Model):
+    """A counter buffer flush already applied to Post, recorded in the same transaction.
+
+    flush_counter_buffer() checks the token before applying a batch again,
+    so a crash between commit and clearing the Redis batch cannot double-count.
+    """
+
+    token = models.CharField(max_length=32, unique=True)
+    applied_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,38 @@
+from django.db import models
+
+from social_posts.models.post import Post
+
+
+class Hashtag(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+
+    def __str__(self):
+        return f'#{self.name}'
+
+
+class PostHashtag(models.Model):
+    post = models.ForeignKey(
+        Post,
+        related_name='post_hashtags',
+        on_delete=models.CASCADE,
+    )
+    hashtag = models.ForeignKey(
+        Hashtag,
+        related_name='post_hashtags',
+        on_delete=models.CASCADE,
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('post', 'hashtag'),
+                name='unique_post_hashtag',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=('hashtag', 'created_at'),
+                name='post_hashtag_created_idx',
+            ),
+        ]
@@ -6,6 +6,7 @@ from django.utils.timesince import timesince
 
 from social_posts.models.engagement import Comment, Like
 from social_profiles.models import Profile
+from social_profiles.models.tracking import LoadedStateMixin
 
 
 class PostAttachment(models.Model):
@@ -15,6 +16,7 @@ class PostAttachment(models.Model):
         validators=[FileExtensionValidator(['png', 'jpg', 'jpeg'])],
         blank=True,
     )
+    variants = models.JSONField(default=dict, blank=True)
     created_by = models.ForeignKey(
         Profile,
         related_name='post_attachments',
@@ -22,7 +24,14 @@ class PostAttachment(models.Model):
     )
 
 
-class Post(models.Model):
+class PostManager(models.Manager):
+    """Hide soft-deleted posts; Post.all_objects still reaches them."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class Post(LoadedStateMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     body = models.TextField(blank=True, null=True)
 
@@ -37,6 +46,7 @@ class Post(models.Model):
     comments_count = models.IntegerField(default=0)
 
     reported_by_users = models.ManyToManyField(Profile, blank=True)
+    reports_count = models.IntegerField(default=0)
 
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(
@@ -44,9 +54,32 @@ class Post(models.Model):
         related_name='posts',
         on_delete=models.CASCADE,
     )
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    # False when the author was over SOCIAL_FEED_FANOUT_LIMIT at write time;
+    # such posts have no TimelineEntry rows for friends and are merged on read.
+    fanned_out = models.BooleanField(default=True)
+
+    objects = PostManager()
+    all_objects = models.Manager()
 
     class Meta:
         ordering = ('-created_at', )
+        indexes = [
+            models.Index(
+                fields=('created_by', 'created_at', 'id'),
+                name='post_author_created_idx',
+            ),
+            models.Index(
+                fields=('created_by', 'created_at', 'id'),
+                name='post_unfanned_author_idx',
+                condition=models.Q(fanned_out=False),
+            ),
+            models.Index(
+                fields=('reports_count', 'created_at', 'id'),
+                name='post_reports_count_idx',
+                condition=models.Q(reports_count__gt=0),
+            ),
+        ]
 
     def created_at_formatted(self):
         return timesince(self.created_at)
@@ -0,0 +1,33 @@
+from django.db import models
+
+from social_posts.models.post import Post
+from social_profiles.models import Profile
+
+
+class TimelineEntry(models.Model):
+    profile = models.ForeignKey(
+        Profile,
+        related_name='timeline_entries',
+        on_delete=models.CASCADE,
+    )
+    post = models.ForeignKey(
+        Post,
+        related_name='timeline_entries',
+        on_delete=models.CASCADE,
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ('-created_at', )
+        constraints = [
+            models.UniqueConstraint(
+                fields=('profile', 'post'),
+                name='unique_timeline_entry',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=('profile', '-created_at'),
+                name='timeline_profile_created_idx',
+            ),
+        ]
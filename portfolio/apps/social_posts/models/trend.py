@@ -1,6 +1,29 @@
 from django.db import models
 
+from social_posts.models.hashtag import Hashtag
+
 
 class Trend(models.Model):
     hashtag = models.CharField(max_length=255)
     occurences = models.IntegerField()
+
+
+class HashtagHourlyCount(models.Model):
+    hashtag = models.ForeignKey(
+        Hashtag,
+        related_name='hourly_counts',
+        on_delete=models.CASCADE,
+    )
+    hour = models.DateTimeField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('hashtag', 'hour'),
+                name='unique_hashtag_hour',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=('hour', ), name='hashtag_count_hour_idx'),
+        ]
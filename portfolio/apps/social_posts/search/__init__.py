@@ -0,0 +1,26 @@
+from django.db import connection
+
+from social_posts.search.base import (
+    ContainsSearchBackend,
+    SearchBackend,
+    get_search_terms,
+)
+
+
+def get_search_backend():
+    """Pick the full-text backend matching the default database."""
+    if connection.vendor == 'postgresql':
+        from social_posts.search.postgres import PostgresSearchBackend
+        return PostgresSearchBackend()
+    if connection.vendor == 'sqlite':
+        from social_posts.search.sqlite import SQLiteSearchBackend
+        return SQLiteSearchBackend()
+    return ContainsSearchBackend()
+
+
+__all__ = [
+    'ContainsSearchBackend',
+    'SearchBackend',
+    'get_search_backend',
+    'get_search_terms',
+]
@@ -0,0 +1,57 @@
+import re
+
+from django.db.models import FloatField, Q, Value
+
+SEARCH_TERM_RE = re.compile(r'\w+')
+
+
+def get_search_terms(query):
+    if not query:
+        return []
+    return SEARCH_TERM_RE.findall(query.lower())
+
+
+class SearchBackend:
+    """Matches posts and profiles and annotates them with `search_rank`.
+
+    Higher ranks are better. Backends that keep a separate index override
+    the `index_*`/`remove_*` hooks, which are called from model signals.
+    """
+
+    def search_posts(self, queryset, query):
+        raise NotImplementedError
+
+    def search_profiles(self, queryset, query):
+        raise NotImplementedError
+
+    def index_post(self, post):
+        pass
+
+    def remove_post(self, post):
+        pass
+
+    def index_profile(self, profile):
+        pass
+
+    def remove_profile(self, profile):
+        pass
+
+
+class ContainsSearchBackend(SearchBackend):
+    """Unindexed LIKE matching for databases without a full-text engine."""
+
+    def search_posts(self, queryset, query):
+        if not get_search_terms(query):
+            return queryset.none()
+        return queryset.filter(body__icontains=query).annotate(
+            search_rank=Value(0.0, output_field=FloatField()),
+        )
+
+    def search_profiles(self, queryset, query):
+        if not get_search_terms(query):
+            return queryset.none()
+        return queryset.filter(
+            Q(first_name__icontains=query) | Q(last_name__icontains=query),
+        ).annotate(
+            search_rank=Value(0.0, output_field=FloatField()),
+        )
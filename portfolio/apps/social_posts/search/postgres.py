@@ -0,0 +1,43 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+
+from social_posts.search.base import SearchBackend, get_search_terms
+
+SEARCH_CONFIG = 'simple'
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Full-text search on the generated, GIN-indexed `search_vector` columns."""
+
+    def search_posts(self, queryset, query):
+        return self._search(queryset, query)
+
+    def search_profiles(self, queryset, query):
+        return self._search(queryset, query)
+
+    def _search(self, queryset, query):
+        terms = get_search_terms(query)
+        if not terms:
+            return queryset.none()
+
+        table = queryset.model._meta.db_table
+        document = RawSQL(
+            f'"{table}"."search_vector"',
+            [],
+            output_field=SearchVectorField(),
+        )
+        search_query = SearchQuery(
+            ' & '.join(f'{term}:*' for term in terms),
+            config=SEARCH_CONFIG,
+            search_type='raw',
+        )
+
+        return queryset.alias(
+            search_document=document,
+        ).filter(
+            search_document=search_query,
+        ).annotate(
+            search_rank=Cast(SearchRank(document, search_query), FloatField()),
+        )
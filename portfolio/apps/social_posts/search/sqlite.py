@@ -0,0 +1,66 @@
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+
+from social_posts.search.base import SearchBackend, get_search_terms
+
+POST_INDEX = 'social_posts_post_fts'
+PROFILE_INDEX = 'social_profiles_profile_fts'
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Full-text search on FTS5 tables kept in sync from model signals."""
+
+    def search_posts(self, queryset, query):
+        return self._search(queryset, query, POST_INDEX, 'post_id')
+
+    def search_profiles(self, queryset, query):
+        return self._search(queryset, query, PROFILE_INDEX, 'profile_id')
+
+    def index_post(self, post):
+        self._replace(POST_INDEX, 'post_id', post.id.hex, post.body or '')
+
+    def remove_post(self, post):
+        self._delete(POST_INDEX, 'post_id', post.id.hex)
+
+    def index_profile(self, profile):
+        self._replace(
+            PROFILE_INDEX,
+            'profile_id',
+            profile.id,
+            f'{profile.first_name} {profile.last_name}',
+        )
+
+    def remove_profile(self, profile):
+        self._delete(PROFILE_INDEX, 'profile_id', profile.id)
+
+    def _search(self, queryset, query, index, key):
+        terms = get_search_terms(query)
+        if not terms:
+            return queryset.none()
+
+        match = ' '.join(f'"{term}"*' for term in terms)
+        table = queryset.model._meta.db_table
+
+        # Join the index once: the MATCH both filters the rows and scores
+        # them, so bm25() is read off the joined row instead of re-running
+        # the full-text query per result.
+        return queryset.extra(
+            tables=[index],
+            where=[f'{index}.{key} = "{table}"."id"', f'{index} MATCH %s'],
+            params=[match],
+        ).annotate(
+            search_rank=RawSQL(f'-bm25({index})', [], output_field=FloatField()),
+        )
+
+    def _replace(self, index, key, value, document):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {index} WHERE {key} = %s', [value])
+            cursor.execute(
+                f'INSERT INTO {index} ({key}, document) VALUES (%s, %s)',
+                [value, document],
+            )
+
+    def _delete(self, index, key, value):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {index} WHERE {key} = %s', [value])
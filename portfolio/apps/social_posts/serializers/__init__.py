@@ -1,10 +1,15 @@
 from social_posts.serializers.comment import CommentSerializer
-from social_posts.serializers.post import PostAttachmentSerializer, PostSerializer
+from social_posts.serializers.post import (
+    ModerationPostSerializer,
+    PostAttachmentSerializer,
+    PostSerializer,
+)
 from social_posts.serializers.post_detail import PostDetailSerializer
 from social_posts.serializers.trend import TrendSerializer
 
 __all__ = [
     'CommentSerializer',
+    'ModerationPostSerializer',
     'PostAttachmentSerializer',
     'PostDetailSerializer',
     'PostSerializer',
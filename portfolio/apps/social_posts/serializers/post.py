@@ -1,26 +1,52 @@
+from django.urls import reverse
 from rest_framework import serializers
 
 from social_posts.models import Post, PostAttachment
+from social_posts.utils import get_variant_url
 from social_profiles.serializers import ProfileSerializer
 
 
 class PostAttachmentSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
+    original_url = serializers.SerializerMethodField()
 
     class Meta:
         model = PostAttachment
-        fields = ('id', 'image_url',)
+        fields = ('id', 'image_url', 'srcset', 'original_url',)
 
     def get_image_url(self, obj):
+        request = self.context.get('request')
+        url = get_variant_url(obj)
+        if request is not None and url:
+            return request.build_absolute_uri(url)
+        return None
+
+    def get_srcset(self, obj):
+        request = self.context.get('request')
+        if request is None:
+            return {}
+        return {
+            extension: ', '.join(
+                f'{request.build_absolute_uri(obj.image.storage.url(name))} {width}w'
+                for width, name in sorted(sizes.items(), key=lambda item: int(item[0]))
+            )
+            for extension, sizes in obj.variants.items()
+        }
+
+    def get_original_url(self, obj):
         request = self.context.get('request')
         if request is not None and obj.image:
-            return request.build_absolute_uri(obj.image.url)
+            return request.build_absolute_uri(
+                reverse('social_posts:attachment_original', args=[obj.id]),
+            )
         return None
 
 
 class PostSerializer(serializers.ModelSerializer):
     created_by = ProfileSerializer(read_only=True)
     attachments = PostAttachmentSerializer(read_only=True, many=True)
+    liked_by_me = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -33,4 +59,13 @@ class PostSerializer(serializers.ModelSerializer):
             'created_by',
             'created_at_formatted',
             'attachments',
+            'liked_by_me',
         )
+
+    def get_liked_by_me(self, obj):
+        return obj.id in self.context.get('liked_post_ids', ())
+
+
+class ModerationPostSerializer(PostSerializer):
+    class Meta(PostSerializer.Meta):
+        fields = PostSerializer.Meta.fields + ('reports_count', 'created_at')
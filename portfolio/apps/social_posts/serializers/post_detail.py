@@ -8,7 +8,7 @@ from social_profiles.serializers import ProfileSerializer
 
 class PostDetailSerializer(serializers.ModelSerializer):
     created_by = ProfileSerializer(read_only=True)
-    comments = CommentSerializer(read_only=True, many=True)
+    comments = serializers.SerializerMethodField()
     attachments = PostAttachmentSerializer(read_only=True, many=True)
 
     class Meta:
@@ -23,3 +23,10 @@ class PostDetailSerializer(serializers.ModelSerializer):
             'comments',
             'attachments',
         )
+
+    def get_comments(self, obj):
+        return CommentSerializer(
+            self.context.get('comments', []),
+            context=self.context,
+            many=True,
+        ).data
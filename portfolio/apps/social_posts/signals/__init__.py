@@ -0,0 +1,33 @@
+from social_posts.signals.hashtags import (
+    index_post_hashtags,
+    release_post_hashtag_counts,
+)
+from social_posts.signals.images import schedule_attachment_variants
+from social_posts.signals.search import (
+    index_post_for_search,
+    index_profile_for_search,
+    remove_post_from_search,
+    remove_profile_from_search,
+)
+from social_posts.signals.timeline import (
+    push_post_to_timelines,
+    sync_timelines_on_friendship_change,
+)
+from social_posts.signals.versions import (
+    bump_author_version_on_post_change,
+    bump_author_version_on_profile_change,
+)
+
+__all__ = [
+    'bump_author_version_on_post_change',
+    'bump_author_version_on_profile_change',
+    'index_post_for_search',
+    'index_post_hashtags',
+    'index_profile_for_search',
+    'push_post_to_timelines',
+    'release_post_hashtag_counts',
+    'remove_post_from_search',
+    'remove_profile_from_search',
+    'schedule_attachment_variants',
+    'sync_timelines_on_friendship_change',
+]
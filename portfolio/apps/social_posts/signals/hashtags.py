@@ -0,0 +1,27 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from social_posts.models import Post
+from social_posts.utils import (
+    bump_hashtag_counts,
+    index_hashtags,
+    sync_post_hashtags,
+)
+
+
+@receiver(post_save, sender=Post)
+def index_post_hashtags(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        hashtag_ids = index_hashtags([instance])
+        if not instance.is_private:
+            bump_hashtag_counts(hashtag_ids.values(), instance.created_at, 1)
+    elif (update_fields is None or 'body' in update_fields) and instance.has_changed('body'):
+        sync_post_hashtags(instance)
+
+
+@receiver(pre_delete, sender=Post)
+def release_post_hashtag_counts(sender, instance, **kwargs):
+    if instance.is_private or instance.deleted_at is not None:
+        return
+    hashtag_ids = instance.post_hashtags.values_list('hashtag_id', flat=True)
+    bump_hashtag_counts(list(hashtag_ids), instance.created_at, -1)
@@ -0,0 +1,16 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from social_posts.models import PostAttachment
+from social_posts.tasks import generate_attachment_variants
+
+
+@receiver(post_save, sender=PostAttachment)
+def schedule_attachment_variants(sender, instance, created, **kwargs):
+    if not created or not instance.image:
+        return
+
+    transaction.on_commit(
+        lambda: generate_attachment_variants.delay(str(instance.pk)),
+    )
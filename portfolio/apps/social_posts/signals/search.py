@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from social_posts.models import Post
+from social_posts.search import get_search_backend
+from social_profiles.models import Profile
+
+
+@receiver(post_save, sender=Post)
+def index_post_for_search(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or 'body' in update_fields:
+        get_search_backend().index_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def remove_post_from_search(sender, instance, **kwargs):
+    get_search_backend().remove_post(instance)
+
+
+@receiver(post_save, sender=Profile)
+def index_profile_for_search(sender, instance, created, **kwargs):
+    if created or instance.has_changed('first_name', 'last_name'):
+        get_search_backend().index_profile(instance)
+
+
+@receiver(post_delete, sender=Profile)
+def remove_profile_from_search(sender, instance, **kwargs):
+    get_search_backend().remove_profile(instance)
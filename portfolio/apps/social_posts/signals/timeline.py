@@ -0,0 +1,25 @@
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from social_posts.models import Post
+from social_posts.utils import fan_out_post, link_timelines, unlink_timelines
+from social_profiles.models import Profile
+
+
+@receiver(post_save, sender=Post)
+def push_post_to_timelines(sender, instance, created, **kwargs):
+    if created:
+        fan_out_post(instance)
+
+
+@receiver(m2m_changed, sender=Profile.friends.through)
+def sync_timelines_on_friendship_change(sender, instance, action, pk_set, **kwargs):
+    if action == 'post_add' and pk_set:
+        link_timelines(instance.id, pk_set)
+    elif action == 'post_remove' and pk_set:
+        unlink_timelines(instance.id, pk_set)
+    elif action == 'pre_clear':
+        unlink_timelines(
+            instance.id,
+            list(instance.friends.values_list('id', flat=True)),
+        )
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from social_posts.models import Post, PostAttachment
+from social_posts.utils import bump_author_version
+from social_profiles.models import Profile
+
+# Counters are read from the rows of the page itself, not from the author version.
+PROFILE_UNTRACKED_FIELDS = {'friends_count', 'posts_count', 'updated', 'created'}
+PROFILE_TRACKED_FIELDS = [
+    field.name for field in Profile._meta.concrete_fields
+    if field.name not in PROFILE_UNTRACKED_FIELDS
+]
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=PostAttachment)
+def bump_author_version_on_post_change(sender, instance, **kwargs):
+    bump_author_version(instance.created_by_id)
+
+
+@receiver(post_save, sender=Profile)
+def bump_author_version_on_profile_change(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and set(update_fields) <= PROFILE_UNTRACKED_FIELDS:
+        return
+    if instance.has_changed(*PROFILE_TRACKED_FIELDS):
+        bump_author_version(instance.pk)
@@ -1,3 +1,11 @@
+from social_posts.tasks.counters import flush_post_counters
+from social_posts.tasks.deletion import purge_deleted_posts
+from social_posts.tasks.images import generate_attachment_variants
 from social_posts.tasks.trends import create_social_posts_trends
 
-__all__ = ['create_social_posts_trends']
+__all__ = [
+    'create_social_posts_trends',
+    'flush_post_counters',
+    'generate_attachment_variants',
+    'purge_deleted_posts',
+]
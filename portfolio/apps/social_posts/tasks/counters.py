@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from social_posts.utils import flush_counter_buffer
+
+
+@shared_task(name='social_posts.tasks.flush_post_counters')
+def flush_post_counters():
+    flush_counter_buffer()
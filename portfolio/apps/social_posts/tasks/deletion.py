@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from social_posts.utils import purge_soft_deleted_posts
+
+
+@shared_task(name='social_posts.tasks.purge_deleted_posts')
+def purge_deleted_posts(post_ids=None):
+    purge_soft_deleted_posts(post_ids)
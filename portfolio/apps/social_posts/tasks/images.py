@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from social_posts.models import PostAttachment
+from social_posts.utils import build_attachment_variants
+
+
+@shared_task(name='social_posts.tasks.generate_attachment_variants')
+def generate_attachment_variants(attachment_id):
+    attachment = PostAttachment.objects.filter(pk=attachment_id).first()
+    if attachment is not None:
+        build_attachment_variants(attachment)
@@ -0,0 +1,71 @@
+import io
+import os
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from core.utils import create_active_user
+from social_posts.models import PostAttachment
+from social_posts.tasks import generate_attachment_variants
+from social_profiles.models import Profile
+
+MEDIA_ROOT = os.path.join(tempfile.gettempdir(), "test_media_variants")
+
+
+def create_photo(name, size):
+    exif = Image.Exif()
+    exif[0x010F] = "TestCamera"
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color="blue").save(buffer, format="JPEG", exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, SOCIAL_IMAGE_VARIANT_WIDTHS=(320, 640, 1280))
+class GenerateAttachmentVariantsTest(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+
+    def tearDown(self):
+        if os.path.exists(MEDIA_ROOT):
+            for root, dirs, files in os.walk(MEDIA_ROOT, topdown=False):
+                for name in files:
+                    os.remove(os.path.join(root, name))
+                for name in dirs:
+                    os.rmdir(os.path.join(root, name))
+            os.rmdir(MEDIA_ROOT)
+
+    def test_variants_are_resized_without_exif(self):
+        attachment = PostAttachment.objects.create(
+            image=create_photo("photo.jpg", (800, 400)),
+            created_by=self.profile,
+        )
+
+        generate_attachment_variants(attachment.id)
+
+        attachment.refresh_from_db()
+        self.assertEqual(set(attachment.variants), {"webp", "jpeg"})
+        self.assertEqual(set(attachment.variants["jpeg"]), {"320", "640", "800"})
+
+        storage = attachment.image.storage
+        with storage.open(attachment.variants["jpeg"]["320"]) as variant:
+            image = Image.open(variant)
+            self.assertEqual(image.size, (320, 160))
+            self.assertEqual(len(image.getexif()), 0)
+        with storage.open(attachment.variants["webp"]["640"]) as variant:
+            self.assertEqual(Image.open(variant).format, "WEBP")
+
+    def test_attachment_without_image_is_skipped(self):
+        attachment = PostAttachment.objects.create(created_by=self.profile)
+
+        generate_attachment_variants(attachment.id)
+
+        attachment.refresh_from_db()
+        self.assertEqual(attachment.variants, {})
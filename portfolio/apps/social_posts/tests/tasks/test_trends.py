@@ -0,0 +1,191 @@
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.utils import create_active_user
+from social_posts.models import Hashtag, HashtagHourlyCount, Post, Trend
+from social_posts.tasks import create_social_posts_trends
+from social_posts.utils import (
+    get_cached_trends,
+    publish_trends,
+    purge_soft_deleted_posts,
+    rebuild_hashtag_counts,
+    soft_delete_post,
+)
+from social_profiles.models import Profile
+
+
+class CreateSocialPostsTrendsTest(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+
+    def _trends(self):
+        return dict(Trend.objects.values_list("hashtag", "occurences"))
+
+    def test_public_posts_bump_hourly_counters(self):
+        Post.objects.create(body="#django #python", created_by=self.profile)
+        Post.objects.create(body="#django", created_by=self.profile)
+        Post.objects.create(body="#django", created_by=self.profile, is_private=True)
+
+        counts = dict(HashtagHourlyCount.objects.values_list("hashtag__name", "count"))
+        self.assertEqual(counts, {"django": 2, "python": 1})
+
+    def test_deleted_post_releases_its_counts(self):
+        post = Post.objects.create(body="#django", created_by=self.profile)
+        post.delete()
+
+        self.assertEqual(HashtagHourlyCount.objects.get().count, 0)
+
+    def test_soft_deleted_post_releases_its_counts_once(self):
+        post = Post.objects.create(body="#django", created_by=self.profile)
+        soft_delete_post(post)
+        self.assertEqual(HashtagHourlyCount.objects.get().count, 0)
+
+        purge_soft_deleted_posts([post.id])
+
+        self.assertEqual(HashtagHourlyCount.objects.get().count, 0)
+        self.assertFalse(Post.all_objects.exists())
+
+    def test_task_replaces_trends_with_window_counts(self):
+        Trend.objects.create(hashtag="stale", occurences=1)
+        for _ in range(3):
+            Post.objects.create(body="#django", created_by=self.profile)
+        Post.objects.create(body="#python", created_by=self.profile)
+
+        create_social_posts_trends()
+
+        self.assertEqual(self._trends(), {"django": 3, "python": 1})
+
+    def test_counts_outside_window_are_ignored_and_pruned(self):
+        Post.objects.create(body="#fresh", created_by=self.profile)
+        old_post = Post.objects.create(body="#old", created_by=self.profile)
+        HashtagHourlyCount.objects.filter(hashtag__name="old").update(
+            hour=timezone.now() - timedelta(days=3),
+        )
+        Post.objects.filter(pk=old_post.pk).update(created_at=timezone.now() - timedelta(days=3))
+
+        create_social_posts_trends()
+
+        self.assertEqual(self._trends(), {"fresh": 1})
+        self.assertFalse(HashtagHourlyCount.objects.filter(hashtag__name="old").exists())
+
+    def test_falls_back_to_latest_posts_when_window_is_empty(self):
+        Post.objects.create(body="#quiet", created_by=self.profile)
+        HashtagHourlyCount.objects.all().delete()
+
+        create_social_posts_trends()
+
+        self.assertEqual(self._trends(), {"quiet": 1})
+
+    def test_rebuild_restores_counters_from_index(self):
+        Post.objects.create(body="#django", created_by=self.profile)
+        Post.objects.create(body="#django", created_by=self.profile)
+        HashtagHourlyCount.objects.all().delete()
+
+        rebuild_hashtag_counts()
+
+        self.assertEqual(HashtagHourlyCount.objects.get().count, 2)
+
+
+class CachedTrendsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        Trend.objects.create(hashtag="django", occurences=3)
+
+    def _names(self, trends):
+        return [trend["hashtag"] for trend in trends]
+
+    def test_cold_cache_is_filled_from_the_table(self):
+        generation, trends = get_cached_trends()
+
+        self.assertIsNotNone(generation)
+        self.assertEqual(self._names(trends), ["django"])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_cached_trends()[0], generation)
+
+    def test_task_swaps_in_a_new_generation(self):
+        generation, _ = get_cached_trends()
+        profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+        Post.objects.create(body="#python", created_by=profile)
+
+        create_social_posts_trends()
+
+        new_generation, trends = get_cached_trends()
+        self.assertNotEqual(new_generation, generation)
+        self.assertEqual(self._names(trends), ["python"])
+
+    @override_settings(SOCIAL_TRENDS_CACHE_TTL=0)
+    def test_stale_generation_is_served_while_another_reader_rebuilds(self):
+        generation, _ = get_cached_trends()
+        Trend.objects.all().delete()
+
+        with mock.patch("social_posts.utils.trends.cache.add", return_value=False):
+            stale_generation, trends = get_cached_trends()
+
+        self.assertEqual(stale_generation, generation)
+        self.assertEqual(self._names(trends), ["django"])
+
+        fresh_generation, trends = get_cached_trends()
+        self.assertNotEqual(fresh_generation, generation)
+        self.assertEqual(trends, [])
+
+    def test_cold_cache_reads_the_table_while_another_process_rebuilds(self):
+        with mock.patch("social_posts.utils.trends.cache.add", return_value=False), \
+                self.assertNumQueries(1):
+            generation, trends = get_cached_trends()
+
+        self.assertEqual(self._names(trends), ["django"])
+        self.assertEqual(generation, publish_trends(trends))
+
+    def test_cold_cache_readers_share_one_rebuild(self):
+        results = []
+        barrier = threading.Barrier(4)
+
+        def read():
+            barrier.wait()
+            results.append(get_cached_trends())
+
+        def load_slowly():
+            time.sleep(0.05)
+            return [{"id": 1, "hashtag": "x", "occurences": 1}]
+
+        with mock.patch("social_posts.utils.trends.load_trends", side_effect=load_slowly) as load:
+            threads = [threading.Thread(target=read) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len({generation for generation, _ in results}), 1)
+
+    def test_unchanged_rebuild_keeps_the_generation(self):
+        generation, _ = get_cached_trends()
+        HashtagHourlyCount.objects.create(
+            hashtag=Hashtag.objects.create(name="django"),
+            hour=timezone.now(),
+            count=3,
+        )
+
+        create_social_posts_trends()
+        create_social_posts_trends()
+
+        self.assertEqual(get_cached_trends()[0], generation)
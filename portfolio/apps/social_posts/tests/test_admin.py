@@ -0,0 +1,40 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import Account
+from core.utils import create_active_user
+from social_posts.models import Post
+from social_profiles.models import Profile
+
+
+class PostAdminTest(TestCase):
+    def setUp(self):
+        admin = Account.objects.create_superuser(
+            first_name="Ada",
+            last_name="Admin",
+            email="admin@example.com",
+            username="admin",
+            password="pass123",
+        )
+        self.client.force_login(admin)
+        profile = Profile.objects.create(user=create_active_user(
+            email="jane@example.com",
+            username="jane",
+            password="pass123",
+            first_name="Jane",
+            last_name="Smith"
+        ))
+        self.quiet = Post.objects.create(body="quiet", created_by=profile)
+        self.reported = Post.objects.create(body="reported", created_by=profile, reports_count=3)
+        self.url = reverse("admin:social_posts_post_changelist")
+
+    def _listed(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return list(response.context["cl"].result_list)
+
+    def test_changelist_defaults_to_reported_posts(self):
+        self.assertEqual(self._listed(), [self.reported])
+
+    def test_all_posts_are_still_reachable(self):
+        self.assertEqual(self._listed({"reported": "all"}), [self.reported, self.quiet])
@@ -0,0 +1,92 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.utils import create_active_user
+from social_posts.models import Post
+from social_posts.search import ContainsSearchBackend, get_search_backend, get_search_terms
+from social_profiles.models import Profile
+
+
+class SearchBackendTest(TestCase):
+    def setUp(self):
+        self.backend = get_search_backend()
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="jane@example.com",
+            username="jane",
+            password="pass123",
+            first_name="Jane",
+            last_name="Smith"
+        ))
+
+    def _post_bodies(self, query):
+        return [p.body for p in self.backend.search_posts(Post.objects.all(), query)]
+
+    def test_search_terms_are_lowercased_words(self):
+        self.assertEqual(get_search_terms("Hello, World!"), ["hello", "world"])
+        self.assertEqual(get_search_terms(None), [])
+
+    def test_matches_word_prefixes(self):
+        Post.objects.create(body="Learning Django today", created_by=self.profile)
+
+        self.assertEqual(self._post_bodies("djan"), ["Learning Django today"])
+
+    def test_all_terms_must_match(self):
+        Post.objects.create(body="Django and Python", created_by=self.profile)
+        Post.objects.create(body="Only Django", created_by=self.profile)
+
+        self.assertEqual(self._post_bodies("django python"), ["Django and Python"])
+
+    def test_punctuation_only_query_matches_nothing(self):
+        Post.objects.create(body="Anything", created_by=self.profile)
+
+        self.assertEqual(self._post_bodies('"*()'), [])
+
+    def test_more_relevant_posts_rank_higher(self):
+        Post.objects.create(body="django " + "filler " * 30, created_by=self.profile)
+        Post.objects.create(body="django django django", created_by=self.profile)
+
+        ranked = self.backend.search_posts(Post.objects.all(), "django").order_by("-search_rank")
+
+        self.assertEqual(ranked.first().body, "django django django")
+
+    @skipUnless(connection.vendor == "sqlite", "FTS5 index is SQLite only")
+    def test_full_text_query_runs_once_per_search(self):
+        Post.objects.create(body="django django", created_by=self.profile)
+        Post.objects.create(body="django", created_by=self.profile)
+
+        ranked = self.backend.search_posts(Post.objects.all(), "django").order_by("-search_rank")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual([p.body for p in ranked], ["django django", "django"])
+
+        self.assertEqual(queries[0]["sql"].count("MATCH"), 1)
+
+    def test_edited_and_deleted_posts_update_the_index(self):
+        post = Post.objects.create(body="Old words", created_by=self.profile)
+        post.body = "New words"
+        post.save()
+
+        self.assertEqual(self._post_bodies("old"), [])
+        self.assertEqual(self._post_bodies("new"), ["New words"])
+
+        post.delete()
+        self.assertEqual(self._post_bodies("new"), [])
+
+    def test_profiles_match_first_and_last_name(self):
+        found = self.backend.search_profiles(Profile.objects.all(), "jane smi")
+        self.assertEqual(list(found), [self.profile])
+
+        self.profile.last_name = "Doe"
+        self.profile.save()
+
+        found = self.backend.search_profiles(Profile.objects.all(), "smith")
+        self.assertEqual(list(found), [])
+
+    def test_contains_backend_keeps_substring_matching(self):
+        Post.objects.create(body="Learning Django today", created_by=self.profile)
+        backend = ContainsSearchBackend()
+
+        bodies = [p.body for p in backend.search_posts(Post.objects.all(), "ngo tod")]
+        self.assertEqual(bodies, ["Learning Django today"])
@@ -6,6 +6,7 @@ from rest_framework.test import APIRequestFactory
 from social_profiles.models import Profile
 from social_posts.models import PostAttachment
 from social_posts.serializers import PostAttachmentSerializer
+from social_posts.utils import build_attachment_variants
 from core.utils import create_test_image, create_active_user
 
 
@@ -45,9 +46,9 @@ class PostAttachmentSerializerTest(TestCase):
         serializer = PostAttachmentSerializer(instance=attachment, context={"request": request})
         data = serializer.data
 
-        self.assertEqual(set(data.keys()), {"id", "image_url"})
+        self.assertEqual(set(data.keys()), {"id", "image_url", "srcset", "original_url"})
         self.assertIsNotNone(data["image_url"])
-        self.assertIn("social/posts/test-image", data["image_url"])
+        self.assertEqual(data["image_url"], data["original_url"])
 
     def test_image_url_is_none_if_no_image(self):
         attachment = PostAttachment.objects.create(
@@ -58,5 +59,22 @@ class PostAttachmentSerializerTest(TestCase):
         serializer = PostAttachmentSerializer(instance=attachment, context={"request": request})
         data = serializer.data
 
-        self.assertEqual(set(data.keys()), {"id", "image_url"})
+        self.assertEqual(set(data.keys()), {"id", "image_url", "srcset", "original_url"})
         self.assertIsNone(data["image_url"])
+        self.assertIsNone(data["original_url"])
+
+    def test_variants_are_served_instead_of_original(self):
+        attachment = PostAttachment.objects.create(
+            image=self.image,
+            created_by=self.profile
+        )
+        build_attachment_variants(attachment)
+
+        request = APIRequestFactory().get("/dummy-url")
+        data = PostAttachmentSerializer(instance=attachment, context={"request": request}).data
+
+        self.assertIn("social/posts/variants/", data["image_url"])
+        self.assertTrue(data["image_url"].endswith(".jpeg"))
+        self.assertEqual(set(data["srcset"]), {"webp", "jpeg"})
+        self.assertTrue(data["srcset"]["webp"].endswith(".webp 100w"))
+        self.assertIn(f"attachments/{attachment.id}/original/", data["original_url"])
@@ -0,0 +1,115 @@
+from io import StringIO
+from unittest import mock
+
+import redis
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.utils import create_active_user
+from social_posts.models import Comment, Like, Post
+from social_posts.utils import flush_counter_buffer, increment_post_counter
+from social_posts.utils.counters import BUFFER_KEY, FLUSHING_KEY, TOKEN_MEMBER
+from social_profiles.models import Profile
+
+
+class PostCounterTest(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+        self.post = Post.objects.create(body="Hello", created_by=self.profile)
+
+    def _buffer_client(self, rate=1):
+        client = mock.MagicMock()
+        client.pipeline.return_value.execute.return_value = [rate, True]
+        return client
+
+    @override_settings(SOCIAL_COUNTER_BUFFER_URL=None)
+    def test_increment_updates_row_in_place(self):
+        increment_post_counter(self.post.id, "likes_count")
+        increment_post_counter(self.post.id, "likes_count")
+        increment_post_counter(self.post.id, "comments_count", delta=3)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 2)
+        self.assertEqual(self.post.comments_count, 3)
+
+    def test_unknown_counter_is_rejected(self):
+        with self.assertRaises(ValueError):
+            increment_post_counter(self.post.id, "body")
+
+    @override_settings(SOCIAL_COUNTER_HOT_THRESHOLD=20)
+    def test_cold_post_is_not_buffered(self):
+        client = self._buffer_client(rate=1)
+        with mock.patch("social_posts.utils.counters.get_buffer_client", return_value=client):
+            increment_post_counter(self.post.id, "likes_count")
+
+        client.hincrby.assert_not_called()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+
+    @override_settings(SOCIAL_COUNTER_HOT_THRESHOLD=20)
+    def test_hot_post_is_buffered(self):
+        client = self._buffer_client(rate=21)
+        with mock.patch("social_posts.utils.counters.get_buffer_client", return_value=client):
+            increment_post_counter(self.post.id, "likes_count")
+
+        client.hincrby.assert_called_once_with(BUFFER_KEY, f"{self.post.id}:likes_count", 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 0)
+
+    def test_flush_applies_buffered_deltas(self):
+        client = self._buffer_client()
+        client.exists.return_value = False
+        client.hgetall.return_value = {
+            f"{self.post.id}:likes_count".encode(): b"5",
+            f"{self.post.id}:comments_count".encode(): b"2",
+            TOKEN_MEMBER.encode(): b"batch-1",
+        }
+        with mock.patch("social_posts.utils.counters.get_buffer_client", return_value=client):
+            self.assertEqual(flush_counter_buffer(), 1)
+
+        client.rename.assert_called_once_with(BUFFER_KEY, FLUSHING_KEY)
+        client.delete.assert_called_once_with(FLUSHING_KEY)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 5)
+        self.assertEqual(self.post.comments_count, 2)
+
+    def test_batch_left_after_commit_is_not_applied_twice(self):
+        client = self._buffer_client()
+        client.exists.return_value = True
+        client.hgetall.return_value = {
+            f"{self.post.id}:likes_count".encode(): b"5",
+            TOKEN_MEMBER.encode(): b"batch-1",
+        }
+        client.delete.side_effect = [redis.ConnectionError, None]
+
+        with mock.patch("social_posts.utils.counters.get_buffer_client", return_value=client):
+            with self.assertRaises(redis.ConnectionError):
+                flush_counter_buffer()
+            self.assertEqual(flush_counter_buffer(), 0)
+
+        client.rename.assert_not_called()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 5)
+
+    @override_settings(SOCIAL_COUNTER_BUFFER_URL=None)
+    def test_reconcile_command_recounts_relations(self):
+        self.post.likes.add(Like.objects.create(created_by=self.profile))
+        self.post.comments.add(Comment.objects.create(body="Hi", created_by=self.profile))
+        other = Post.objects.create(body="Quiet", created_by=self.profile)
+        Post.objects.filter(pk=self.post.pk).update(likes_count=7, comments_count=0)
+        self.post.reported_by_users.add(self.profile)
+        Post.objects.filter(pk=other.pk).update(likes_count=3, reports_count=2)
+
+        call_command("reconcile_post_counters", chunk_size=1, stdout=StringIO())
+
+        self.post.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.post.likes_count, self.post.comments_count), (1, 1))
+        self.assertEqual((other.likes_count, other.comments_count), (0, 0))
+        self.assertEqual((self.post.reports_count, other.reports_count), (1, 0))
@@ -0,0 +1,87 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.utils import create_active_user
+from social_posts.models import Hashtag, Post, PostHashtag
+from social_posts.utils import extract_hashtags, get_trending_posts
+from social_profiles.models import Profile
+
+
+class ExtractHashtagsTest(TestCase):
+    def test_extracts_lowercased_unique_names(self):
+        self.assertEqual(
+            extract_hashtags("Go #Django, #python! and #django again"),
+            {"django", "python"},
+        )
+
+    def test_empty_body_has_no_hashtags(self):
+        self.assertEqual(extract_hashtags(None), set())
+        self.assertEqual(extract_hashtags("no tags here"), set())
+
+    def test_names_longer_than_the_column_are_skipped(self):
+        self.assertEqual(
+            extract_hashtags(f"#{'a' * 256} #{'b' * 255}"),
+            {"b" * 255},
+        )
+
+
+class HashtagIndexTest(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+
+    def test_created_post_is_indexed(self):
+        post = Post.objects.create(body="Hello #Test and #other", created_by=self.profile)
+
+        names = set(post.post_hashtags.values_list("hashtag__name", flat=True))
+        self.assertEqual(names, {"test", "other"})
+        self.assertEqual(Hashtag.objects.count(), 2)
+
+    def test_edited_post_is_reindexed(self):
+        post = Post.objects.create(body="Hello #old", created_by=self.profile)
+
+        post.body = "Hello #new"
+        post.save()
+
+        names = set(post.post_hashtags.values_list("hashtag__name", flat=True))
+        self.assertEqual(names, {"new"})
+
+    def test_save_without_body_change_skips_reindexing(self):
+        Post.objects.create(body="Hello #same", created_by=self.profile)
+        post = Post.objects.get()
+
+        post.is_private = True
+        with CaptureQueriesContext(connection) as queries:
+            post.save()
+
+        self.assertFalse([q for q in queries if "hashtag" in q["sql"]])
+
+    def test_long_hashtag_does_not_break_post_creation(self):
+        post = Post.objects.create(body=f"#{'x' * 300} #fine", created_by=self.profile)
+
+        names = set(post.post_hashtags.values_list("hashtag__name", flat=True))
+        self.assertEqual(names, {"fine"})
+
+    def test_trending_posts_use_index(self):
+        public_post = Post.objects.create(body="Hello #test", created_by=self.profile, is_private=False)
+        Post.objects.create(body="Secret #test", created_by=self.profile, is_private=True)
+        Post.objects.create(body="Hello #testing", created_by=self.profile, is_private=False)
+
+        self.assertEqual(list(get_trending_posts("TEST")), [public_post])
+
+    def test_backfill_command_indexes_existing_posts(self):
+        post = Post.objects.create(body="Backfill #me", created_by=self.profile)
+        PostHashtag.objects.all().delete()
+
+        call_command("backfill_hashtags", chunk_size=1, stdout=StringIO())
+
+        self.assertEqual(list(get_trending_posts("me")), [post])
@@ -0,0 +1,45 @@
+import io
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from PIL import Image
+
+from core.utils import create_test_image
+from social_posts.forms import AttachmentForm
+from social_posts.utils import strip_image_metadata
+
+GPS_IFD = 0x8825
+ORIENTATION = 0x0112
+
+
+def _jpeg_with_exif(name="photo.jpg"):
+    image = Image.new("RGB", (40, 20), color="blue")
+    exif = Image.Exif()
+    exif[ORIENTATION] = 6
+    exif.get_ifd(GPS_IFD)[2] = (48.0, 51.0, 24.0)
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+class StripImageMetadataTest(SimpleTestCase):
+    def test_exif_is_dropped_and_orientation_applied(self):
+        stripped = strip_image_metadata(_jpeg_with_exif())
+
+        image = Image.open(stripped)
+        self.assertEqual(stripped.name, "photo.jpg")
+        self.assertEqual(image.format, "JPEG")
+        self.assertEqual(dict(image.getexif()), {})
+        self.assertEqual(image.size, (20, 40))
+
+    def test_upload_without_exif_is_kept_as_is(self):
+        upload = create_test_image("plain.png")
+
+        self.assertIs(strip_image_metadata(upload), upload)
+
+    def test_attachment_form_strips_uploads(self):
+        form = AttachmentForm(data=None, files={"image": _jpeg_with_exif()})
+
+        self.assertTrue(form.is_valid())
+        image = Image.open(form.cleaned_data["image"])
+        self.assertEqual(dict(image.getexif()), {})
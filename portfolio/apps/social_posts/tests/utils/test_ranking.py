@@ -0,0 +1,151 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_posts.models import Like, Post
+from social_posts.utils import get_ranked_post_ids, rank_posts, score_expression
+from social_profiles.models import Profile
+
+
+class ScoreExpressionTest(TestCase):
+    def setUp(self):
+        self.viewer, self.stranger, self.friend, self.favourite = (
+            Profile.objects.create(user=create_active_user(
+                email=f"{name}@example.com",
+                username=name,
+                password="pass123",
+                first_name=name.title(),
+                last_name="User"
+            ))
+            for name in ("viewer", "stranger", "friend", "favourite")
+        )
+        self.viewer.friends.add(self.friend, self.favourite)
+
+    def _post(self, author=None, hours_ago=1, likes=0, comments=0):
+        post = Post.objects.create(body="post", created_by=author or self.stranger, is_private=False)
+        Post.objects.filter(pk=post.pk).update(
+            created_at=timezone.now() - timedelta(hours=hours_ago),
+            likes_count=likes,
+            comments_count=comments,
+        )
+        return post.id
+
+    def test_engagement_outranks_a_quiet_post_of_the_same_age(self):
+        quiet = self._post()
+        liked = self._post(likes=5)
+        discussed = self._post(likes=5, comments=3)
+
+        self.assertEqual(rank_posts(AnonymousUser()), [discussed, liked, quiet])
+
+    def test_older_posts_decay(self):
+        stale = self._post(hours_ago=48, likes=3)
+        fresh = self._post(hours_ago=1, likes=3)
+
+        self.assertEqual(rank_posts(AnonymousUser()), [fresh, stale])
+
+    def test_network_and_affinity_boost_authors(self):
+        stranger = self._post(self.stranger)
+        friend = self._post(self.friend)
+        favourite = self._post(self.favourite)
+        liked = Post.objects.get(pk=favourite)
+        for _ in range(10):
+            liked.likes.add(Like.objects.create(created_by=self.viewer))
+        Post.objects.filter(pk=favourite).update(likes_count=0)
+
+        self.assertEqual(rank_posts(self.viewer.user), [favourite, friend, stranger])
+
+    def test_score_matches_the_formula(self):
+        post_id = self._post(hours_ago=10, likes=4, comments=1)
+        now = timezone.now()
+        post = Post.objects.get(pk=post_id)
+
+        score = Post.objects.annotate(
+            score=score_expression(AnonymousUser(), {}, now),
+        ).get(pk=post_id).score
+
+        age_hours = (now - post.created_at).total_seconds() / 3600
+        self.assertAlmostEqual(score, (1 + 4 + 2) / (age_hours + 2) ** 1.5, places=6)
+
+    def test_ranking_is_two_queries_whatever_the_candidate_count(self):
+        for i in range(50):
+            self._post(hours_ago=i % 24, likes=i)
+
+        with self.assertNumQueries(2):
+            ranked = rank_posts(self.viewer.user)
+
+        self.assertEqual(len(ranked), 50)
+
+
+class RankedFeedTest(TestCase):
+    def _profile(self, name):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        ))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.viewer = self._profile("viewer")
+        self.friend = self._profile("friend")
+        self.stranger = self._profile("stranger")
+        self.viewer.friends.add(self.friend)
+
+        self.quiet = Post.objects.create(body="quiet", created_by=self.friend, is_private=False)
+        self.popular = Post.objects.create(body="popular", created_by=self.stranger, is_private=False)
+        Post.objects.filter(pk=self.popular.pk).update(likes_count=50, comments_count=10)
+        self.hidden = Post.objects.create(body="hidden", created_by=self.stranger, is_private=True)
+        self.old = Post.objects.create(body="old", created_by=self.friend, is_private=False)
+        Post.objects.filter(pk=self.old.pk).update(created_at=timezone.now() - timedelta(days=7))
+
+    def test_candidates_are_visible_posts_of_the_window(self):
+        ranked = rank_posts(self.viewer.user)
+
+        self.assertEqual(ranked, [self.popular.id, self.quiet.id])
+
+    @override_settings(SOCIAL_RANKING_MAX_CANDIDATES=1)
+    def test_only_the_best_candidates_are_kept(self):
+        self.assertEqual(rank_posts(self.viewer.user), [self.popular.id])
+
+    def test_ranking_is_cached_per_viewer(self):
+        first = get_ranked_post_ids(self.viewer.user)
+        self.quiet.likes.add(Like.objects.create(created_by=self.viewer))
+        Post.objects.filter(pk=self.quiet.pk).update(likes_count=500)
+
+        self.assertEqual(get_ranked_post_ids(self.viewer.user), first)
+        cache.clear()
+        self.assertEqual(get_ranked_post_ids(self.viewer.user)[0], self.quiet.id)
+
+    def test_post_list_pages_through_ranking(self):
+        self.client.force_authenticate(self.viewer.user)
+
+        response = self.client.get(reverse("social_posts:post_list"), {"ranking": "top", "page_size": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p["body"] for p in response.data["results"]["posts"]], ["popular"])
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([p["body"] for p in response.data["results"]["posts"]], ["quiet"])
+        self.assertIsNone(response.data["next"])
+        self.assertIsNotNone(response.data["previous"])
+
+    def test_cached_ranking_skips_posts_that_are_no_longer_visible(self):
+        Post.objects.filter(pk=self.quiet.pk).update(is_private=True)
+        self.client.force_authenticate(self.viewer.user)
+        url = reverse("social_posts:post_list")
+        self.assertEqual(len(self.client.get(url, {"ranking": "top"}).data["results"]["posts"]), 2)
+
+        Post.objects.filter(pk=self.popular.pk).update(is_private=True)
+        self.viewer.friends.remove(self.friend)
+
+        response = self.client.get(url, {"ranking": "top"})
+        self.assertEqual(response.data["results"]["posts"], [])
@@ -0,0 +1,104 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.utils import create_active_user
+from social_posts.models import Post, TimelineEntry
+from social_posts.utils import get_home_timeline_posts, get_user_feed_posts
+from social_profiles.models import Profile
+
+
+def create_profile(name):
+    user = create_active_user(
+        email=f"{name}@example.com",
+        username=name,
+        password="pass123",
+        first_name=name.capitalize(),
+        last_name="User"
+    )
+    return Profile.objects.create(user=user)
+
+
+class HomeTimelineTest(TestCase):
+    def setUp(self):
+        self.profile = create_profile("owner")
+        self.friend = create_profile("friend")
+        self.stranger = create_profile("stranger")
+        self.profile.friends.add(self.friend)
+
+    def test_new_post_is_pushed_to_author_and_friends(self):
+        post = Post.objects.create(body="Hello", created_by=self.friend)
+
+        self.assertTrue(TimelineEntry.objects.filter(profile=self.profile, post=post).exists())
+        self.assertTrue(TimelineEntry.objects.filter(profile=self.friend, post=post).exists())
+        self.assertFalse(TimelineEntry.objects.filter(profile=self.stranger, post=post).exists())
+
+    def test_deleted_post_is_retracted(self):
+        post = Post.objects.create(body="Hello", created_by=self.friend)
+        post.delete()
+
+        self.assertFalse(TimelineEntry.objects.exists())
+
+    def test_new_friendship_materializes_existing_posts(self):
+        post = Post.objects.create(body="Before", created_by=self.stranger)
+
+        self.profile.friends.add(self.stranger)
+
+        self.assertIn(post, get_home_timeline_posts(self.profile))
+
+    def test_removed_friendship_retracts_posts(self):
+        own_post = Post.objects.create(body="Own", created_by=self.profile)
+        friend_post = Post.objects.create(body="Friend", created_by=self.friend)
+
+        self.profile.friends.remove(self.friend)
+
+        self.assertNotIn(friend_post, get_home_timeline_posts(self.profile))
+        self.assertNotIn(own_post, get_home_timeline_posts(self.friend))
+        self.assertIn(own_post, get_home_timeline_posts(self.profile))
+
+    def test_cold_timeline_returns_none(self):
+        self.assertIsNone(get_home_timeline_posts(self.stranger))
+
+    def test_cold_timeline_falls_back_to_feed_query(self):
+        post = Post.objects.create(body="Friend", created_by=self.friend)
+        TimelineEntry.objects.all().delete()
+
+        self.assertIn(post, get_user_feed_posts(self.profile.user))
+
+    @override_settings(SOCIAL_FEED_FANOUT_LIMIT=1)
+    def test_posts_of_friends_above_fanout_limit_are_merged_on_read(self):
+        Profile.objects.filter(pk=self.friend.pk).update(friends_count=5)
+        Post.objects.create(body="Own", created_by=self.profile)
+        self.friend.refresh_from_db()
+
+        post = Post.objects.create(body="Celebrity", created_by=self.friend)
+
+        self.assertFalse(TimelineEntry.objects.filter(profile=self.profile, post=post).exists())
+        self.assertIn(post, get_home_timeline_posts(self.profile))
+
+    @override_settings(SOCIAL_FEED_FANOUT_LIMIT=1)
+    def test_unfanned_posts_stay_after_the_author_drops_under_the_limit(self):
+        Profile.objects.filter(pk=self.friend.pk).update(friends_count=5)
+        Post.objects.create(body="Own", created_by=self.profile)
+        self.friend.refresh_from_db()
+        post = Post.objects.create(body="Celebrity", created_by=self.friend)
+
+        Profile.objects.filter(pk=self.friend.pk).update(friends_count=0)
+
+        self.assertFalse(Post.objects.get(pk=post.pk).fanned_out)
+        self.assertIn(post, get_home_timeline_posts(self.profile))
+
+
+class BackfillHomeTimelinesCommandTest(TestCase):
+    def test_backfill_materializes_existing_feed(self):
+        profile = create_profile("owner")
+        friend = create_profile("friend")
+        profile.friends.add(friend)
+        post = Post.objects.create(body="Friend", created_by=friend)
+        TimelineEntry.objects.all().delete()
+
+        call_command("backfill_home_timelines", stdout=StringIO())
+
+        self.assertTrue(TimelineEntry.objects.filter(profile=profile, post=post).exists())
+        self.assertTrue(TimelineEntry.objects.filter(profile=friend, post=post).exists())
@@ -0,0 +1,59 @@
+from io import StringIO
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.utils import create_active_user
+from social_posts.models import Post
+from social_posts.utils import get_visible_posts
+from social_profiles.models import Profile
+
+
+class VisibilityPredicateTest(TestCase):
+    def _profile(self, name):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        ))
+
+    def setUp(self):
+        self.viewer = self._profile("viewer")
+        self.friend = self._profile("friend")
+        self.stranger = self._profile("stranger")
+        self.viewer.friends.add(self.friend)
+
+        Post.objects.create(body="own private", created_by=self.viewer, is_private=True)
+        Post.objects.create(body="friend private", created_by=self.friend, is_private=True)
+        Post.objects.create(body="stranger private", created_by=self.stranger, is_private=True)
+        Post.objects.create(body="stranger public", created_by=self.stranger, is_private=False)
+
+    def _bodies(self, user):
+        return set(get_visible_posts(user).values_list("body", flat=True))
+
+    def test_viewer_sees_public_own_and_friends_posts(self):
+        self.assertEqual(
+            self._bodies(self.viewer.user),
+            {"own private", "friend private", "stranger public"},
+        )
+
+    def test_friendship_is_symmetric(self):
+        self.assertEqual(
+            self._bodies(self.friend.user),
+            {"own private", "friend private", "stranger public"},
+        )
+
+    def test_anonymous_sees_public_posts_only(self):
+        self.assertEqual(self._bodies(AnonymousUser()), {"stranger public"})
+
+    def test_benchmark_command_rolls_back_fixtures(self):
+        profiles = Profile.objects.count()
+        stdout = StringIO()
+
+        call_command("benchmark_post_visibility", friends=[1, 3], repeat=1, stdout=stdout)
+
+        self.assertIn("EXISTS", stdout.getvalue())
+        self.assertEqual(Profile.objects.count(), profiles)
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from unittest import mock
 
 from django.conf import settings
 from django.test import TestCase, override_settings
@@ -9,6 +10,7 @@ from rest_framework.test import APIClient
 from core.utils import create_active_user, create_test_image
 from social_profiles.models import Profile
 from social_posts.models import Like, Post, PostAttachment
+from social_posts.tasks import purge_deleted_posts
 
 
 class PostLikeViewTest(TestCase):
@@ -118,18 +120,26 @@ class PostDeleteViewTest(TestCase):
     def test_authenticated_user_can_delete_own_post(self):
         initial_posts_count = self.profile.posts.count()
 
-        response = self.client.delete(self.url)
+        with mock.patch("social_posts.views.actions.purge_deleted_posts") as task:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.delete(self.url)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"message": "post deleted"})
         self.assertEqual(Post.objects.count(), 0)
-        self.assertEqual(PostAttachment.objects.count(), 0)
-
-        self.assertFalse(os.path.isfile(self.attachment.image.path))
+        self.assertEqual(Post.all_objects.count(), 1)
+        self.assertEqual(PostAttachment.objects.count(), 1)
+        task.delay.assert_called_once_with([str(self.post.id)])
 
         self.profile.refresh_from_db()
         self.assertEqual(self.profile.posts_count, initial_posts_count - 1)
 
+        purge_deleted_posts([str(self.post.id)])
+
+        self.assertEqual(Post.all_objects.count(), 0)
+        self.assertEqual(PostAttachment.objects.count(), 0)
+        self.assertFalse(os.path.isfile(self.attachment.image.path))
+
     def test_unauthenticated_user_cannot_delete_post(self):
         self.client.logout()
         response = self.client.delete(self.url)
@@ -190,3 +200,4 @@ class PostReportViewTest(TestCase):
         self.post.refresh_from_db()
 
         self.assertEqual(self.post.reported_by_users.filter(pk=self.profile.pk).count(), 1)
+        self.assertEqual(self.post.reports_count, 1)
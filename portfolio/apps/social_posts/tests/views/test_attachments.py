@@ -0,0 +1,88 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user, create_test_image
+from social_profiles.models import Profile
+from social_posts.models import Post, PostAttachment
+
+MEDIA_ROOT = os.path.join(tempfile.gettempdir(), "test_media_original")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class AttachmentOriginalViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+        self.attachment = PostAttachment.objects.create(
+            image=create_test_image("original.png"),
+            created_by=self.profile,
+        )
+
+    def tearDown(self):
+        if os.path.exists(MEDIA_ROOT):
+            for root, dirs, files in os.walk(MEDIA_ROOT, topdown=False):
+                for name in files:
+                    os.remove(os.path.join(root, name))
+                for name in dirs:
+                    os.rmdir(os.path.join(root, name))
+            os.rmdir(MEDIA_ROOT)
+
+    def _url(self):
+        return reverse("social_posts:attachment_original", args=[self.attachment.pk])
+
+    def test_public_post_original_is_served_by_the_view(self):
+        post = Post.objects.create(body="Photo", created_by=self.profile, is_private=False)
+        post.attachments.add(self.attachment)
+
+        response = self.client.get(self._url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response["Cache-Control"], "private, max-age=3600")
+        with self.attachment.image.open("rb") as original:
+            self.assertEqual(b"".join(response.streaming_content), original.read())
+
+    @override_settings(SOCIAL_ATTACHMENT_ACCEL_PREFIX="/protected/media/")
+    def test_original_is_handed_off_to_nginx_when_configured(self):
+        post = Post.objects.create(body="Photo", created_by=self.profile, is_private=False)
+        post.attachments.add(self.attachment)
+
+        response = self.client.get(self._url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            f"/protected/media/{self.attachment.image.name}",
+        )
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response.content, b"")
+
+    def test_private_post_original_is_hidden(self):
+        post = Post.objects.create(body="Photo", created_by=self.profile, is_private=True)
+        post.attachments.add(self.attachment)
+
+        response = self.client.get(self._url())
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_upload_schedules_variants_after_commit(self):
+        with mock.patch("social_posts.signals.images.generate_attachment_variants") as task:
+            with self.captureOnCommitCallbacks(execute=True):
+                attachment = PostAttachment.objects.create(
+                    image=create_test_image("scheduled.png"),
+                    created_by=self.profile,
+                )
+
+        task.delay.assert_called_once_with(str(attachment.pk))
@@ -0,0 +1,85 @@
+import uuid
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import Profile
+from social_posts.models import Post, PostAttachment
+
+
+class PostBulkViewTest(TestCase):
+    def _profile(self, name):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        ))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("social_posts:post_bulk")
+
+        self.viewer = self._profile("viewer")
+        self.friend = self._profile("friend")
+        self.stranger = self._profile("stranger")
+        self.viewer.friends.add(self.friend)
+        self.client.force_authenticate(self.viewer.user)
+
+        self.friend_private = Post.objects.create(body="friend private", created_by=self.friend, is_private=True)
+        self.stranger_public = Post.objects.create(body="stranger public", created_by=self.stranger)
+        self.stranger_private = Post.objects.create(body="stranger private", created_by=self.stranger, is_private=True)
+
+    def _bodies(self, response):
+        return [post["body"] for post in response.data["posts"]]
+
+    def test_returns_visible_posts_in_requested_order(self):
+        ids = [self.stranger_public.id, self.stranger_private.id, uuid.uuid4(), self.friend_private.id]
+
+        response = self.client.post(self.url, {"ids": [str(i) for i in ids]}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._bodies(response), ["stranger public", "friend private"])
+
+    def test_anonymous_gets_public_posts_only(self):
+        self.client.force_authenticate(None)
+        ids = [str(self.friend_private.id), str(self.stranger_public.id)]
+
+        response = self.client.post(self.url, {"ids": ids}, format="json")
+
+        self.assertEqual(self._bodies(response), ["stranger public"])
+
+    def test_queries_do_not_grow_with_the_number_of_ids(self):
+        posts = []
+        for i in range(10):
+            post = Post.objects.create(body=f"Post {i}", created_by=self.friend)
+            post.attachments.add(PostAttachment.objects.create(created_by=self.friend))
+            posts.append(str(post.id))
+
+        counts = []
+        for ids in (posts[:2], posts):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.url, {"ids": ids}, format="json")
+            self.assertEqual(len(response.data["posts"]), len(ids))
+            counts.append(len(context.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(counts[1], 3)
+
+    @override_settings(SOCIAL_POSTS_BULK_LIMIT=2)
+    def test_rejects_too_many_ids(self):
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+
+        response = self.client.post(self.url, {"ids": ids}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_malformed_ids(self):
+        for payload in ({"ids": "nope"}, {"ids": ["not-a-uuid"]}, {}):
+            response = self.client.post(self.url, payload, format="json")
+            self.assertEqual(response.status_code, 400)
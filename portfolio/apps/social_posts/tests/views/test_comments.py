@@ -59,3 +59,63 @@ class PostCreateCommentViewTest(TestCase):
         self.assertEqual(Comment.objects.count(), 1)
         comment = Comment.objects.first()
         self.assertEqual(comment.body, "")
+
+
+class PostCommentsViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.profile = Profile.objects.create(user=create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        ))
+        self.post = Post.objects.create(body="Popular post", created_by=self.profile, is_private=False)
+        for i in range(5):
+            self.post.comments.add(Comment.objects.create(body=f"Comment {i}", created_by=self.profile))
+        self.url = reverse("social_posts:post_comments", kwargs={"pk": self.post.pk})
+
+    def test_comments_are_paged_oldest_first(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.status_code, 200)
+        bodies = [c["body"] for c in response.data["results"]["comments"]]
+        self.assertEqual(bodies, ["Comment 0", "Comment 1"])
+
+        bodies = []
+        url = self.url + "?page_size=2"
+        while url:
+            response = self.client.get(url)
+            bodies += [c["body"] for c in response.data["results"]["comments"]]
+            url = response.data["next"]
+        self.assertEqual(bodies, [f"Comment {i}" for i in range(5)])
+
+    def test_post_detail_embeds_first_page_and_cursor(self):
+        detail_url = reverse("social_posts:post_detail", args=[self.post.pk])
+        response = self.client.get(detail_url, {"page_size": 3})
+        self.assertEqual(response.status_code, 200)
+
+        bodies = [c["body"] for c in response.data["post"]["comments"]]
+        self.assertEqual(bodies, ["Comment 0", "Comment 1", "Comment 2"])
+        self.assertIn(self.url, response.data["comments_next"])
+
+        response = self.client.get(response.data["comments_next"])
+        bodies = [c["body"] for c in response.data["results"]["comments"]]
+        self.assertEqual(bodies, ["Comment 3", "Comment 4"])
+
+    def test_private_post_of_non_friend_is_not_found(self):
+        stranger = Profile.objects.create(user=create_active_user(
+            email="stranger@example.com",
+            username="stranger",
+            password="pass123",
+            first_name="Stranger",
+            last_name="User"
+        ))
+        self.post.is_private = True
+        self.post.save()
+        self.client.force_authenticate(stranger.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,140 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_posts.models import Post, PostAttachment, Trend
+from social_posts.tasks import create_social_posts_trends
+from social_posts.utils import increment_post_counter
+from social_profiles.models import Profile
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = create_active_user(
+            email="viewer@example.com",
+            username="viewer",
+            password="pass123",
+            first_name="Viewer",
+            last_name="User"
+        )
+        self.profile = Profile.objects.create(user=self.user)
+        self.client.force_authenticate(self.user)
+
+        self.post = Post.objects.create(body="Hello #etag", created_by=self.profile)
+
+    def _revalidate(self, url, params=None):
+        etag = self.client.get(url, params)["ETag"]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        return etag, response, len(context.captured_queries)
+
+    def test_unchanged_feed_is_not_modified(self):
+        url = reverse("social_posts:post_list")
+        etag, response, queries = self._revalidate(url)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        # Viewer profile, timeline check, page rows and liked ids; nothing is serialized.
+        self.assertEqual(queries, 4)
+
+        increment_post_counter(self.post.id, "likes_count")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_writes_outside_the_page_keep_the_feed_etag(self):
+        stranger = Profile.objects.create(user=create_active_user(
+            email="stranger@example.com",
+            username="stranger",
+            password="pass123",
+            first_name="Stranger",
+            last_name="User"
+        ))
+        url = reverse("social_posts:post_list")
+        etag = self.client.get(url)["ETag"]
+
+        other = Post.objects.create(body="Elsewhere", created_by=stranger, is_private=True)
+        increment_post_counter(other.id, "likes_count")
+        stranger.first_name = "Renamed"
+        stranger.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_counter_only_profile_save_keeps_the_author_version(self):
+        url = reverse("social_posts:post_list")
+        etag = self.client.get(url)["ETag"]
+
+        self.profile.friends_count += 1
+        self.profile.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_author_rename_changes_the_feed_etag(self):
+        url = reverse("social_posts:post_list")
+        etag = self.client.get(url)["ETag"]
+
+        self.profile.first_name = "Renamed"
+        self.profile.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"]["posts"][0]["created_by"]["first_name"], "Renamed")
+
+    def test_ready_variants_change_the_feed_etag(self):
+        attachment = PostAttachment.objects.create(created_by=self.profile)
+        self.post.attachments.add(attachment)
+        url = reverse("social_posts:post_list")
+        etag = self.client.get(url)["ETag"]
+
+        attachment.variants = {"jpeg": {"640": "social/posts/variants/a.jpeg"}}
+        attachment.save(update_fields=["variants"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_depends_on_the_page_requested(self):
+        url = reverse("social_posts:post_list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_ranked_feed_is_not_conditional(self):
+        response = self.client.get(reverse("social_posts:post_list"), {"ranking": "top"})
+
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_unchanged_profile_feed_is_not_modified(self):
+        url = reverse("social_posts:post_list_profile", args=[self.profile.slug])
+        etag, response, _ = self._revalidate(url)
+        self.assertEqual(response.status_code, 304)
+
+        Post.objects.create(body="Another", created_by=self.profile)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_trends_etag_follows_their_content(self):
+        Trend.objects.create(hashtag="etag", occurences=1)
+        url = reverse("social_posts:get_trends")
+        etag, response, queries = self._revalidate(url)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(queries, 0)
+
+        create_social_posts_trends()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Post.objects.create(body="Hello #django", created_by=self.profile)
+        create_social_posts_trends()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
@@ -1,7 +1,9 @@
 import os
 import tempfile
+from unittest import mock
 
 from django.conf import settings
+from django.db import DatabaseError
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -56,6 +58,39 @@ class PostCreateViewTest(TestCase):
         self.profile.refresh_from_db()
         self.assertEqual(self.profile.posts_count, 1)
 
+    def test_create_post_with_images_batches_inserts(self):
+        url = reverse("social_posts:post_create")
+        data = {
+            "body": "Gallery",
+            "images[0]": self.image,
+            "images[1]": create_test_image("second.png"),
+            "images[2]": create_test_image("third.png"),
+        }
+
+        with mock.patch(
+            "social_posts.views.create.generate_attachment_variants",
+        ) as task, self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(13):
+                response = self.client.post(url, data=data, format="multipart")
+
+        self.assertEqual(response.status_code, 200)
+        post = Post.objects.get()
+        self.assertEqual(post.attachments.count(), 3)
+        self.assertEqual(task.delay.call_count, 3)
+        self.assertEqual(len(os.listdir(self.media_path)), 3)
+
+    def test_failed_create_removes_stored_images(self):
+        url = reverse("social_posts:post_create")
+        data = {"body": "New post", "images[0]": self.image}
+
+        with mock.patch.object(
+            PostAttachment.objects, "bulk_create", side_effect=DatabaseError,
+        ), self.assertRaises(DatabaseError):
+            self.client.post(url, data=data, format="multipart")
+
+        self.assertEqual(Post.objects.count(), 0)
+        self.assertEqual(os.listdir(self.media_path), [])
+
     def test_create_post_unauthenticated_returns_401(self):
         self.client.force_authenticate(user=None)
 
@@ -85,3 +120,13 @@ class PostCreateViewTest(TestCase):
         self.assertIn("error", response.json())
         self.assertEqual(response.json()["error"], "Form is not valid")
         self.assertEqual(Post.objects.count(), 0)
+
+    def test_invalid_form_does_not_store_images(self):
+        url = reverse("social_posts:post_create")
+        data = {"body": "s", "images[0]": self.image}
+
+        response = self.client.post(url, data=data, format="multipart")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(PostAttachment.objects.count(), 0)
+        self.assertFalse(os.path.exists(self.media_path) and os.listdir(self.media_path))
@@ -1,3 +1,5 @@
+import uuid
+
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -61,3 +63,13 @@ class PostDetailApiTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["post"]["body"], "Public post")
+
+    def test_anonymous_user_gets_404_for_private_post(self):
+        url = reverse("social_posts:post_detail", args=[self.private_post_by_self.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_post_is_not_found(self):
+        url = reverse("social_posts:post_detail", args=[uuid.uuid4()])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
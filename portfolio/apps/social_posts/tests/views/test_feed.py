@@ -4,7 +4,7 @@ from rest_framework.test import APIClient
 
 from core.utils import create_active_user
 from social_profiles.models import Profile
-from social_posts.models import Post
+from social_posts.models import Like, Post
 
 
 class PostListApiTest(TestCase):
@@ -53,3 +53,16 @@ class PostListApiTest(TestCase):
             bodies,
             msg="Expected post with body 'Hello #test' not found in trend-based response"
         )
+
+    def test_post_list_flags_posts_liked_by_viewer(self):
+        liked = Post.objects.get(body="Public post")
+        liked.likes.add(Like.objects.create(created_by=self.profile))
+        other = Post.objects.get(body="Hello #test")
+        other.likes.add(Like.objects.create(created_by=self.friend_profile))
+
+        self.client.login(username="testuser@example.com", password="pass123")
+        response = self.client.get(reverse("social_posts:post_list"))
+
+        flags = {p["body"]: p["liked_by_me"] for p in response.data["results"]["posts"]}
+        self.assertTrue(flags["Public post"])
+        self.assertFalse(flags["Hello #test"])
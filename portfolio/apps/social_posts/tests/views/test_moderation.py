@@ -0,0 +1,71 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import Profile
+from social_posts.models import Post
+from social_posts.utils import report_post
+
+
+class ModerationQueueViewTest(TestCase):
+    def _profile(self, name, **extra):
+        user = create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        )
+        if extra:
+            type(user).objects.filter(pk=user.pk).update(**extra)
+            user.refresh_from_db()
+        return Profile.objects.create(user=user)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("social_posts:moderation_queue")
+
+        self.staff = self._profile("staff", is_staff=True)
+        self.author = self._profile("author")
+        self.reporters = [self._profile(f"reporter{i}") for i in range(3)]
+
+        self.once = Post.objects.create(body="once", created_by=self.author)
+        self.twice = Post.objects.create(body="twice", created_by=self.author, is_private=True)
+        self.thrice = Post.objects.create(body="thrice", created_by=self.author)
+        Post.objects.create(body="clean", created_by=self.author)
+
+        for post, count in ((self.once, 1), (self.twice, 2), (self.thrice, 3)):
+            for reporter in self.reporters[:count]:
+                report_post(post, reporter)
+
+    def test_lists_reported_posts_by_report_count(self):
+        self.client.force_authenticate(self.staff.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        posts = response.data["results"]["posts"]
+        self.assertEqual([post["body"] for post in posts], ["thrice", "twice", "once"])
+        self.assertEqual([post["reports_count"] for post in posts], [3, 2, 1])
+
+    def test_paginates_with_keyset_cursor(self):
+        self.client.force_authenticate(self.staff.user)
+
+        first = self.client.get(self.url, {"page_size": 2})
+        second = self.client.get(first.data["next"])
+
+        self.assertEqual([post["body"] for post in second.data["results"]["posts"]], ["once"])
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(self.author.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_repeated_report_is_not_counted(self):
+        self.assertFalse(report_post(self.once, self.reporters[0]))
+
+        self.once.refresh_from_db()
+        self.assertEqual(self.once.reports_count, 1)
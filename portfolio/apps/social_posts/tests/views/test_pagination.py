@@ -0,0 +1,86 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import Profile
+from social_posts.models import Post
+
+
+class PostCursorPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = create_active_user(
+            email="author@example.com",
+            username="author",
+            password="pass123",
+            first_name="Author",
+            last_name="User"
+        )
+        self.profile = Profile.objects.create(user=self.user)
+        self.client.force_authenticate(self.user)
+
+        for i in range(7):
+            Post.objects.create(body=f"Post {i}", created_by=self.profile, is_private=False)
+
+        self.url = reverse("social_posts:post_list")
+
+    def _bodies(self, response):
+        return [p["body"] for p in response.data["results"]["posts"]]
+
+    def test_first_page_has_next_cursor_and_no_count(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual(self._bodies(response), ["Post 6", "Post 5", "Post 4"])
+
+    def test_walking_next_cursors_visits_every_post_once(self):
+        bodies = []
+        url = self.url
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            bodies.extend(self._bodies(response))
+            url = response.data["next"]
+
+        self.assertEqual(bodies, [f"Post {i}" for i in reversed(range(7))])
+
+    def test_previous_cursor_returns_preceding_page(self):
+        first = self.client.get(self.url)
+        second = self.client.get(first.data["next"])
+
+        response = self.client.get(second.data["previous"])
+
+        self.assertEqual(self._bodies(response), self._bodies(first))
+        self.assertIsNone(response.data["previous"])
+
+    def test_same_timestamp_posts_are_split_by_id(self):
+        created_at = Post.objects.first().created_at
+        Post.objects.update(created_at=created_at)
+
+        bodies = []
+        url = self.url
+        while url:
+            response = self.client.get(url)
+            bodies.extend(self._bodies(response))
+            url = response.data["next"]
+
+        self.assertEqual(len(bodies), 7)
+        self.assertEqual(len(set(bodies)), 7)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_profile_feed_uses_cursor_pagination(self):
+        url = reverse("social_posts:post_list_profile", args=[self.profile.slug])
+        response = self.client.get(url, {"page_size": 5})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]["posts"]), 5)
+        self.assertIsNotNone(response.data["next"])
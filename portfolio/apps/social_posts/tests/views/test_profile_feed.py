@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -9,6 +10,7 @@ from social_posts.models import Post
 
 class PostListProfileViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
 
         self.author_user = create_active_user(
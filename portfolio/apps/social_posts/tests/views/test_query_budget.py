@@ -0,0 +1,86 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import Profile
+from social_posts.models import Comment, Post, PostAttachment
+
+
+class FeedQueryBudgetTest(TestCase):
+    """Serializing a page must cost the same number of queries whatever its size.
+
+    Conditional feeds include the queries of their page-level ETag validator.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = create_active_user(
+            email="viewer@example.com",
+            username="viewer",
+            password="pass123",
+            first_name="Viewer",
+            last_name="User"
+        )
+        self.profile = Profile.objects.create(user=self.user)
+        self.client.force_authenticate(self.user)
+
+        self.authors = []
+        for i in range(3):
+            author = Profile.objects.create(user=create_active_user(
+                email=f"author{i}@example.com",
+                username=f"author{i}",
+                password="pass123",
+                first_name=f"Author{i}",
+                last_name="User"
+            ))
+            self.profile.friends.add(author)
+            self.authors.append(author)
+
+        for i in range(12):
+            author = self.authors[i % 3]
+            post = Post.objects.create(body=f"Post {i} #budget", created_by=author, is_private=False)
+            post.attachments.add(PostAttachment.objects.create(created_by=author))
+
+    def _count_queries(self, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assertConstantQueries(self, url, expected, params=None):
+        params = params or {}
+        small = self._count_queries(url, {**params, "page_size": 2})
+        large = self._count_queries(url, {**params, "page_size": 10})
+        self.assertEqual(small, large)
+        self.assertEqual(large, expected)
+
+    def test_post_list(self):
+        self.assertConstantQueries(reverse("social_posts:post_list"), 9)
+
+    def test_post_list_with_trend(self):
+        self.assertConstantQueries(reverse("social_posts:post_list"), 5, {"trend": "budget"})
+
+    def test_post_list_profile(self):
+        url = reverse("social_posts:post_list_profile", args=[self.authors[0].slug])
+        self.assertEqual(self._count_queries(url, {}), 10)
+        # The viewer/profile relationship state is cached after the first request.
+        self.assertConstantQueries(url, 9)
+
+    def test_search(self):
+        self.assertConstantQueries(reverse("social_posts:search"), 4, {"query": "budget"})
+
+    def test_post_detail(self):
+        post = Post.objects.filter(created_by=self.authors[0]).first()
+        url = reverse("social_posts:post_detail", args=[post.pk])
+
+        self.assertEqual(self._count_queries(url, {}), 3)
+        for author in self.authors:
+            post.comments.add(Comment.objects.create(body="Nice", created_by=author))
+
+        self.assertEqual(self._count_queries(url, {}), 3)
@@ -1,4 +1,6 @@
-from django.test import TestCase
+import json
+
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
@@ -87,3 +89,45 @@ class SearchApiTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn("results", response.data)
         self.assertLessEqual(len(response.data["results"]["posts"]), 5)
+
+    def test_search_pages_follow_rank_order(self):
+        for i in range(4):
+            Post.objects.create(body="Django " * (i + 1), is_private=False, created_by=self.friend_profile)
+
+        bodies = []
+        url = reverse("social_posts:search") + "?query=Django&page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            bodies.extend(p["body"] for p in response.data["results"]["posts"])
+            url = response.data["next"]
+
+        self.assertEqual(len(bodies), len(set(bodies)))
+        self.assertEqual(len(bodies), 6)
+        self.assertEqual(bodies[0].strip(), " ".join(["Django"] * 4))
+
+    @override_settings(SOCIAL_STREAM_CHUNK_SIZE=2)
+    def test_search_stream_returns_every_match(self):
+        for i in range(5):
+            Post.objects.create(body=f"Post {i} Django", is_private=False, created_by=self.friend_profile)
+        self.client.post(reverse("social_posts:post_like", kwargs={"pk": self.public_post.pk}))
+
+        url = reverse("social_posts:search") + "?query=Django&stream=1"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join(response.streaming_content))
+        bodies = [p["body"] for p in data["posts"]]
+        self.assertEqual(len(bodies), 7)
+        self.assertNotIn(self.private_post.body, bodies)
+        liked = [p["body"] for p in data["posts"] if p["liked_by_me"]]
+        self.assertEqual(liked, [self.public_post.body])
+        self.assertEqual(data["profiles"], [])
+
+    def test_search_stream_profiles(self):
+        url = reverse("social_posts:search") + "?query=Jane&stream=1"
+        response = self.client.get(url)
+
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual([p["first_name"] for p in data["profiles"]], ["Jane"])
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 
@@ -6,6 +7,7 @@ from social_posts.models import Trend
 
 class GetTrendsViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.url = reverse('social_posts:get_trends')
 
     def test_returns_all_trends(self):
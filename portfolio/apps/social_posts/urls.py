@@ -1,7 +1,11 @@
 from django.urls import path
 
 from social_posts.views import (
+    attachment_original,
     get_trends,
+    moderation_queue,
+    post_bulk,
+    post_comments,
     post_create,
     post_create_comment,
     post_delete,
@@ -19,11 +23,19 @@ urlpatterns = [
     path('', post_list, name='post_list'),
     path('<uuid:pk>/', post_detail, name='post_detail'),
     path('<uuid:pk>/like/', post_like, name='post_like'),
+    path('<uuid:pk>/comments/', post_comments, name='post_comments'),
     path('<uuid:pk>/comment/', post_create_comment, name='post_create_comment'),
     path('<uuid:pk>/delete/', post_delete, name='post_delete'),
     path('<uuid:pk>/report/', post_report, name='post_report'),
+    path(
+        'attachments/<uuid:pk>/original/',
+        attachment_original,
+        name='attachment_original',
+    ),
     path('profile/<slug:slug>/', post_list_profile, name='post_list_profile'),
     path('create/', post_create, name='post_create'),
+    path('bulk/', post_bulk, name='post_bulk'),
+    path('moderation/', moderation_queue, name='moderation_queue'),
     path('search/', search, name='search'),
     path('trends/', get_trends, name='get_trends'),
 ]
@@ -1,3 +1,102 @@
-from social_posts.utils.feed import get_trending_posts, get_user_feed_posts
+from social_posts.utils.counters import (
+    flush_counter_buffer,
+    increment_post_counter,
+)
+from social_posts.utils.creation import create_post
+from social_posts.utils.deletion import (
+    purge_soft_deleted_posts,
+    soft_delete_post,
+)
+from social_posts.utils.etags import (
+    feed_validators,
+    profile_feed_validators,
+    trends_validators,
+)
+from social_posts.utils.feed import (
+    get_trending_posts,
+    get_user_feed_posts,
+    get_visible_posts,
+)
+from social_posts.utils.hashtags import (
+    extract_hashtags,
+    index_hashtags,
+    sync_post_hashtags,
+)
+from social_posts.utils.hydration import (
+    get_liked_post_ids,
+    hydrate_comments,
+    hydrate_feed_posts,
+)
+from social_posts.utils.images import (
+    build_attachment_variants,
+    get_variant_url,
+    strip_image_metadata,
+)
+from social_posts.utils.moderation import get_moderation_queue, report_post
+from social_posts.utils.ranking import (
+    get_ranked_post_ids,
+    rank_posts,
+    score_expression,
+)
+from social_posts.utils.timeline import (
+    fan_out_post,
+    get_home_timeline_posts,
+    link_timelines,
+    rebuild_home_timeline,
+    unlink_timelines,
+)
+from social_posts.utils.trends import (
+    bump_hashtag_counts,
+    compute_trends,
+    get_cached_trends,
+    load_trends,
+    prune_hashtag_counts,
+    publish_trends,
+    rebuild_hashtag_counts,
+)
+from social_posts.utils.versions import bump_author_version, get_author_versions
+from social_posts.utils.visibility import authored_by_network, visible_to
 
-__all__ = ['get_trending_posts', 'get_user_feed_posts']
+__all__ = [
+    'authored_by_network',
+    'build_attachment_variants',
+    'bump_author_version',
+    'bump_hashtag_counts',
+    'compute_trends',
+    'create_post',
+    'extract_hashtags',
+    'fan_out_post',
+    'feed_validators',
+    'flush_counter_buffer',
+    'get_author_versions',
+    'get_cached_trends',
+    'get_home_timeline_posts',
+    'get_liked_post_ids',
+    'get_moderation_queue',
+    'get_ranked_post_ids',
+    'get_trending_posts',
+    'get_user_feed_posts',
+    'get_variant_url',
+    'get_visible_posts',
+    'hydrate_comments',
+    'hydrate_feed_posts',
+    'increment_post_counter',
+    'index_hashtags',
+    'link_timelines',
+    'load_trends',
+    'profile_feed_validators',
+    'prune_hashtag_counts',
+    'publish_trends',
+    'purge_soft_deleted_posts',
+    'rank_posts',
+    'rebuild_hashtag_counts',
+    'rebuild_home_timeline',
+    'report_post',
+    'score_expression',
+    'soft_delete_post',
+    'strip_image_metadata',
+    'sync_post_hashtags',
+    'trends_validators',
+    'unlink_timelines',
+    'visible_to',
+]
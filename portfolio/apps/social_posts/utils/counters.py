@@ -0,0 +1,107 @@
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+import redis
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from social_posts.models import CounterFlush, Post
+
+COUNTER_FIELDS = ('likes_count', 'comments_count')
+BUFFER_KEY = 'social_posts:counter_buffer'
+FLUSHING_KEY = 'social_posts:counter_buffer:flushing'
+RATE_KEY = 'social_posts:counter_rate:{post_id}'
+RATE_WINDOW_SECONDS = 60
+# Hash member of the flushing batch holding its CounterFlush token.
+TOKEN_MEMBER = '__token__'
+FLUSH_TOKEN_RETENTION = timedelta(days=1)
+
+_buffer_client = None
+
+
+def get_buffer_client():
+    """Return the Redis client of the write-behind buffer, or None when it is disabled."""
+    global _buffer_client
+    if not settings.SOCIAL_COUNTER_BUFFER_URL:
+        return None
+    if _buffer_client is None:
+        _buffer_client = redis.Redis.from_url(settings.SOCIAL_COUNTER_BUFFER_URL)
+    return _buffer_client
+
+
+def _is_hot(client, post_id):
+    key = RATE_KEY.format(post_id=post_id)
+    pipeline = client.pipeline()
+    pipeline.incr(key)
+    pipeline.expire(key, RATE_WINDOW_SECONDS)
+    rate, _ = pipeline.execute()
+    return rate > settings.SOCIAL_COUNTER_HOT_THRESHOLD
+
+
+def increment_post_counter(post_id, field, delta=1):
+    """Add delta to a Post counter without reading or rewriting the row.
+
+    Posts receiving more than SOCIAL_COUNTER_HOT_THRESHOLD increments per
+    minute are buffered in Redis and written by flush_counter_buffer().
+    """
+    if field not in COUNTER_FIELDS:
+        raise ValueError(f'Unknown post counter: {field}')
+
+    client = get_buffer_client()
+    if client is not None and _is_hot(client, post_id):
+        client.hincrby(BUFFER_KEY, f'{post_id}:{field}', delta)
+        return
+
+    Post.objects.filter(pk=post_id).update(**{field: F(field) + delta})
+
+
+def flush_counter_buffer():
+    """Apply the buffered increments in one transaction; returns the number of posts updated.
+
+    The batch carries a token that is recorded as a CounterFlush row in the
+    same transaction as the deltas. A batch left behind by a crash after the
+    commit is recognised by its token and dropped instead of applied twice.
+    """
+    client = get_buffer_client()
+    if client is None:
+        return 0
+
+    if not client.exists(FLUSHING_KEY):
+        try:
+            client.rename(BUFFER_KEY, FLUSHING_KEY)
+        except redis.ResponseError:
+            return 0
+    client.hsetnx(FLUSHING_KEY, TOKEN_MEMBER, uuid.uuid4().hex)
+
+    token = None
+    deltas = defaultdict(dict)
+    for member, value in client.hgetall(FLUSHING_KEY).items():
+        member = member.decode()
+        if member == TOKEN_MEMBER:
+            token = value.decode()
+            continue
+        post_id, field = member.rsplit(':', 1)
+        if field in COUNTER_FIELDS:
+            deltas[post_id][field] = int(value)
+
+    applied = 0
+    try:
+        with transaction.atomic():
+            CounterFlush.objects.create(token=token)
+            for post_id, fields in deltas.items():
+                Post.objects.filter(pk=post_id).update(**{
+                    field: F(field) + delta for field, delta in fields.items()
+                })
+            applied = len(deltas)
+    except IntegrityError:
+        if not CounterFlush.objects.filter(token=token).exists():
+            raise
+
+    client.delete(FLUSHING_KEY)
+    CounterFlush.objects.filter(
+        applied_at__lt=timezone.now() - FLUSH_TOKEN_RETENTION,
+    ).delete()
+    return applied
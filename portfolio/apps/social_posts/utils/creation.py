@@ -0,0 +1,35 @@
+from django.db import transaction
+from django.db.models import F
+
+from social_posts.models import PostAttachment
+from social_profiles.models import Profile
+
+
+def create_post(post, attachments):
+    """Insert a validated post with its unsaved attachments in one transaction.
+
+    Image files are stored first because bulk_create() skips FileField.pre_save;
+    they are deleted again when the transaction rolls back.
+    """
+    stored = []
+    try:
+        with transaction.atomic():
+            for attachment in attachments:
+                upload = attachment.image
+                upload.save(upload.name, upload.file, save=False)
+                stored.append(upload.name)
+
+            post.save()
+            if attachments:
+                PostAttachment.objects.bulk_create(attachments)
+                post.attachments.add(*attachments)
+            Profile.objects.filter(pk=post.created_by_id).update(
+                posts_count=F('posts_count') + 1,
+            )
+    except Exception:
+        storage = PostAttachment._meta.get_field('image').storage
+        for name in stored:
+            storage.delete(name)
+        raise
+
+    return post
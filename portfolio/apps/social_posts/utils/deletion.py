@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from social_posts.models import Post, PostAttachment
+from social_posts.utils.trends import bump_hashtag_counts
+from social_profiles.models import Profile
+
+
+def soft_delete_post(post):
+    """Hide post at once; its rows and files are removed later by purge_soft_deleted_posts()."""
+    post.deleted_at = timezone.now()
+
+    with transaction.atomic():
+        post.save(update_fields=['deleted_at'])
+        if not post.is_private:
+            hashtag_ids = post.post_hashtags.values_list('hashtag_id', flat=True)
+            bump_hashtag_counts(list(hashtag_ids), post.created_at, -1)
+        Profile.objects.filter(pk=post.created_by_id).update(
+            posts_count=F('posts_count') - 1,
+        )
+
+
+def purge_soft_deleted_posts(post_ids=None):
+    """Delete soft-deleted posts and their attachments, then their image files."""
+    posts = Post.all_objects.filter(deleted_at__isnull=False)
+    if post_ids is not None:
+        posts = posts.filter(pk__in=post_ids)
+    post_ids = list(posts.values_list('pk', flat=True))
+    if not post_ids:
+        return 0
+
+    attachments = PostAttachment.objects.filter(post__in=post_ids)
+    attachment_ids = []
+    file_names = []
+    for attachment_id, image, variants in attachments.values_list('id', 'image', 'variants'):
+        attachment_ids.append(attachment_id)
+        if image:
+            file_names.append(image)
+        for sizes in variants.values():
+            file_names.extend(sizes.values())
+
+    with transaction.atomic():
+        PostAttachment.objects.filter(pk__in=attachment_ids).delete()
+        Post.all_objects.filter(pk__in=post_ids).delete()
+
+    storage = PostAttachment._meta.get_field('image').storage
+    for name in file_names:
+        storage.delete(name)
+
+    return len(post_ids)
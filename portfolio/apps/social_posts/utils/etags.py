@@ -0,0 +1,83 @@
+from core.utils import make_etag
+from social_posts.models import Post
+from social_posts.utils.feed import get_trending_posts, get_user_feed_posts
+from social_posts.utils.hydration import get_liked_post_ids
+from social_posts.utils.trends import get_cached_trends
+from social_posts.utils.versions import get_author_versions
+from social_posts.utils.visibility import visible_to
+from social_profiles.models import Profile
+from social_profiles.services import get_relationship_state
+
+PAGE_FIELDS = ('id', 'created_at', 'created_by_id', 'likes_count', 'comments_count')
+
+
+def _viewer(request):
+    return request.user.pk if request.user.is_authenticated else None
+
+
+def _page_state(posts, request):
+    """What a feed page renders: its rows, their counters, likes and author versions.
+
+    The page is read with the same keyset pagination as the view, but only
+    the columns that identify it, so writes elsewhere on the site never
+    change the ETag.
+    """
+    # Imported here: social_posts.views imports this package.
+    from social_posts.views.pagination import PostPagination
+
+    page = PostPagination().paginate_queryset(posts.only(*PAGE_FIELDS), request)
+    return (
+        [(post.id, post.likes_count, post.comments_count) for post in page],
+        sorted(get_liked_post_ids(page, request.user)),
+        get_author_versions({post.created_by_id for post in page}),
+    )
+
+
+def feed_validators(request):
+    """ETag for post_list: the state of the requested page.
+
+    The ranked mode reorders as scores decay, so it is not made conditional.
+    """
+    trend = request.GET.get('trend', '').lower()
+    if not trend and request.GET.get('ranking', '').lower() == 'top':
+        return None, None
+
+    posts = get_trending_posts(trend) if trend else get_user_feed_posts(request.user)
+    return make_etag(
+        _viewer(request),
+        request.get_full_path(),
+        _page_state(posts, request),
+    ), None
+
+
+def profile_feed_validators(request, slug):
+    """ETag for post_list_profile: the profile card, the relationship and the page state."""
+    profile = Profile.objects.filter(slug=slug).first()
+    if profile is None:
+        return None, None
+
+    relationship = None
+    if request.user.is_authenticated:
+        viewer = Profile.objects.filter(user=request.user).first()
+        if viewer is not None:
+            relationship = get_relationship_state(viewer, profile)
+
+    posts = Post.objects.filter(created_by=profile).filter(visible_to(request.user))
+    return make_etag(
+        _viewer(request),
+        request.get_full_path(),
+        profile.friends_count,
+        profile.posts_count,
+        get_author_versions([profile.pk]),
+        relationship,
+        _page_state(posts, request),
+    ), None
+
+
+def trends_validators(request):
+    """ETag for get_trends: the content hash of the cached generation.
+
+    The trends are kept on the request so get_trends does not read them again.
+    """
+    generation, request.cached_trends = get_cached_trends()
+    return make_etag(generation), None
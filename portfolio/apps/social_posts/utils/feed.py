@@ -1,14 +1,13 @@
-import re
-
 from social_posts.models import Post
+from social_posts.utils.timeline import get_home_timeline_posts
+from social_posts.utils.visibility import authored_by_network, visible_to
 from social_profiles.models import Profile
 
 
 def get_trending_posts(trend: str):
-    hashtag_pattern = r'#' + re.escape(trend) + r'(?![a-zA-Z0-9_])'
     return Post.objects.filter(
         is_private=False,
-        body__iregex=hashtag_pattern,
+        post_hashtags__hashtag__name=trend.lower(),
     )
 
 
@@ -21,7 +20,13 @@ def get_user_feed_posts(user):
     except Profile.DoesNotExist:
         return Post.objects.filter(is_private=False)
 
-    friend_ids = profile.friends.values_list('id', flat=True)
-    user_ids = [profile.id] + list(friend_ids)
+    timeline_posts = get_home_timeline_posts(profile)
+    if timeline_posts is not None:
+        return timeline_posts
+
+    return Post.objects.filter(authored_by_network(user))
+
 
-    return Post.objects.filter(created_by_id__in=user_ids)
+def get_visible_posts(user):
+    """Posts user may open: every public post plus those of the user and their friends."""
+    return Post.objects.filter(visible_to(user))
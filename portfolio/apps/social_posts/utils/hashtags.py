@@ -0,0 +1,64 @@
+import re
+
+from social_posts.models import Hashtag, PostHashtag
+
+HASHTAG_RE = re.compile(r'#(\w+)')
+HASHTAG_MAX_LENGTH = Hashtag._meta.get_field('name').max_length
+BULK_BATCH_SIZE = 1000
+
+
+def extract_hashtags(body):
+    if not body:
+        return set()
+    names = {name.lower() for name in HASHTAG_RE.findall(body)}
+    # Longer words are skipped rather than truncated into a different tag.
+    return {name for name in names if len(name) <= HASHTAG_MAX_LENGTH}
+
+
+def index_hashtags(posts):
+    """Write the hashtag rows for a batch of posts in a constant number of queries.
+
+    Returns a mapping of hashtag name to id for every hashtag in the batch.
+    """
+    names_by_post = {post: extract_hashtags(post.body) for post in posts}
+    names = set().union(*names_by_post.values())
+    if not names:
+        return {}
+
+    Hashtag.objects.bulk_create(
+        [Hashtag(name=name) for name in names],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    hashtag_ids = dict(
+        Hashtag.objects.filter(name__in=names).values_list('name', 'id'),
+    )
+
+    PostHashtag.objects.bulk_create(
+        [
+            PostHashtag(
+                post_id=post.id,
+                hashtag_id=hashtag_ids[name],
+                created_at=post.created_at,
+            )
+            for post, post_names in names_by_post.items()
+            for name in post_names
+        ],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+    return hashtag_ids
+
+
+def sync_post_hashtags(post):
+    """Re-index an edited post, touching the table only when its hashtags changed."""
+    wanted = extract_hashtags(post.body)
+    indexed = set(post.post_hashtags.values_list('hashtag__name', flat=True))
+    if wanted == indexed:
+        return
+
+    stale = indexed - wanted
+    if stale:
+        post.post_hashtags.filter(hashtag__name__in=stale).delete()
+    index_hashtags([post])
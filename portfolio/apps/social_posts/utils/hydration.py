@@ -0,0 +1,23 @@
+from social_posts.models import Post
+
+
+def hydrate_feed_posts(queryset):
+    """Attach the relations PostSerializer reads, so a page costs a fixed number of queries."""
+    return queryset.select_related('created_by').prefetch_related('attachments')
+
+
+def hydrate_comments(queryset):
+    """Attach comment authors for CommentSerializer."""
+    return queryset.select_related('created_by')
+
+
+def get_liked_post_ids(posts, user):
+    """Return the ids of posts on the page that user has liked, in a single query."""
+    if not posts or not user.is_authenticated:
+        return set()
+    return set(
+        Post.likes.through.objects.filter(
+            post_id__in=[post.id for post in posts],
+            like__created_by__user_id=user.id,
+        ).values_list('post_id', flat=True)
+    )
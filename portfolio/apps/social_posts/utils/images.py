@@ -0,0 +1,100 @@
+import io
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+VARIANT_FORMATS = {
+    'webp': 'WEBP',
+    'jpeg': 'JPEG',
+}
+VARIANT_UPLOAD_TO = 'social/posts/variants'
+VARIANT_QUALITY = 80
+# Formats whose EXIF block can be dropped by re-encoding a single frame.
+METADATA_FORMATS = {'JPEG', 'PNG', 'WEBP'}
+
+
+def get_variant_widths(original_width):
+    """Configured widths capped at the original width, so images are never upscaled."""
+    return sorted({
+        min(width, original_width)
+        for width in settings.SOCIAL_IMAGE_VARIANT_WIDTHS
+    })
+
+
+def _encode(image, width, image_format):
+    resized = image.copy()
+    resized.thumbnail((width, resized.height), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    # No exif/icc arguments are passed, so the metadata of the upload is dropped.
+    resized.save(buffer, format=image_format, quality=VARIANT_QUALITY)
+    return ContentFile(buffer.getvalue())
+
+
+def strip_image_metadata(upload):
+    """Return upload re-encoded without its EXIF block (GPS position, camera serial...).
+
+    The orientation tag is applied to the pixels first; uploads without EXIF,
+    animations and other formats are returned unchanged.
+    """
+    image = Image.open(upload)
+    image_format = image.format
+    if (
+        image_format not in METADATA_FORMATS
+        or getattr(image, 'is_animated', False)
+        or not image.getexif()
+    ):
+        upload.seek(0)
+        return upload
+
+    icc_profile = image.info.get('icc_profile')
+    image = ImageOps.exif_transpose(image)
+    buffer = io.BytesIO()
+    options = {'quality': 95} if image_format in {'JPEG', 'WEBP'} else {}
+    if icc_profile:
+        options['icc_profile'] = icc_profile
+    image.save(buffer, format=image_format, **options)
+    return ContentFile(buffer.getvalue(), name=upload.name)
+
+
+def build_attachment_variants(attachment):
+    """Render resized WebP/JPEG copies of the attachment image and record them on it."""
+    if not attachment.image:
+        return {}
+
+    with attachment.image.open('rb') as original:
+        image = ImageOps.exif_transpose(Image.open(original))
+        image = image.convert('RGB')
+
+    storage = attachment.image.storage
+    variants = {}
+    for extension, image_format in VARIANT_FORMATS.items():
+        variants[extension] = {}
+        for width in get_variant_widths(image.width):
+            name = storage.save(
+                f'{VARIANT_UPLOAD_TO}/{attachment.id}-{width}.{extension}',
+                _encode(image, width, image_format),
+            )
+            variants[extension][str(width)] = name
+
+    attachment.variants = variants
+    attachment.save(update_fields=['variants'])
+    return variants
+
+
+def get_variant_url(attachment, extension='jpeg', width=None):
+    """URL of the variant closest to width, falling back to the original image.
+
+    The original is linked through attachment_original, which checks that the
+    viewer may see the post.
+    """
+    sizes = attachment.variants.get(extension)
+    if not sizes:
+        if not attachment.image:
+            return None
+        return reverse('social_posts:attachment_original', args=[attachment.id])
+
+    width = width or settings.SOCIAL_IMAGE_DEFAULT_WIDTH
+    chosen = min(sizes, key=lambda size: abs(int(size) - width))
+    return attachment.image.storage.url(sizes[chosen])
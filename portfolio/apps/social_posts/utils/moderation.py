@@ -0,0 +1,28 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from social_posts.models import Post
+
+
+def report_post(post, profile):
+    """Record profile's report of post once; returns False for a repeated report.
+
+    reports_count is bumped in the same transaction as the through-table row,
+    so it never drifts from reported_by_users.
+    """
+    Report = Post.reported_by_users.through
+
+    try:
+        with transaction.atomic():
+            Report.objects.create(post_id=post.pk, profile_id=profile.pk)
+            Post.all_objects.filter(pk=post.pk).update(
+                reports_count=F('reports_count') + 1,
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def get_moderation_queue():
+    """Reported posts, most reported first, served by post_reports_count_idx."""
+    return Post.objects.filter(reports_count__gt=0)
@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.db.models import Q
+
+from social_posts.models import Post, TimelineEntry
+
+BULK_BATCH_SIZE = 1000
+
+
+def _fans_out(friends_count):
+    return friends_count < settings.SOCIAL_FEED_FANOUT_LIMIT
+
+
+def _write_entries(pairs):
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(
+                profile_id=profile_id,
+                post_id=post_id,
+                created_at=created_at,
+            )
+            for profile_id, post_id, created_at in pairs
+        ],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def fan_out_post(post):
+    """Write the post to its author's timeline and, below the fan-out limit, its friends'.
+
+    Skipped fan-out is recorded on the post, so friends keep merging it on
+    read even after the author drops back under the limit.
+    """
+    author = post.created_by
+    profile_ids = [author.id]
+    if _fans_out(author.friends_count):
+        profile_ids.extend(author.friends.values_list('id', flat=True))
+    elif post.fanned_out:
+        Post.all_objects.filter(pk=post.pk).update(fanned_out=False)
+        post.fanned_out = False
+
+    _write_entries(
+        (profile_id, post.id, post.created_at) for profile_id in profile_ids
+    )
+
+
+def link_timelines(profile_id, friend_ids):
+    """Materialize posts between a profile and its new friends, both ways."""
+    author_ids = {profile_id, *friend_ids}
+    posts = Post.objects.filter(
+        created_by_id__in=author_ids,
+        fanned_out=True,
+    ).values_list('id', 'created_by_id', 'created_at')
+
+    pairs = []
+    for post_id, author_id, created_at in posts:
+        if author_id == profile_id:
+            pairs.extend(
+                (friend_id, post_id, created_at) for friend_id in friend_ids
+            )
+        else:
+            pairs.append((profile_id, post_id, created_at))
+
+    _write_entries(pairs)
+
+
+def unlink_timelines(profile_id, friend_ids):
+    """Retract posts between a profile and its former friends, both ways."""
+    TimelineEntry.objects.filter(
+        Q(profile_id=profile_id, post__created_by_id__in=friend_ids)
+        | Q(profile_id__in=friend_ids, post__created_by_id=profile_id),
+    ).delete()
+
+
+def rebuild_home_timeline(profile):
+    posts = Post.objects.filter(
+        Q(created_by_id=profile.id)
+        | Q(created_by_id__in=profile.friends.values('id'), fanned_out=True),
+    ).values_list('id', 'created_at')
+
+    _write_entries(
+        (profile.id, post_id, created_at) for post_id, created_at in posts
+    )
+
+
+def get_home_timeline_posts(profile):
+    """Return the materialized home feed, or None while it is still cold.
+
+    Friends' posts that were not fanned out are merged at read time.
+    """
+    entries = TimelineEntry.objects.filter(profile=profile)
+    if not entries.exists():
+        return None
+
+    return Post.objects.filter(
+        Q(id__in=entries.values('post_id'))
+        | Q(created_by_id__in=profile.friends.values('id'), fanned_out=False),
+    )
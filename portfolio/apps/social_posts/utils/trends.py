@@ -0,0 +1,176 @@
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from social_posts.models import HashtagHourlyCount, Post, PostHashtag, Trend
+
+TREND_WINDOW = timedelta(hours=24)
+TRENDS_LIMIT = 10
+FALLBACK_POSTS = 5
+
+TRENDS_CURRENT_KEY = 'social_posts:trends:current'
+TRENDS_GENERATION_KEY = 'social_posts:trends:{generation}'
+TRENDS_REBUILD_LOCK_KEY = 'social_posts:trends:rebuild'
+TRENDS_CACHE_TIMEOUT = 60 * 60 * 24
+TRENDS_LOCK_TIMEOUT = 30
+
+_rebuild_lock = threading.Lock()
+
+
+def hour_bucket(moment):
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def get_window_start():
+    return hour_bucket(timezone.now()) - TREND_WINDOW
+
+
+def bump_hashtag_counts(hashtag_ids, moment, delta):
+    """Add delta to the hourly counter of every hashtag for the hour of moment."""
+    hour = hour_bucket(moment)
+    for hashtag_id in hashtag_ids:
+        counters = HashtagHourlyCount.objects.filter(
+            hashtag_id=hashtag_id,
+            hour=hour,
+        )
+        updated = counters.update(count=F('count') + delta)
+        if updated or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                HashtagHourlyCount.objects.create(
+                    hashtag_id=hashtag_id,
+                    hour=hour,
+                    count=delta,
+                )
+        except IntegrityError:
+            counters.update(count=F('count') + delta)
+
+
+def rebuild_hashtag_counts():
+    """Recompute the counters of the current window from the hashtag index."""
+    window_start = get_window_start()
+    rows = PostHashtag.objects.filter(
+        created_at__gte=window_start,
+        post__is_private=False,
+        post__deleted_at__isnull=True,
+    ).annotate(
+        hour=TruncHour('created_at'),
+    ).values('hashtag_id', 'hour').annotate(total=Count('id'))
+
+    with transaction.atomic():
+        HashtagHourlyCount.objects.filter(hour__gte=window_start).delete()
+        HashtagHourlyCount.objects.bulk_create([
+            HashtagHourlyCount(
+                hashtag_id=row['hashtag_id'],
+                hour=row['hour'],
+                count=row['total'],
+            )
+            for row in rows
+        ])
+
+
+def prune_hashtag_counts():
+    HashtagHourlyCount.objects.filter(hour__lt=get_window_start()).delete()
+
+
+def compute_trends(limit=TRENDS_LIMIT):
+    """Merge the hourly buckets of the window into the top hashtags."""
+    counts = HashtagHourlyCount.objects.filter(
+        hour__gte=get_window_start(),
+        count__gt=0,
+    ).values_list('hashtag__name', 'count')
+
+    trends_counter = Counter()
+    for name, count in counts:
+        trends_counter[name] += count
+
+    if not trends_counter:
+        recent_posts = Post.objects.filter(
+            is_private=False,
+        ).order_by('-created_at')[:FALLBACK_POSTS]
+        trends_counter.update(
+            PostHashtag.objects.filter(
+                post__in=recent_posts,
+            ).values_list('hashtag__name', flat=True),
+        )
+
+    return trends_counter.most_common(limit)
+
+
+def load_trends():
+    return list(Trend.objects.order_by('id').values('id', 'hashtag', 'occurences'))
+
+
+def get_trends_generation(trends):
+    """Content hash of trends, so an unchanged rebuild keeps the same generation."""
+    payload = json.dumps(trends, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def publish_trends(trends):
+    """Store trends under their generation, then point readers at it in one write."""
+    generation = get_trends_generation(trends)
+    cache.set(
+        TRENDS_GENERATION_KEY.format(generation=generation),
+        {'trends': trends, 'built_at': time.time()},
+        TRENDS_CACHE_TIMEOUT,
+    )
+    cache.set(TRENDS_CURRENT_KEY, generation, TRENDS_CACHE_TIMEOUT)
+    return generation
+
+
+def _read_generation():
+    generation = cache.get(TRENDS_CURRENT_KEY)
+    if generation is None:
+        return None, None
+    return generation, cache.get(TRENDS_GENERATION_KEY.format(generation=generation))
+
+
+def _is_fresh(entry):
+    return entry is not None and time.time() - entry['built_at'] < settings.SOCIAL_TRENDS_CACHE_TTL
+
+
+def get_cached_trends():
+    """Return (generation, trends) from the cache, rebuilding it at most once at a time.
+
+    Past SOCIAL_TRENDS_CACHE_TTL the entry is stale: one reader reloads it
+    from the Trend table while the others keep serving the stale generation.
+    On a cold cache, readers in this process block on the rebuilding one and
+    take its result; readers elsewhere read the table directly.
+    """
+    generation, entry = _read_generation()
+    if _is_fresh(entry):
+        return generation, entry['trends']
+
+    if not _rebuild_lock.acquire(blocking=entry is None):
+        return generation, entry['trends']
+    try:
+        generation, entry = _read_generation()
+        if _is_fresh(entry):
+            return generation, entry['trends']
+
+        if cache.add(TRENDS_REBUILD_LOCK_KEY, 1, TRENDS_LOCK_TIMEOUT):
+            try:
+                trends = load_trends()
+                return publish_trends(trends), trends
+            finally:
+                cache.delete(TRENDS_REBUILD_LOCK_KEY)
+    finally:
+        _rebuild_lock.release()
+
+    if entry is not None:
+        return generation, entry['trends']
+
+    trends = load_trends()
+    return get_trends_generation(trends), trends
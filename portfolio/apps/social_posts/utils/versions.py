@@ -0,0 +1,38 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+AUTHOR_VERSION_KEY = 'social_posts:author_version:{profile_id}'
+
+
+def get_author_versions(profile_ids):
+    """Sorted (profile_id, version) pairs of the given authors, read with one get_many.
+
+    An author whose key was never written or was evicted reads as None; the
+    next bump seeds it from the clock, so a version never repeats.
+    """
+    keys = {
+        AUTHOR_VERSION_KEY.format(profile_id=profile_id): profile_id
+        for profile_id in profile_ids
+    }
+    found = cache.get_many(keys)
+    return sorted((profile_id, found.get(key)) for key, profile_id in keys.items())
+
+
+def _bump(profile_id):
+    key = AUTHOR_VERSION_KEY.format(profile_id=profile_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def bump_author_version(profile_id):
+    """Invalidate the ETags of pages showing this author's posts or profile card.
+
+    Bumped now and again on commit, so a reader that sees the new version
+    before the transaction commits cannot pin it to the old data.
+    """
+    _bump(profile_id)
+    transaction.on_commit(lambda: _bump(profile_id))
@@ -0,0 +1,23 @@
+from django.db.models import Exists, OuterRef, Q
+
+from social_profiles.models import Profile
+
+
+def authored_by_network(user, author_field='created_by'):
+    """Q matching rows written by user or one of their friends.
+
+    Friendship is checked with an EXISTS probe on the friends through table,
+    so the statement size does not grow with the number of friends.
+    """
+    friendship = Profile.friends.through.objects.filter(
+        from_profile__user_id=user.id,
+        to_profile_id=OuterRef(f'{author_field}_id'),
+    )
+    return Q(**{f'{author_field}__user_id': user.id}) | Q(Exists(friendship))
+
+
+def visible_to(user, author_field='created_by'):
+    """Q matching posts user may read: public ones plus those of their network."""
+    if not user.is_authenticated:
+        return Q(is_private=False)
+    return Q(is_private=False) | authored_by_network(user, author_field)
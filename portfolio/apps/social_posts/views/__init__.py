@@ -1,14 +1,21 @@
 from social_posts.views.actions import post_delete, post_like, post_report
-from social_posts.views.comments import post_create_comment
+from social_posts.views.attachments import attachment_original
+from social_posts.views.bulk import post_bulk
+from social_posts.views.comments import post_comments, post_create_comment
 from social_posts.views.create import post_create
 from social_posts.views.detail import post_detail
 from social_posts.views.feed import post_list
+from social_posts.views.moderation import moderation_queue
 from social_posts.views.profile_feed import post_list_profile
 from social_posts.views.search import search
 from social_posts.views.trends import get_trends
 
 __all__ = [
+    'attachment_original',
     'get_trends',
+    'moderation_queue',
+    'post_bulk',
+    'post_comments',
     'post_create',
     'post_create_comment',
     'post_delete',
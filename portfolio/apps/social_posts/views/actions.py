@@ -1,5 +1,4 @@
-import os
-
+from django.db import transaction
 from django.http import JsonResponse
 
 from rest_framework.decorators import api_view, permission_classes
@@ -7,6 +6,12 @@ from rest_framework.permissions import IsAuthenticated
 
 from social_notification.utils import create_notification
 from social_posts.models import Like, Post
+from social_posts.tasks import purge_deleted_posts
+from social_posts.utils import (
+    increment_post_counter,
+    report_post,
+    soft_delete_post,
+)
 from social_profiles.models import Profile
 
 
@@ -18,13 +23,10 @@ def post_like(request, pk):
     post = Post.objects.get(pk=pk)
     request_user = Profile.objects.get(user=request.user)
 
-    if not post.likes.filter(created_by=request_user):
+    if not post.likes.filter(created_by=request_user).exists():
         like = Like.objects.create(created_by=request_user)
-
-        post = Post.objects.get(pk=pk)
-        post.likes_count = post.likes_count + 1
         post.likes.add(like)
-        post.save()
+        increment_post_counter(post.id, 'likes_count')
 
         if post.created_by != request_user:
             create_notification(request, 'post_like', post_id=post.id)
@@ -44,15 +46,10 @@ def post_delete(request, pk):
     except Post.DoesNotExist:
         return JsonResponse({'detail': 'Not found.'}, status=404)
 
-    for attachment in post.attachments.all():
-        if attachment.image:
-            if os.path.isfile(attachment.image.path):
-                os.remove(attachment.image.path)
-        attachment.delete()
-    post.delete()
-
-    request_user.posts_count = request_user.posts_count - 1
-    request_user.save()
+    soft_delete_post(post)
+    transaction.on_commit(
+        lambda: purge_deleted_posts.delay([str(post.pk)]),
+    )
 
     return JsonResponse({'message': 'post deleted'})
 
@@ -62,7 +59,6 @@ def post_delete(request, pk):
 def post_report(request, pk):
     request_user = Profile.objects.get(user=request.user)
     post = Post.objects.get(pk=pk)
-    post.reported_by_users.add(request_user)
-    post.save()
+    report_post(post, request_user)
 
     return JsonResponse({'message': 'post reported'})
@@ -0,0 +1,36 @@
+import mimetypes
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+
+from rest_framework.decorators import api_view
+
+from social_posts.models import PostAttachment
+from social_posts.utils import get_visible_posts
+
+
+@api_view(['GET'])
+def attachment_original(request, pk):
+    """Serve the original upload of an attachment on a post the viewer may see.
+
+    Originals are not reachable under MEDIA_URL in production; behind nginx
+    the file is handed off with X-Accel-Redirect to an internal location.
+    """
+    attachments = PostAttachment.objects.filter(
+        post__in=get_visible_posts(request.user),
+    ).distinct()
+    attachment = get_object_or_404(attachments, pk=pk)
+    if not attachment.image:
+        raise Http404
+
+    accel_prefix = settings.SOCIAL_ATTACHMENT_ACCEL_PREFIX
+    if accel_prefix:
+        content_type, _ = mimetypes.guess_type(attachment.image.name)
+        response = HttpResponse(content_type=content_type or 'application/octet-stream')
+        response['X-Accel-Redirect'] = quote(f'{accel_prefix}{attachment.image.name}')
+    else:
+        response = FileResponse(attachment.image.open('rb'))
+    response['Cache-Control'] = 'private, max-age=3600'
+    return response
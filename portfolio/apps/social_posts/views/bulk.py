@@ -0,0 +1,49 @@
+import uuid
+
+from django.conf import settings
+from django.http import JsonResponse
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from social_posts.serializers import PostSerializer
+from social_posts.utils import (
+    get_liked_post_ids,
+    get_visible_posts,
+    hydrate_feed_posts,
+)
+
+
+@api_view(['POST'])
+def post_bulk(request):
+    ids = request.data.get('ids')
+    limit = settings.SOCIAL_POSTS_BULK_LIMIT
+
+    if not isinstance(ids, list):
+        return JsonResponse({'error': 'ids must be a list'}, status=400)
+    if len(ids) > limit:
+        return JsonResponse(
+            {'error': f'At most {limit} ids can be requested at once'},
+            status=400,
+        )
+
+    try:
+        post_ids = list(dict.fromkeys(uuid.UUID(str(post_id)) for post_id in ids))
+    except ValueError:
+        return JsonResponse({'error': 'ids must be UUIDs'}, status=400)
+
+    posts = hydrate_feed_posts(get_visible_posts(request.user)).in_bulk(post_ids)
+    ordered_posts = [posts[post_id] for post_id in post_ids if post_id in posts]
+
+    serializer = PostSerializer(
+        ordered_posts,
+        context={
+            'request': request,
+            'liked_post_ids': get_liked_post_ids(ordered_posts, request.user),
+        },
+        many=True,
+    )
+
+    return Response({
+        'posts': serializer.data,
+    })
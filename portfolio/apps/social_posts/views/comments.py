@@ -1,13 +1,40 @@
 from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
 
 from rest_framework.decorators import api_view
 
 from social_notification.utils import create_notification
 from social_posts.models import Comment, Post
 from social_posts.serializers import CommentSerializer
+from social_posts.utils import (
+    get_visible_posts,
+    hydrate_comments,
+    increment_post_counter,
+)
+from social_posts.views.pagination import CommentPagination
 from social_profiles.models import Profile
 
 
+@api_view(['GET'])
+def post_comments(request, pk):
+    post = get_object_or_404(get_visible_posts(request.user), pk=pk)
+
+    paginator = CommentPagination()
+    comments = paginator.paginate_queryset(
+        hydrate_comments(post.comments.all()),
+        request,
+    )
+    serializer = CommentSerializer(
+        comments,
+        context={'request': request},
+        many=True,
+    )
+
+    return paginator.get_paginated_response({
+        'comments': serializer.data,
+    })
+
+
 @api_view(['POST'])
 def post_create_comment(request, pk):
     if not request.user.is_authenticated:
@@ -21,8 +48,7 @@ def post_create_comment(request, pk):
 
     post = Post.objects.get(pk=pk)
     post.comments.add(comment)
-    post.comments_count = post.comments_count + 1
-    post.save()
+    increment_post_counter(post.id, 'comments_count')
 
     create_notification(request, 'post_comment', post_id=post.id)
 
@@ -1,9 +1,12 @@
+from django.db import transaction
 from django.http import JsonResponse
 
 from rest_framework.decorators import api_view
 
 from social_posts.forms import AttachmentForm, PostForm
 from social_posts.serializers import PostSerializer
+from social_posts.tasks import generate_attachment_variants
+from social_posts.utils import create_post
 from social_profiles.models import Profile
 
 
@@ -13,8 +16,10 @@ def post_create(request):
         return JsonResponse({'error': 'Authentication required'}, status=401)
 
     form = PostForm(request.POST)
-    user = request.user
-    profile = Profile.objects.get(user=user)
+    if not form.is_valid():
+        return JsonResponse({'error': 'Form is not valid'}, status=400)
+
+    profile = Profile.objects.get(user=request.user)
 
     images = [
         value for key, value in request.FILES.items()
@@ -28,23 +33,18 @@ def post_create(request):
         if attachment_form.is_valid():
             attachment = attachment_form.save(commit=False)
             attachment.created_by = profile
-            attachment.save()
             attachments.append(attachment)
 
-    if form.is_valid():
-        post = form.save(commit=False)
-        post.created_by = profile
-        post.save()
+    post = form.save(commit=False)
+    post.created_by = profile
+    create_post(post, attachments)
+    profile.refresh_from_db(fields=['posts_count'])
 
-        if attachments:
-            for attachment in attachments:
-                post.attachments.add(attachment)
+    for attachment in attachments:
+        transaction.on_commit(
+            lambda pk=attachment.pk: generate_attachment_variants.delay(str(pk)),
+        )
 
-        profile.posts_count = profile.posts_count + 1
-        profile.save()
+    serializer = PostSerializer(post, context={'request': request})
 
-        serializer = PostSerializer(post, context={'request': request})
-
-        return JsonResponse(serializer.data, safe=False)
-    else:
-        return JsonResponse({'error': 'Form is not valid'}, status=400)
+    return JsonResponse(serializer.data, safe=False)
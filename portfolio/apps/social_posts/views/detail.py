@@ -1,29 +1,35 @@
-from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
 
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from social_posts.models import Post
 from social_posts.serializers import PostDetailSerializer
-from social_profiles.models import Profile
+from social_posts.utils import (
+    get_visible_posts,
+    hydrate_comments,
+    hydrate_feed_posts,
+)
+from social_posts.views.pagination import CommentPagination
 
 
 @api_view(['GET'])
 def post_detail(request, pk):
-    request_user = None
-    user_ids = []
-    if request.user.is_authenticated:
-        request_user = Profile.objects.get(user=request.user)
+    post = get_object_or_404(hydrate_feed_posts(get_visible_posts(request.user)), pk=pk)
 
-    if request_user is not None:
-        user_ids.append(request_user.id)
-        for user in request_user.friends.all():
-            user_ids.append(user.id)
-
-    post = Post.objects.filter(
-        Q(created_by_id__in=list(user_ids)) | Q(is_private=False),
-    ).get(pk=pk)
+    paginator = CommentPagination()
+    comments = paginator.paginate_queryset(
+        hydrate_comments(post.comments.all()),
+        request,
+    )
+    paginator.base_url = request.build_absolute_uri(
+        reverse('social_posts:post_comments', args=[post.pk]),
+    )
 
     return Response({
-        'post': PostDetailSerializer(post, context={'request': request}).data,
+        'post': PostDetailSerializer(
+            post,
+            context={'request': request, 'comments': comments},
+        ).data,
+        'comments_next': paginator.get_next_link(),
     })
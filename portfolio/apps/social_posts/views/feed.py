@@ -1,24 +1,50 @@
 from rest_framework.decorators import api_view
 
+from core.utils import conditional_view
 from social_posts.serializers import PostSerializer
-from social_posts.utils import get_trending_posts, get_user_feed_posts
-from social_posts.views.pagination import PostPagination
+from social_posts.utils import (
+    feed_validators,
+    get_liked_post_ids,
+    get_ranked_post_ids,
+    get_trending_posts,
+    get_user_feed_posts,
+    get_visible_posts,
+    hydrate_feed_posts,
+)
+from social_posts.views.pagination import PostPagination, RankedPagination
 
 
 @api_view(['GET'])
+@conditional_view(feed_validators)
 def post_list(request):
     trend = request.GET.get('trend', '').lower()
+    ranking = request.GET.get('ranking', '').lower()
 
-    if trend:
-        posts = get_trending_posts(trend)
+    if not trend and ranking == 'top':
+        paginator = RankedPagination()
+        paginated_posts = paginator.paginate_ranking(
+            get_ranked_post_ids(request.user),
+            hydrate_feed_posts(get_visible_posts(request.user)),
+            request,
+        )
     else:
-        posts = get_user_feed_posts(request.user)
+        if trend:
+            posts = get_trending_posts(trend)
+        else:
+            posts = get_user_feed_posts(request.user)
+
+        paginator = PostPagination()
+        paginated_posts = paginator.paginate_queryset(
+            hydrate_feed_posts(posts),
+            request,
+        )
 
-    paginator = PostPagination()
-    paginated_posts = paginator.paginate_queryset(posts, request)
     posts_serializer = PostSerializer(
         paginated_posts,
-        context={'request': request},
+        context={
+            'request': request,
+            'liked_post_ids': get_liked_post_ids(paginated_posts, request.user),
+        },
         many=True,
     )
 
@@ -0,0 +1,32 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+
+from social_posts.serializers import ModerationPostSerializer
+from social_posts.utils import (
+    get_liked_post_ids,
+    get_moderation_queue,
+    hydrate_feed_posts,
+)
+from social_posts.views.pagination import ModerationPagination
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def moderation_queue(request):
+    paginator = ModerationPagination()
+    posts = paginator.paginate_queryset(
+        hydrate_feed_posts(get_moderation_queue()),
+        request,
+    )
+    serializer = ModerationPostSerializer(
+        posts,
+        context={
+            'request': request,
+            'liked_post_ids': get_liked_post_ids(posts, request.user),
+        },
+        many=True,
+    )
+
+    return paginator.get_paginated_response({
+        'posts': serializer.data,
+    })
@@ -1,7 +1,68 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import Cursor, CursorPagination
 
+from core.utils import KeysetPagination
+
+
+class PostPagination(KeysetPagination):
+    page_size = 3
+
+
+class SearchPagination(PostPagination):
+    ordering = ('-search_rank', '-created_at', '-id')
+
+
+class CommentPagination(KeysetPagination):
+    ordering = ('created_at', 'id')
+    page_size = 10
+
+
+class ModerationPagination(KeysetPagination):
+    ordering = ('-reports_count', '-created_at', '-id')
+    page_size = 20
+
+
+class RankedPagination(CursorPagination):
+    """Offset cursor over a precomputed list of ranked post ids.
+
+    The ranking is cached per viewer, so offsets stay stable between pages
+    of the same ranking. Pages are read from the queryset given, which must
+    re-check visibility: ids cached a minute ago may no longer be visible.
+    """
 
-class PostPagination(PageNumberPagination):
     page_size = 3
     page_size_query_param = 'page_size'
     max_page_size = 100
+    offset_cutoff = None
+
+    def paginate_ranking(self, post_ids, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.offset = self.cursor.offset if self.cursor is not None else 0
+
+        page_ids = post_ids[self.offset:self.offset + self.page_size]
+        posts = queryset.in_bulk(page_ids)
+        self.page = [posts[post_id] for post_id in page_ids if post_id in posts]
+
+        self.has_next = self.offset + self.page_size < len(post_ids)
+        self.has_previous = self.offset > 0
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(
+            offset=self.offset + self.page_size,
+            reverse=False,
+            position=None,
+        ))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(Cursor(
+            offset=max(self.offset - self.page_size, 0),
+            reverse=False,
+            position=None,
+        ))
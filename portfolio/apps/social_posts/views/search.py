@@ -1,12 +1,18 @@
-from django.db.models import Q
+from django.conf import settings
 
 from rest_framework.decorators import api_view
 
-from social_posts.models import Post
+from core.utils import StreamedArray, StreamingJSONResponse, iter_serialized
+from social_posts.search import get_search_backend
 from social_posts.serializers import PostSerializer
+from social_posts.utils import (
+    get_liked_post_ids,
+    get_visible_posts,
+    hydrate_feed_posts,
+)
 from social_profiles.models import Profile
 from social_profiles.serializers import ProfileSerializer
-from social_posts.views.pagination import PostPagination
+from social_posts.views.pagination import SearchPagination
 
 
 @api_view(['GET', 'POST'])
@@ -16,34 +22,36 @@ def search(request):
         if request.method == 'POST'
         else request.query_params.get('query')
     )
-    request_user = None
-    user_ids = []
-    if request.user.is_authenticated:
-        request_user = Profile.objects.get(user=request.user)
-
-    profiles = Profile.objects.filter(
-        Q(first_name__icontains=query) | Q(last_name__icontains=query),
+    backend = get_search_backend()
+    profiles = backend.search_profiles(
+        Profile.objects.all(),
+        query,
+    ).order_by('-search_rank', 'id')
+    posts = backend.search_posts(
+        get_visible_posts(request.user),
+        query,
     )
+
+    if request.query_params.get('stream'):
+        return stream_search_results(request, profiles, posts)
+
     profile_serializer = ProfileSerializer(
         profiles,
         context={'request': request},
         many=True,
     )
 
-    if request_user is not None:
-        user_ids.append(request_user.id)
-        for user in request_user.friends.all():
-            user_ids.append(user.id)
-
-    posts = Post.objects.filter(
-        Q(body__icontains=query, is_private=False)
-        | Q(created_by_id__in=list(user_ids), body__icontains=query),
+    paginator = SearchPagination()
+    paginated_posts = paginator.paginate_queryset(
+        hydrate_feed_posts(posts),
+        request,
     )
-    paginator = PostPagination()
-    paginated_posts = paginator.paginate_queryset(posts, request)
     posts_serializer = PostSerializer(
         paginated_posts,
-        context={'request': request},
+        context={
+            'request': request,
+            'liked_post_ids': get_liked_post_ids(paginated_posts, request.user),
+        },
         many=True,
     )
 
@@ -51,3 +59,27 @@ def search(request):
         'profiles': profile_serializer.data,
         'posts': posts_serializer.data,
     })
+
+
+def stream_search_results(request, profiles, posts):
+    """Write every match without pagination, holding one chunk in memory at a time."""
+    chunk_size = settings.SOCIAL_STREAM_CHUNK_SIZE
+    posts = hydrate_feed_posts(posts).order_by(*SearchPagination.ordering)
+
+    return StreamingJSONResponse({
+        'profiles': StreamedArray(iter_serialized(
+            profiles,
+            ProfileSerializer,
+            chunk_size,
+            lambda chunk: {'request': request},
+        )),
+        'posts': StreamedArray(iter_serialized(
+            posts,
+            PostSerializer,
+            chunk_size,
+            lambda chunk: {
+                'request': request,
+                'liked_post_ids': get_liked_post_ids(chunk, request.user),
+            },
+        )),
+    })
@@ -2,12 +2,15 @@ from django.http import JsonResponse
 
 from rest_framework.decorators import api_view
 
-from social_posts.models import Trend
-from social_posts.serializers import TrendSerializer
+from core.utils import conditional_view
+from social_posts.utils import get_cached_trends, trends_validators
 
 
 @api_view(['GET'])
+@conditional_view(trends_validators)
 def get_trends(request):
-    serializer = TrendSerializer(Trend.objects.all(), many=True)
+    trends = getattr(request, 'cached_trends', None)
+    if trends is None:
+        _, trends = get_cached_trends()
 
-    return JsonResponse(serializer.data, safe=False)
+    return JsonResponse(trends, safe=False)
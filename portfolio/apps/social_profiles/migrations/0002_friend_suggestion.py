@@ -0,0 +1,67 @@
+# Generated by Django 6.0.6 on 2026-10-17 00:35
+
+import math
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_people_you_may_know(apps, schema_editor):
+    """Keep the existing suggestions, scored like the rebuild would, until it next runs."""
+    Profile = apps.get_model('social_profiles', 'Profile')
+    FriendSuggestion = apps.get_model('social_profiles', 'FriendSuggestion')
+
+    friends = defaultdict(set)
+    for profile_id, friend_id in Profile.friends.through.objects.values_list(
+        'from_profile_id', 'to_profile_id',
+    ).iterator(chunk_size=10000):
+        friends[profile_id].add(friend_id)
+
+    rows = []
+    old_rows = Profile.people_you_may_know.through.objects.values_list(
+        'from_profile_id', 'to_profile_id',
+    )
+    for profile_id, candidate_id in old_rows.iterator(chunk_size=10000):
+        if candidate_id == profile_id or candidate_id in friends[profile_id]:
+            continue
+        mutual = friends[profile_id] & friends[candidate_id]
+        rows.append(FriendSuggestion(
+            profile_id=profile_id,
+            candidate_id=candidate_id,
+            score=round(sum(1 / math.log(len(friends[m])) for m in mutual), 6),
+            mutual_count=len(mutual),
+        ))
+        if len(rows) >= 1000:
+            FriendSuggestion.objects.bulk_create(rows, ignore_conflicts=True)
+            rows = []
+    FriendSuggestion.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FriendSuggestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(default=0)),
+                ('mutual_count', models.IntegerField(default=0)),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='social_profiles.profile')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='friend_suggestions', to='social_profiles.profile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['profile', '-mutual_count', '-score', '-id'], name='friend_suggestion_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('profile', 'candidate'), name='friend_suggestion_unique_candidate')],
+            },
+        ),
+        migrations.RunPython(copy_people_you_may_know, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='profile',
+            name='people_you_may_know',
+        ),
+    ]
@@ -0,0 +1,73 @@
+"""Full-text search index for profiles.
+
+PostgreSQL gets a generated `search_vector` column with a GIN index; SQLite
+gets an FTS5 table that the SQLite search backend keeps in sync. Databases
+that built this index from social_posts.0006_search_index keep it.
+"""
+
+from django.db import migrations
+
+POSTGRES_FORWARD = (
+    """
+    ALTER TABLE social_profiles_profile ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, ''))
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS social_profiles_profile_search_idx
+    ON social_profiles_profile USING GIN (search_vector)
+    """,
+)
+
+POSTGRES_BACKWARD = (
+    'ALTER TABLE social_profiles_profile DROP COLUMN IF EXISTS search_vector',
+)
+
+SQLITE_FORWARD = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS social_profiles_profile_fts '
+    'USING fts5(profile_id UNINDEXED, document)',
+    'DELETE FROM social_profiles_profile_fts',
+    """
+    INSERT INTO social_profiles_profile_fts (profile_id, document)
+    SELECT id, coalesce(first_name, '') || ' ' || coalesce(last_name, '')
+    FROM social_profiles_profile
+    """,
+)
+
+SQLITE_BACKWARD = (
+    'DROP TABLE IF EXISTS social_profiles_profile_fts',
+)
+
+
+def _run(schema_editor, statements):
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_profiles', '0002_friend_suggestion'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
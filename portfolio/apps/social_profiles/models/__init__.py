@@ -1,4 +1,5 @@
 from social_profiles.models.friendship import FriendshipRequest
 from social_profiles.models.profile import Profile
+from social_profiles.models.suggestion import FriendSuggestion
 
-__all__ = ['Profile', 'FriendshipRequest']
+__all__ = ['Profile', 'FriendshipRequest', 'FriendSuggestion']
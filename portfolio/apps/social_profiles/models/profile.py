@@ -2,10 +2,13 @@ from django.db import models
 from django.template.defaultfilters import slugify
 
 from accounts.models import Account
-from social_profiles.utils import get_random_code
+from accounts.utils import save_with_unique_value
+from social_profiles.models.tracking import LoadedStateMixin
 
+ACCOUNT_FIELDS = ('first_name', 'last_name', 'email', 'username')
 
-class Profile(models.Model):
+
+class Profile(LoadedStateMixin, models.Model):
     first_name = models.CharField(max_length=200, blank=True)
     last_name = models.CharField(max_length=200, blank=True)
     username = models.CharField(max_length=50, unique=True)
@@ -16,7 +19,6 @@ class Profile(models.Model):
     avatar = models.ImageField(upload_to='social/avatars/')
     friends = models.ManyToManyField('self', default=None)
     friends_count = models.IntegerField(default=0)
-    people_you_may_know = models.ManyToManyField('self')
     posts_count = models.IntegerField(default=0)
     slug = models.SlugField(unique=True, blank=True)
     updated = models.DateTimeField(auto_now=True)
@@ -29,7 +31,7 @@ class Profile(models.Model):
         return f"{self.user.username}-{self.created.strftime('%d-%m-%Y')}"
 
     def save(self, *args, **kwargs):
-        if self.pk is not None:
+        if self.pk is not None and self.has_changed(*ACCOUNT_FIELDS):
             account_instance = self.user
             account_fields_updated = False
             if self.first_name != account_instance.first_name:
@@ -56,22 +58,22 @@ class Profile(models.Model):
         if self.username == "":
             self.username = self.user.username
 
-        if self.pk is None:
-            self.create_slug()
-        else:
-            old_instance = Profile.objects.get(pk=self.pk)
-            if (self.first_name != old_instance.first_name
-                    or self.last_name != old_instance.last_name):
-                self.create_slug()
-        super().save(*args, **kwargs)
-
-    def create_slug(self):
-        if self.first_name and self.last_name:
-            to_slug = slugify(f"{self.first_name}-{self.last_name}")
-            ex = Profile.objects.filter(slug=to_slug).exists()
-            while ex:
-                to_slug = slugify(f"{to_slug}-{get_random_code()}")
-                ex = Profile.objects.filter(slug=to_slug).exists()
+        if self.pk is not None and not self.has_changed('first_name', 'last_name'):
+            super().save(*args, **kwargs)
+        elif self.first_name and self.last_name:
+            # Names slugify() cannot transliterate (e.g. Cyrillic) leave nothing.
+            base = (
+                slugify(f"{self.first_name}-{self.last_name}")
+                or slugify(self.user.username)
+                or f'user-{self.user_id}'
+            )
+            save_with_unique_value(
+                self,
+                'slug',
+                base,
+                '-',
+                save=lambda: super(Profile, self).save(*args, **kwargs),
+            )
         else:
-            to_slug = str(self.user.username)
-        self.slug = to_slug
+            self.slug = str(self.user.username)
+            super().save(*args, **kwargs)
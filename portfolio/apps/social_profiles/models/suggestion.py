@@ -0,0 +1,32 @@
+from django.db import models
+
+from social_profiles.models.profile import Profile
+
+
+class FriendSuggestion(models.Model):
+    profile = models.ForeignKey(
+        Profile,
+        related_name='friend_suggestions',
+        on_delete=models.CASCADE,
+    )
+    candidate = models.ForeignKey(
+        Profile,
+        related_name='+',
+        on_delete=models.CASCADE,
+    )
+    score = models.FloatField(default=0)
+    mutual_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('profile', 'candidate'),
+                name='friend_suggestion_unique_candidate',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=('profile', '-mutual_count', '-score', '-id'),
+                name='friend_suggestion_rank_idx',
+            ),
+        ]
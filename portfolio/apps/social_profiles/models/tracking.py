@@ -0,0 +1,82 @@
+from django.db import models
+
+
+class LoadedStateMixin(models.Model):
+    """Remember the field values an instance was loaded with.
+
+    from_db() snapshots the raw column values, so save() and signal handlers
+    can tell what changed without re-reading the row. Instances that were not
+    loaded from the database fetch the snapshot once, on first use.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_loaded_values(self):
+        if self.pk is None:
+            return {}
+        if getattr(self, '_loaded_values', None) is None:
+            attnames = [field.attname for field in self._meta.concrete_fields]
+            row = type(self)._base_manager.filter(pk=self.pk).values(*attnames).first()
+            self._loaded_values = row or {}
+        return self._loaded_values
+
+    def get_loaded_value(self, name):
+        return self.get_loaded_values().get(self._meta.get_field(name).attname)
+
+    def has_changed(self, *names):
+        """True when any of the named fields differs from its loaded value."""
+        if self.pk is None:
+            return True
+
+        loaded = self.get_loaded_values()
+        for name in names:
+            field = self._meta.get_field(name)
+            if field.attname not in loaded:
+                if field.attname in self.__dict__:
+                    return True
+                continue
+            current = _comparable(field, self.__dict__.get(field.attname))
+            if current != _comparable(field, loaded[field.attname]):
+                return True
+        return False
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        snapshot = dict(self.get_loaded_values()) if update_fields else {}
+        snapshot.update(self._current_values(update_fields))
+        self._loaded_values = snapshot
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None and fields:
+            # A partial snapshot would report the other fields as changed.
+            return
+        snapshot = dict(loaded) if fields and loaded else {}
+        snapshot.update(self._current_values(fields))
+        self._loaded_values = snapshot
+
+    def _current_values(self, names=None):
+        values = {}
+        for field in self._meta.concrete_fields:
+            if names and field.name not in names and field.attname not in names:
+                continue
+            if field.attname in self.__dict__:
+                values[field.attname] = _comparable(field, self.__dict__[field.attname])
+        return values
+
+
+def _comparable(field, value):
+    if isinstance(field, models.FileField):
+        return getattr(value, 'name', value) or ''
+    return value
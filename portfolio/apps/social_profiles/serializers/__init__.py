@@ -1,4 +1,9 @@
 from social_profiles.serializers.friendship import FriendshipRequestSerializer
 from social_profiles.serializers.profile import ProfileSerializer
+from social_profiles.serializers.suggestion import FriendSuggestionSerializer
 
-__all__ = ['ProfileSerializer', 'FriendshipRequestSerializer']
+__all__ = [
+    'FriendSuggestionSerializer',
+    'FriendshipRequestSerializer',
+    'ProfileSerializer',
+]
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+from social_profiles.models import FriendSuggestion
+from social_profiles.serializers.profile import ProfileSerializer
+
+
+class FriendSuggestionSerializer(serializers.ModelSerializer):
+    candidate = ProfileSerializer(read_only=True)
+
+    class Meta:
+        model = FriendSuggestion
+        fields = (
+            'candidate',
+            'score',
+            'mutual_count',
+        )
@@ -0,0 +1,33 @@
+from social_profiles.services.relationships import (
+    FRIEND,
+    NONE,
+    PENDING_RECEIVED,
+    PENDING_SENT,
+    REJECTED,
+    SELF,
+    friendship_request_flag,
+    get_relationship_state,
+    invalidate_relationship_state,
+)
+from social_profiles.services.suggestions import (
+    load_friend_graph,
+    rank_friend_suggestions,
+    rebuild_friend_suggestions,
+    refresh_friend_suggestions,
+)
+
+__all__ = [
+    'FRIEND',
+    'NONE',
+    'PENDING_RECEIVED',
+    'PENDING_SENT',
+    'REJECTED',
+    'SELF',
+    'friendship_request_flag',
+    'get_relationship_state',
+    'invalidate_relationship_state',
+    'load_friend_graph',
+    'rank_friend_suggestions',
+    'rebuild_friend_suggestions',
+    'refresh_friend_suggestions',
+]
@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Subquery
+
+from social_profiles.models import FriendshipRequest, Profile
+
+SELF = 'self'
+FRIEND = 'friend'
+PENDING_SENT = 'pending_sent'
+PENDING_RECEIVED = 'pending_received'
+REJECTED = 'rejected'
+NONE = 'none'
+
+RELATIONSHIP_CACHE_KEY = 'social_profiles:relationship:{viewer_id}:{target_id}'
+
+
+def _latest_request_status(created_by_id, created_for_id):
+    return Subquery(
+        FriendshipRequest.objects.filter(
+            created_by_id=created_by_id,
+            created_for_id=created_for_id,
+        ).order_by('-created_at').values('status')[:1],
+    )
+
+
+def _load_relationship_state(viewer_id, target_id):
+    row = Profile.objects.filter(pk=target_id).annotate(
+        is_friend=Exists(
+            Profile.friends.through.objects.filter(
+                from_profile_id=viewer_id,
+                to_profile_id=OuterRef('pk'),
+            ),
+        ),
+        sent_status=_latest_request_status(viewer_id, target_id),
+        received_status=_latest_request_status(target_id, viewer_id),
+    ).values_list('is_friend', 'sent_status', 'received_status').first()
+
+    if row is None:
+        return NONE
+
+    is_friend, sent_status, received_status = row
+    statuses = {sent_status, received_status}
+    if is_friend or FriendshipRequest.ACCEPTED in statuses:
+        return FRIEND
+    if FriendshipRequest.REJECTED in statuses:
+        return REJECTED
+    if sent_status == FriendshipRequest.SENT:
+        return PENDING_SENT
+    if received_status == FriendshipRequest.SENT:
+        return PENDING_RECEIVED
+    return NONE
+
+
+def get_relationship_state(viewer, target):
+    """Return how viewer relates to target, resolved in one query and cached per pair."""
+    if viewer.pk == target.pk:
+        return SELF
+
+    key = RELATIONSHIP_CACHE_KEY.format(viewer_id=viewer.pk, target_id=target.pk)
+    state = cache.get(key)
+    if state is None:
+        state = _load_relationship_state(viewer.pk, target.pk)
+        cache.set(key, state, settings.SOCIAL_RELATIONSHIP_CACHE_TTL)
+    return state
+
+
+def invalidate_relationship_state(first, second):
+    """Drop the cached state of the pair, in both directions."""
+    cache.delete_many([
+        RELATIONSHIP_CACHE_KEY.format(viewer_id=first.pk, target_id=second.pk),
+        RELATIONSHIP_CACHE_KEY.format(viewer_id=second.pk, target_id=first.pk),
+    ])
+
+
+def friendship_request_flag(state):
+    """Map a relationship state to the profile page's can_send_friendship_request flag."""
+    if state in (NONE, SELF):
+        return True
+    if state == REJECTED:
+        return REJECTED
+    return False
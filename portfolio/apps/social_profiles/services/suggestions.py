@@ -0,0 +1,114 @@
+import math
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from social_profiles.models import FriendSuggestion, Profile
+
+
+def _read_friends(rows):
+    graph = defaultdict(list)
+    for profile_id, friend_id in rows.iterator(chunk_size=10000):
+        graph[profile_id].append(friend_id)
+    return graph
+
+
+def _friend_rows(profile_ids=None):
+    rows = Profile.friends.through.objects.values_list(
+        'from_profile_id',
+        'to_profile_id',
+    ).order_by('from_profile_id', 'to_profile_id')
+    if profile_ids is not None:
+        rows = rows.filter(from_profile_id__in=profile_ids)
+    return rows
+
+
+def load_friend_graph(profile_ids=None):
+    """Read the friends through-table into {profile_id: sorted friend ids}.
+
+    Without profile_ids the whole table is scanned once; otherwise only the
+    two hops around profile_ids that rank_friend_suggestions() looks at.
+    """
+    if profile_ids is None:
+        return _read_friends(_friend_rows())
+
+    graph = _read_friends(_friend_rows(profile_ids))
+    second_hop = set().union(*graph.values()).difference(profile_ids)
+    if second_hop:
+        graph.update(_read_friends(_friend_rows(second_hop)))
+    return graph
+
+
+def _is_friend(friend_ids, profile_id):
+    index = bisect_left(friend_ids, profile_id)
+    return index < len(friend_ids) and friend_ids[index] == profile_id
+
+
+def rank_friend_suggestions(graph, profile_id, limit):
+    """Friends of friends of profile_id as (candidate_id, score, mutual_count), best first.
+
+    Candidates rank by mutual-friend count. score, the Adamic-Adar index (each
+    mutual friend adds 1 / log(its friend count)), breaks ties in favour of
+    friends shared with few people over hubs.
+    """
+    friend_ids = graph.get(profile_id, ())
+    mutual = Counter()
+    scores = Counter()
+    for friend_id in friend_ids:
+        friends_of_friend = graph.get(friend_id, ())
+        weight = 1 / math.log(len(friends_of_friend)) if len(friends_of_friend) > 1 else 0
+        mutual.update(friends_of_friend)
+        for candidate_id in friends_of_friend:
+            scores[candidate_id] += weight
+
+    candidates = [
+        (candidate_id, round(scores[candidate_id], 6), count)
+        for candidate_id, count in mutual.items()
+        if candidate_id != profile_id and not _is_friend(friend_ids, candidate_id)
+    ]
+    candidates.sort(key=lambda candidate: (-candidate[2], -candidate[1], candidate[0]))
+    return candidates[:limit]
+
+
+def rebuild_friend_suggestions(profile_ids, graph=None):
+    """Replace the FriendSuggestion rows of profile_ids with their top candidates.
+
+    Every profile keeps its own top SOCIAL_FRIEND_SUGGESTIONS_LIMIT; returns
+    the number of suggestions written.
+    """
+    if graph is None:
+        graph = load_friend_graph()
+
+    limit = settings.SOCIAL_FRIEND_SUGGESTIONS_LIMIT
+    rows = [
+        FriendSuggestion(
+            profile_id=profile_id,
+            candidate_id=candidate_id,
+            score=score,
+            mutual_count=mutual_count,
+        )
+        for profile_id in profile_ids
+        for candidate_id, score, mutual_count in rank_friend_suggestions(
+            graph, profile_id, limit,
+        )
+    ]
+
+    with transaction.atomic():
+        FriendSuggestion.objects.filter(profile_id__in=profile_ids).delete()
+        FriendSuggestion.objects.bulk_create(rows)
+    return len(rows)
+
+
+def refresh_friend_suggestions(profile_ids):
+    """Rebuild suggestions of profile_ids and their direct friends only.
+
+    Used when a friendship changes: nobody else gains or loses a mutual friend.
+    """
+    endpoints = _read_friends(_friend_rows(profile_ids))
+    affected = set(profile_ids).union(*endpoints.values())
+    return rebuild_friend_suggestions(
+        sorted(affected),
+        load_friend_graph(affected),
+    )
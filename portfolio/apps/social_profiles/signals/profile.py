@@ -3,16 +3,14 @@ from django.dispatch import receiver
 
 from social_profiles.models import Profile
 
+DEFAULT_AVATAR = 'social/avatars/avatar.png'
+
 
 @receiver(pre_save, sender=Profile)
 def delete_old_avatar(sender, instance, **kwargs):
-    if instance.pk:
-        try:
-            old_avatar = Profile.objects.get(pk=instance.pk).avatar
-        except Profile.DoesNotExist:
-            return
+    if instance.pk is None or not instance.has_changed('avatar'):
+        return
 
-        new_avatar = instance.avatar
-        if (old_avatar and old_avatar != new_avatar
-                and old_avatar.name != 'social/avatars/avatar.png'):
-            old_avatar.delete(save=False)
+    old_avatar = instance.get_loaded_value('avatar')
+    if old_avatar and old_avatar != DEFAULT_AVATAR:
+        instance.avatar.storage.delete(old_avatar)
@@ -1,9 +1,13 @@
 from social_profiles.tasks.profile import (
+    build_friend_suggestions_chunk,
     create_social_friend_suggestions,
     delete_old_rejected_friendship_requests,
+    update_friend_suggestions,
 )
 
 __all__ = [
+    'build_friend_suggestions_chunk',
     'create_social_friend_suggestions',
     'delete_old_rejected_friendship_requests',
+    'update_friend_suggestions',
 ]
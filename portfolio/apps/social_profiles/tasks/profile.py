@@ -1,24 +1,38 @@
 from datetime import timedelta
 
-from celery import shared_task
+from celery import group, shared_task
+from django.conf import settings
 from django.utils import timezone
 
 from social_profiles.models import FriendshipRequest, Profile
+from social_profiles.services import (
+    load_friend_graph,
+    rebuild_friend_suggestions,
+    refresh_friend_suggestions,
+)
 
 
 @shared_task(name='social_profiles.tasks.create_social_friend_suggestions')
 def create_social_friend_suggestions():
-    users = Profile.objects.all()
+    chunk_size = settings.SOCIAL_FRIEND_SUGGESTIONS_CHUNK_SIZE
+    profile_ids = list(
+        Profile.objects.order_by('pk').values_list('pk', flat=True),
+    )
+
+    group(
+        build_friend_suggestions_chunk.s(profile_ids[start:start + chunk_size])
+        for start in range(0, len(profile_ids), chunk_size)
+    ).apply_async()
+
 
-    for user in users:
-        user.people_you_may_know.clear()
+@shared_task(name='social_profiles.tasks.build_friend_suggestions_chunk')
+def build_friend_suggestions_chunk(profile_ids):
+    return rebuild_friend_suggestions(profile_ids, load_friend_graph(profile_ids))
 
-        for friend in user.friends.all():
-            print('Is friend with:', friend)
 
-            for friends_friend in friend.friends.all():
-                if friends_friend not in user.friends.all() and friends_friend != user:
-                    user.people_you_may_know.add(friends_friend)
+@shared_task(name='social_profiles.tasks.update_friend_suggestions')
+def update_friend_suggestions(profile_ids):
+    return refresh_friend_suggestions(profile_ids)
 
 
 @shared_task(name='social_profiles.tasks.delete_old_rejected_friendship_requests')
@@ -0,0 +1,48 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class FriendSuggestionMigrationTest(TransactionTestCase):
+    before = [("social_profiles", "0001_initial")]
+    after = [("social_profiles", "0002_friend_suggestion")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.before)
+        apps = executor.loader.project_state(self.before).apps
+        User = apps.get_model("accounts", "Account")
+        Profile = apps.get_model("social_profiles", "Profile")
+
+        def profile(name):
+            user = User.objects.create(username=name, email=f"{name}@example.com")
+            return Profile.objects.create(user=user, username=name, slug=name)
+
+        self.ann, self.bob, self.cat, self.dan = map(profile, ("ann", "bob", "cat", "dan"))
+        Friends = Profile.friends.through
+        Friends.objects.bulk_create(
+            Friends(from_profile_id=a.pk, to_profile_id=b.pk)
+            for a, b in ((self.ann, self.bob), (self.bob, self.ann),
+                         (self.bob, self.cat), (self.cat, self.bob))
+        )
+        self.ann.people_you_may_know.add(self.cat, self.bob, self.dan)
+
+    def tearDown(self):
+        MigrationExecutor(connection).migrate(
+            MigrationExecutor(connection).loader.graph.leaf_nodes(),
+        )
+
+    def test_old_suggestions_are_copied_and_scored(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.after)
+        apps = executor.loader.project_state(self.after).apps
+        FriendSuggestion = apps.get_model("social_profiles", "FriendSuggestion")
+
+        rows = FriendSuggestion.objects.values_list(
+            "profile_id", "candidate_id", "mutual_count",
+        ).order_by("candidate_id")
+
+        self.assertEqual(
+            list(rows),
+            [(self.ann.pk, self.cat.pk, 1), (self.ann.pk, self.dan.pk, 0)],
+        )
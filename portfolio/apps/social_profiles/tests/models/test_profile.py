@@ -0,0 +1,115 @@
+import os
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from core.utils import create_active_user
+from social_posts.search import get_search_backend
+from social_profiles.models import Profile
+
+
+@override_settings(MEDIA_ROOT=os.path.join(tempfile.gettempdir(), "test_profile_tracking"))
+class ProfileLoadedStateTest(TestCase):
+    def setUp(self):
+        Profile.objects.create(user=create_active_user(
+            email="jane@example.com",
+            username="jane",
+            password="pass123",
+            first_name="Jane",
+            last_name="Doe"
+        ))
+        self.profile = Profile.objects.get(username="jane")
+
+    def test_counter_save_is_a_single_update(self):
+        self.profile.friends_count += 1
+
+        with self.assertNumQueries(1):
+            self.profile.save()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.friends_count, 1)
+
+    def test_refresh_updates_the_snapshot_of_refreshed_fields(self):
+        Profile.objects.filter(pk=self.profile.pk).update(friends_count=5, bio="changed elsewhere")
+        self.profile.bio = "local edit"
+
+        self.profile.refresh_from_db(fields=["friends_count"])
+
+        self.assertEqual(self.profile.get_loaded_value("friends_count"), 5)
+        self.assertFalse(self.profile.has_changed("friends_count"))
+        self.assertTrue(self.profile.has_changed("bio"))
+
+    def test_name_change_syncs_account_and_slug(self):
+        self.profile.first_name = "Janet"
+        self.profile.save()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.user.first_name, "Janet")
+        self.assertEqual(self.profile.slug, "janet-doe")
+        self.assertFalse(self.profile.has_changed("first_name"))
+
+    def test_name_change_is_reindexed_for_search(self):
+        self.profile.last_name = "Roe"
+        self.profile.save()
+
+        results = Profile.objects.filter(pk__in=[self.profile.pk])
+        self.assertEqual(list(get_search_backend().search_profiles(results, "Roe")), [self.profile])
+
+    def test_replaced_avatar_is_deleted(self):
+        self.profile.avatar = SimpleUploadedFile("old.gif", b"GIF89a", content_type="image/gif")
+        self.profile.save()
+        old_path = self.profile.avatar.path
+
+        self.profile.avatar = SimpleUploadedFile("new.gif", b"GIF89a", content_type="image/gif")
+        self.profile.save()
+
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(self.profile.avatar.path))
+        self.profile.avatar.delete(save=False)
+
+    def test_unloaded_instance_reads_its_snapshot_once(self):
+        profile = Profile(pk=self.profile.pk, user=self.profile.user, username="jane")
+
+        with self.assertNumQueries(1):
+            self.assertTrue(profile.has_changed("first_name"))
+            self.assertFalse(profile.has_changed("username"))
+
+
+class ProfileSlugAllocationTest(TestCase):
+    def _profile(self, username, first_name="Jane", last_name="Doe"):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{username}@example.com",
+            username=username,
+            password="pass123",
+            first_name=first_name,
+            last_name=last_name
+        ))
+
+    def test_duplicate_names_get_numbered_slugs(self):
+        slugs = [self._profile(f"jane{i}").slug for i in range(3)]
+
+        self.assertEqual(slugs, ["jane-doe", "jane-doe-1", "jane-doe-2"])
+
+    def test_renaming_to_own_slug_keeps_it(self):
+        profile = self._profile("jane")
+        profile.first_name = "JANE"
+        profile.save()
+
+        self.assertEqual(profile.slug, "jane-doe")
+
+    def test_profile_without_last_name_uses_username(self):
+        profile = self._profile("solo", last_name="")
+
+        self.assertEqual(profile.slug, "solo")
+
+    def test_untransliterable_name_falls_back_to_username(self):
+        profile = self._profile("ivan", first_name="Иван", last_name="Петров")
+
+        self.assertEqual(profile.slug, "ivan")
+
+    def test_long_names_fit_the_slug_column(self):
+        slugs = [self._profile(f"long{i}", first_name="A" * 40, last_name="B" * 40).slug for i in range(2)]
+
+        self.assertEqual(slugs[0], ("a" * 40 + "-" + "b" * 40)[:50])
+        self.assertEqual(slugs[1], ("a" * 40 + "-" + "b" * 40)[:48] + "-1")
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import FriendshipRequest, Profile
+from social_profiles.services import (
+    FRIEND,
+    NONE,
+    PENDING_RECEIVED,
+    PENDING_SENT,
+    REJECTED,
+    SELF,
+    get_relationship_state,
+)
+
+
+class RelationshipStateTest(TestCase):
+    def _profile(self, name):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        ))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.viewer = self._profile("viewer")
+        self.target = self._profile("target")
+
+    def test_states(self):
+        self.assertEqual(get_relationship_state(self.viewer, self.viewer), SELF)
+        self.assertEqual(get_relationship_state(self.viewer, self.target), NONE)
+
+    def test_pending_request_is_seen_from_both_sides(self):
+        FriendshipRequest.objects.create(created_by=self.viewer, created_for=self.target)
+
+        self.assertEqual(get_relationship_state(self.viewer, self.target), PENDING_SENT)
+        self.assertEqual(get_relationship_state(self.target, self.viewer), PENDING_RECEIVED)
+
+    def test_rejected_and_friend_states(self):
+        FriendshipRequest.objects.create(
+            created_by=self.target,
+            created_for=self.viewer,
+            status=FriendshipRequest.REJECTED,
+        )
+        self.assertEqual(get_relationship_state(self.viewer, self.target), REJECTED)
+
+        other = self._profile("other")
+        self.viewer.friends.add(other)
+        self.assertEqual(get_relationship_state(self.viewer, other), FRIEND)
+
+    def test_state_is_resolved_in_one_query_and_cached(self):
+        with self.assertNumQueries(1):
+            get_relationship_state(self.viewer, self.target)
+        with self.assertNumQueries(0):
+            get_relationship_state(self.viewer, self.target)
+
+    def test_request_views_invalidate_the_pair(self):
+        self.assertEqual(get_relationship_state(self.viewer, self.target), NONE)
+        self.assertEqual(get_relationship_state(self.target, self.viewer), NONE)
+
+        self.client.force_authenticate(self.viewer.user)
+        response = self.client.post(
+            reverse("social_profiles:send_friendship_request", args=[self.target.slug]),
+        )
+        self.assertEqual(response.json(), {"message": "friendship request created"})
+        self.assertEqual(get_relationship_state(self.viewer, self.target), PENDING_SENT)
+
+        response = self.client.post(
+            reverse("social_profiles:send_friendship_request", args=[self.target.slug]),
+        )
+        self.assertEqual(response.json(), {"message": "request already sent"})
+
+        self.client.force_authenticate(self.target.user)
+        self.assertEqual(get_relationship_state(self.target, self.viewer), PENDING_RECEIVED)
+        self.client.post(
+            reverse("social_profiles:handle_request", args=[self.viewer.slug, "accepted"]),
+        )
+        self.assertEqual(get_relationship_state(self.target, self.viewer), FRIEND)
+        self.assertEqual(get_relationship_state(self.viewer, self.target), FRIEND)
+
+        response = self.client.get(reverse("social_profiles:friends", args=[self.viewer.slug]))
+        self.assertEqual(response.json()["relationship"], FRIEND)
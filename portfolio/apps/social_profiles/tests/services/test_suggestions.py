@@ -0,0 +1,94 @@
+import math
+
+from django.test import TestCase, override_settings
+
+from core.utils import create_active_user
+from social_profiles.models import FriendSuggestion, Profile
+from social_profiles.services import (
+    load_friend_graph,
+    rank_friend_suggestions,
+    rebuild_friend_suggestions,
+    refresh_friend_suggestions,
+)
+
+
+class FriendSuggestionsTest(TestCase):
+    def _profile(self, name):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        ))
+
+    def setUp(self):
+        self.ann, self.bob, self.cat, self.dan, self.eve = (
+            self._profile(name) for name in ("ann", "bob", "cat", "dan", "eve")
+        )
+        self.ann.friends.add(self.bob, self.cat)
+        self.dan.friends.add(self.bob, self.cat)
+        self.eve.friends.add(self.bob)
+
+    def _suggested(self, profile):
+        return set(profile.friend_suggestions.values_list("candidate__username", flat=True))
+
+    def test_ranks_candidates_by_mutual_friends(self):
+        graph = load_friend_graph()
+
+        ranking = rank_friend_suggestions(graph, self.ann.pk, limit=10)
+
+        self.assertEqual([(c, mutual) for c, _, mutual in ranking], [(self.dan.pk, 2), (self.eve.pk, 1)])
+        self.assertAlmostEqual(ranking[0][1], 1 / math.log(3) + 1 / math.log(2), places=5)
+        self.assertAlmostEqual(ranking[1][1], 1 / math.log(3), places=5)
+        self.assertEqual(graph[self.ann.pk], sorted([self.bob.pk, self.cat.pk]))
+
+    def test_friends_and_self_are_never_suggested(self):
+        ranking = rank_friend_suggestions(load_friend_graph(), self.bob.pk, limit=10)
+
+        self.assertEqual([(c, mutual) for c, _, mutual in ranking], [(self.cat.pk, 2)])
+
+    @override_settings(SOCIAL_FRIEND_SUGGESTIONS_LIMIT=1)
+    def test_rebuild_keeps_top_candidates_per_profile(self):
+        FriendSuggestion.objects.create(profile=self.ann, candidate=self.bob)
+
+        with self.assertNumQueries(5):
+            written = rebuild_friend_suggestions([self.ann.pk, self.eve.pk])
+
+        self.assertEqual(written, 2)
+        self.assertEqual(self._suggested(self.ann), {"dan"})
+        self.assertEqual(self._suggested(self.eve), {"ann"})
+
+    def test_partial_graph_covers_two_hops(self):
+        graph = load_friend_graph([self.ann.pk])
+
+        self.assertEqual(set(graph), {self.ann.pk, self.bob.pk, self.cat.pk})
+        self.assertEqual(
+            rank_friend_suggestions(graph, self.ann.pk, limit=10),
+            rank_friend_suggestions(load_friend_graph(), self.ann.pk, limit=10),
+        )
+
+    def test_refresh_only_touches_the_new_friends_and_their_friends(self):
+        fay = self._profile("fay")
+        fay.friends.add(self.dan)
+        FriendSuggestion.objects.create(profile=self.ann, candidate=fay)
+        self.eve.friends.add(self.dan)
+
+        refresh_friend_suggestions([self.eve.pk, self.dan.pk])
+
+        self.assertEqual(self._suggested(self.eve), {"ann", "cat", "fay"})
+        self.assertEqual(self._suggested(self.bob), {"cat", "fay"})
+        self.assertEqual(self._suggested(self.cat), {"bob", "eve", "fay"})
+        self.assertEqual(self._suggested(fay), {"bob", "cat", "eve"})
+        self.assertEqual(self._suggested(self.ann), {"fay"})
+
+    def test_hub_mutual_friends_weigh_less(self):
+        gus, ivy, jay = self._profile("gus"), self._profile("ivy"), self._profile("jay")
+        gus.friends.add(self.bob, ivy)
+        ivy.friends.add(jay)
+
+        ranking = rank_friend_suggestions(load_friend_graph(), gus.pk, limit=10)
+
+        self.assertEqual(ranking[0][0], jay.pk)
+        self.assertEqual({c for c, _, _ in ranking[1:]}, {self.ann.pk, self.dan.pk, self.eve.pk})
+        self.assertTrue(all(mutual == 1 for _, _, mutual in ranking))
@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import FriendshipRequest, Profile
+from social_profiles.tasks import (
+    build_friend_suggestions_chunk,
+    create_social_friend_suggestions,
+)
+
+
+class CreateSocialFriendSuggestionsTest(TestCase):
+    def setUp(self):
+        self.profiles = [
+            Profile.objects.create(user=create_active_user(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                password="pass123",
+                first_name=f"User{i}",
+                last_name="Test"
+            ))
+            for i in range(5)
+        ]
+        self.profiles[0].friends.add(self.profiles[1])
+        self.profiles[1].friends.add(self.profiles[2])
+
+    @override_settings(SOCIAL_FRIEND_SUGGESTIONS_CHUNK_SIZE=2)
+    def test_fans_out_profile_chunks(self):
+        with mock.patch("social_profiles.tasks.profile.group") as group:
+            create_social_friend_suggestions()
+
+        chunks = [signature.args[0] for signature in group.call_args.args[0]]
+        ids = [profile.pk for profile in self.profiles]
+        self.assertEqual(chunks, [ids[0:2], ids[2:4], ids[4:5]])
+        group.return_value.apply_async.assert_called_once_with()
+
+    def test_chunk_task_writes_suggestions(self):
+        first, _, third = self.profiles[:3]
+
+        with CaptureQueriesContext(connection) as context:
+            build_friend_suggestions_chunk([first.pk, third.pk])
+
+        graph_reads = [
+            query["sql"] for query in context.captured_queries
+            if 'FROM "social_profiles_profile_friends"' in query["sql"]
+        ]
+        self.assertEqual(len(graph_reads), 2)
+        self.assertTrue(all(" IN (" in sql for sql in graph_reads))
+
+        self.assertEqual([s.candidate for s in first.friend_suggestions.all()], [third])
+
+
+class UpdateFriendSuggestionsTest(TestCase):
+    def setUp(self):
+        self.sender, self.receiver = (
+            Profile.objects.create(user=create_active_user(
+                email=f"{name}@example.com",
+                username=name,
+                password="pass123",
+                first_name=name.title(),
+                last_name="Test"
+            ))
+            for name in ("sender", "receiver")
+        )
+        FriendshipRequest.objects.create(created_by=self.sender, created_for=self.receiver)
+        self.client = APIClient()
+        self.client.force_authenticate(self.receiver.user)
+
+    def _handle(self, status):
+        with mock.patch(
+            "social_profiles.views.friendship.update_friend_suggestions",
+        ) as task, self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("social_profiles:handle_request", args=[self.sender.slug, status]),
+            )
+        return task
+
+    def test_accepted_request_refreshes_both_profiles(self):
+        task = self._handle("accepted")
+
+        task.delay.assert_called_once_with([self.sender.id, self.receiver.id])
+        counts = Profile.objects.order_by("id").values_list("friends_count", flat=True)
+        self.assertEqual(list(counts), [1, 1])
+
+    def test_rejected_request_does_not_refresh(self):
+        task = self._handle("rejected")
+
+        task.delay.assert_not_called()
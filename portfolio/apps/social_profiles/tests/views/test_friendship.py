@@ -0,0 +1,61 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils import create_active_user
+from social_profiles.models import FriendSuggestion, Profile
+
+
+class FriendshipSuggestionsViewTest(TestCase):
+    def _profile(self, name):
+        return Profile.objects.create(user=create_active_user(
+            email=f"{name}@example.com",
+            username=name,
+            password="pass123",
+            first_name=name.title(),
+            last_name="User"
+        ))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("social_profiles:my_friendship_suggestions")
+        self.viewer = self._profile("viewer")
+        self.client.force_authenticate(self.viewer.user)
+
+        for index, (score, mutual_count) in enumerate(((0.5, 2), (2.0, 1), (1.0, 1))):
+            FriendSuggestion.objects.create(
+                profile=self.viewer,
+                candidate=self._profile(f"candidate{index}"),
+                score=score,
+                mutual_count=mutual_count,
+            )
+
+    def test_returns_suggestions_by_mutual_count_then_score(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        suggestions = response.data["results"]["suggestions"]
+        self.assertEqual(
+            [s["candidate"]["username"] for s in suggestions],
+            ["candidate0", "candidate1", "candidate2"],
+        )
+        self.assertEqual(suggestions[0]["mutual_count"], 2)
+
+    def test_suggestions_are_not_symmetric(self):
+        candidate = Profile.objects.get(username="candidate1")
+        self.client.force_authenticate(candidate.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data["results"]["suggestions"], [])
+
+    def test_cursor_pagination(self):
+        first = self.client.get(self.url, {"page_size": 2})
+        second = self.client.get(first.data["next"])
+
+        self.assertEqual(len(first.data["results"]["suggestions"]), 2)
+        self.assertEqual(
+            [s["candidate"]["username"] for s in second.data["results"]["suggestions"]],
+            ["candidate2"],
+        )
+        self.assertIsNone(second.data["next"])
@@ -1,22 +1,34 @@
+from django.db import transaction
+from django.db.models import F
 from django.http import JsonResponse
 
 from rest_framework.decorators import api_view
 
 from social_notification.utils import create_notification
 from social_profiles.models import FriendshipRequest, Profile
+from social_profiles.services import (
+    NONE,
+    SELF,
+    get_relationship_state,
+    invalidate_relationship_state,
+)
 from social_profiles.serializers import (
+    FriendSuggestionSerializer,
     FriendshipRequestSerializer,
     ProfileSerializer,
 )
+from social_profiles.tasks import update_friend_suggestions
+from social_profiles.views.pagination import FriendSuggestionPagination
 
 
 @api_view(['GET'])
 def friends(request, slug):
     user = Profile.objects.get(slug=slug)
     request_user = Profile.objects.get(user=request.user)
+    relationship = get_relationship_state(request_user, user)
     requests = []
 
-    if user == request_user:
+    if relationship == SELF:
         requests = FriendshipRequest.objects.filter(
             created_for=request_user,
             status=FriendshipRequest.SENT,
@@ -42,6 +54,7 @@ def friends(request, slug):
                 many=True,
             ).data,
             'requests': requests,
+            'relationship': relationship,
         },
         safe=False,
     )
@@ -52,18 +65,12 @@ def send_friendship_request(request, slug):
     user = Profile.objects.get(slug=slug)
     request_user = Profile.objects.get(user=request.user)
 
-    check1 = FriendshipRequest.objects.filter(
-        created_for=request_user,
-    ).filter(created_by=user)
-    check2 = FriendshipRequest.objects.filter(created_for=user).filter(
-        created_by=request_user,
-    )
-
-    if not check1 or not check2:
+    if get_relationship_state(request_user, user) == NONE:
         friend_request = FriendshipRequest.objects.create(
             created_for=user,
             created_by=request_user,
         )
+        invalidate_relationship_state(request_user, user)
 
         create_notification(
             request,
@@ -85,13 +92,16 @@ def handle_request(request, slug, status):
     ).get(created_by=user)
     friendship_request.status = status
     friendship_request.save()
+    invalidate_relationship_state(request_user, user)
 
     if status == 'accepted':
         user.friends.add(request_user)
-        user.friends_count = user.friends_count + 1
-        user.save()
-        request_user.friends_count = request_user.friends_count + 1
-        request_user.save()
+        Profile.objects.filter(pk__in=[user.pk, request_user.pk]).update(
+            friends_count=F('friends_count') + 1,
+        )
+        transaction.on_commit(
+            lambda: update_friend_suggestions.delay([user.id, request_user.id]),
+        )
 
         create_notification(
             request,
@@ -110,12 +120,19 @@ def handle_request(request, slug, status):
 
 @api_view(['GET'])
 def my_friendship_suggestions(request):
-    pass
     request_user = Profile.objects.get(user=request.user)
-    serializer = ProfileSerializer(
-        request_user.people_you_may_know.all(),
+
+    paginator = FriendSuggestionPagination()
+    suggestions = paginator.paginate_queryset(
+        request_user.friend_suggestions.select_related('candidate'),
+        request,
+    )
+    serializer = FriendSuggestionSerializer(
+        suggestions,
         many=True,
         context={'request': request},
     )
 
-    return JsonResponse(serializer.data, safe=False)
+    return paginator.get_paginated_response({
+        'suggestions': serializer.data,
+    })
@@ -0,0 +1,7 @@
+from core.utils import KeysetPagination
+
+
+class FriendSuggestionPagination(KeysetPagination):
+    ordering = ('-mutual_count', '-score', '-id')
+    page_size = 10
+    max_page_size = 50
@@ -13,12 +13,22 @@ app.autodiscover_tasks()
 app.conf.beat_schedule = {
     'create_social_posts_trends': {
         'task': 'social_posts.tasks.create_social_posts_trends',
-        'schedule': crontab(hour=4, minute=0),
+        'schedule': crontab(minute='*/5'),
+        'options': {'timezone': 'Europe/Kiev'},
+    },
+    'flush_post_counters': {
+        'task': 'social_posts.tasks.flush_post_counters',
+        'schedule': crontab(),
+        'options': {'timezone': 'Europe/Kiev'},
+    },
+    'purge_deleted_posts': {
+        'task': 'social_posts.tasks.purge_deleted_posts',
+        'schedule': crontab(hour=3, minute=30),
         'options': {'timezone': 'Europe/Kiev'},
     },
     'create_social_friend_suggestions': {
         'task': 'social_profiles.tasks.create_social_friend_suggestions',
-        'schedule': crontab(hour=5, minute=0),
+        'schedule': crontab(hour=5, minute=0, day_of_week='sunday'),
         'options': {'timezone': 'Europe/Kiev'},
     },
     'delete-old-rejected-friendship-requests': {
@@ -4,6 +4,7 @@ from datetime import timedelta
 from pathlib import Path
 
 # from decouple import config
+from corsheaders.defaults import default_headers
 from django.contrib.messages import constants as messages
 
 from .version import __version__
@@ -87,6 +88,9 @@ CORS_ALLOW_METHODS = [
     "PUT",
 ]
 
+CORS_ALLOW_HEADERS = (*default_headers, "if-none-match")
+CORS_EXPOSE_HEADERS = ["ETag"]
+
 CSRF_TRUSTED_ORIGINS = list(
     filter(
         None,
@@ -151,6 +155,15 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Shared by every cache user (rankings, trends, author versions, relationship
+# states); it must be one Redis for all app processes. See README "Deployment".
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("CACHE_URL", "redis://redis:6379/1"),
+    },
+}
+
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER", "redis://redis:6379/0")
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_BACKEND", "redis://redis:6379/0")
 
@@ -423,6 +436,25 @@ CKEDITOR_5_CONFIGS = {
 
 TABERNA_TAX_RATE = 0.02
 
+# Social Network Settings
+SOCIAL_FEED_FANOUT_LIMIT = 1000
+SOCIAL_COUNTER_BUFFER_URL = os.environ.get("SOCIAL_COUNTER_BUFFER_URL")
+SOCIAL_COUNTER_HOT_THRESHOLD = 20
+SOCIAL_IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+SOCIAL_IMAGE_DEFAULT_WIDTH = 640
+# Internal nginx location that serves original attachments; unset, Django streams them.
+SOCIAL_ATTACHMENT_ACCEL_PREFIX = os.environ.get("SOCIAL_ATTACHMENT_ACCEL_PREFIX")
+SOCIAL_RANKING_WINDOW_HOURS = 72
+# Ranked feeds keep the ids of at most this many best-scored posts per viewer.
+SOCIAL_RANKING_MAX_CANDIDATES = 5000
+SOCIAL_RANKING_CACHE_TTL = 60
+SOCIAL_TRENDS_CACHE_TTL = 300
+SOCIAL_RELATIONSHIP_CACHE_TTL = 300
+SOCIAL_POSTS_BULK_LIMIT = 100
+SOCIAL_STREAM_CHUNK_SIZE = 200
+SOCIAL_FRIEND_SUGGESTIONS_LIMIT = 20
+SOCIAL_FRIEND_SUGGESTIONS_CHUNK_SIZE = 1000
+
 # PayPal Settings
 PAYPAL_RECEIVER_EMAIL = os.environ.get("PAYPAL_RECEIVER_EMAIL")
 PAYPAL_TEST = os.environ.get("PAYPAL_TEST")